@@ -784,14 +784,20 @@ const MusicSystem = {
 if (typeof window !== 'undefined') {
     // DELAY audio preload - don't compete with game system initialization
     // Start preloading 3 seconds after DOM ready (loading screen should be done)
-    window.addEventListener('DOMContentLoaded', () => {
+    // (ModuleLoader may run us after DOMContentLoaded already fired)
+    const startMusic = () => {
         MusicSystem.init();
 
         // Defer heavy audio preloading to avoid traffic jam with other systems
         setTimeout(() => {
             MusicSystem.preloadAllTracks();
         }, 3000);
-    });
+    };
+    if (document.readyState === 'loading') {
+        window.addEventListener('DOMContentLoaded', startMusic);
+    } else {
+        startMusic();
+    }
 
     // Cleanup on page unload
     window.addEventListener('beforeunload', () => {
@@ -286,6 +286,7 @@ const EventSystem = {
     // Refresh market items for all locations
     refreshMarketItems() {
         if (typeof GameWorld === 'undefined' || !GameWorld.locations) return;
+        let itemsAdded = false;
 
         Object.keys(GameWorld.locations).forEach(locationId => {
             const location = GameWorld.locations[locationId];
@@ -300,6 +301,7 @@ const EventSystem = {
                         price: GameWorld.getBasePrice(specialty),
                         stock: Math.floor(Math.random() * 10) + 5
                     };
+                    itemsAdded = true;
                 }
             });
 
@@ -313,6 +315,11 @@ const EventSystem = {
             });
         });
 
+        // new specialties need price slots in the market engine
+        if (itemsAdded && typeof DynamicMarketSystem !== 'undefined' && DynamicMarketSystem.invalidateMarketIndex) {
+            DynamicMarketSystem.invalidateMarketIndex();
+        }
+
         if (typeof addMessage === 'function') {
             addMessage('🛒 Markets have been refreshed with new goods!');
         }
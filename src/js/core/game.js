@@ -3665,6 +3665,13 @@ function showGameUI() {
 }
 
 function startNewGame() {
+    // 📦 doom + exploration stream in behind the main menu - a fast click waits for them
+    if (typeof ModuleLoader !== 'undefined' && !ModuleLoader.isLoaded('gameplay')) {
+        console.log('📦 startNewGame: waiting for gameplay modules...');
+        ModuleLoader.load('gameplay').then(() => startNewGame());
+        return;
+    }
+
     console.log('=== Starting new game ===');
     console.log('🖤 startNewGame called - lets see if this void swallows us whole...');
 
@@ -8505,6 +8512,8 @@ function toggleMenu() {
             menuOverlay.style.display = 'none';
             if (typeof SettingsPanel !== 'undefined' && SettingsPanel.show) {
                 SettingsPanel.show();
+            } else if (typeof ModuleLoader !== 'undefined') {
+                ModuleLoader.use('settings', () => SettingsPanel.show());
             }
         });
 
@@ -8741,6 +8750,9 @@ function showSettings() {
             SettingsPanel.init();
         }
         SettingsPanel.show();
+    } else if (typeof ModuleLoader !== 'undefined') {
+        // settings loads on first use
+        ModuleLoader.use('settings', () => showSettings());
     } else {
         gameDeboogerWarn('🖤 SettingsPanel not loaded');
     }
@@ -0,0 +1,270 @@
+// ═══════════════════════════════════════════════════════════════
+// SIMULATION SCHEDULER - not everything needs to run every minute
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+// systems register a cadence (minute/hour/day/week/demand) and a budget.
+// TimeMachine hands over however many game minutes passed this frame and
+// each due task runs ONCE with the batched elapsed minutes - no replaying
+// every minute one by one. deferrable tasks that blow the frame budget
+// wait for idle time (or the next frame) and keep accumulating minutes.
+
+const SimulationScheduler = {
+    // minutes per cadence bucket - 'demand' only runs when request()ed
+    CADENCES: {
+        minute: 1,
+        hour: 60,
+        day: 1440,
+        week: 10080,
+        demand: 0
+    },
+
+    // total ms a frame may spend on deferrable work before the rest waits
+    frameBudgetMs: 4,
+
+    // how long a deferred task may wait in real time before it ignores the budget
+    maxDeferMs: 1000,
+
+    _tasks: new Map(),
+    _order: [],
+    _pending: new Set(),
+    _idleHandle: null,
+    _lastMinute: null,
+    frameStats: { frames: 0, totalMs: 0, lastMs: 0, maxMs: 0, deferrals: 0, idleRuns: 0 },
+
+    /**
+     * Register a simulation task
+     * @param {string} id - Unique name, shown in the timing table
+     * @param {Object} options
+     * @param {string} options.cadence - minute | hour | day | week | demand
+     * @param {Function} options.run - Called as run(ctx) with { minutes, periods, now, deferred }
+     * @param {number} [options.budgetMs=1] - Per-run budget, runs over it are counted
+     * @param {boolean} [options.deferrable=false] - May slip to idle time when the frame is full
+     * @param {number} [options.priority=50] - Lower runs first within a frame
+     */
+    register(id, { cadence = 'minute', run, budgetMs = 1, deferrable = false, priority = 50 } = {}) {
+        if (typeof run !== 'function') {
+            console.warn(`⏱️ SimulationScheduler: task ${id} has no run function`);
+            return false;
+        }
+        if (!(cadence in this.CADENCES)) {
+            console.warn(`⏱️ SimulationScheduler: unknown cadence '${cadence}' for ${id}, using minute`);
+            cadence = 'minute';
+        }
+
+        this._tasks.set(id, {
+            id,
+            cadence,
+            run,
+            budgetMs,
+            deferrable,
+            priority,
+            lastIndex: null,     // cadence bucket we last ran in
+            lastMinute: null,    // game minute we last ran at
+            requested: false,
+            deferredSince: 0,
+            stats: { calls: 0, totalMs: 0, lastMs: 0, maxMs: 0, overBudget: 0, deferred: 0, minutes: 0 }
+        });
+        this._order = [...this._tasks.values()].sort((a, b) => a.priority - b.priority);
+        return true;
+    },
+
+    unregister(id) {
+        this._pending.delete(id);
+        const removed = this._tasks.delete(id);
+        this._order = [...this._tasks.values()].sort((a, b) => a.priority - b.priority);
+        return removed;
+    },
+
+    /** 🔔 Flag an on-demand (or any) task to run on the next advance */
+    request(id) {
+        const task = this._tasks.get(id);
+        if (task) task.requested = true;
+    },
+
+    // forget where every task was - the next advance treats time as fresh
+    // (used after loading a save so a 3-year jump isn't "catch-up")
+    reset() {
+        for (const task of this._tasks.values()) {
+            task.lastIndex = null;
+            task.lastMinute = null;
+            task.requested = false;
+        }
+        this._pending.clear();
+        this._lastMinute = null;
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // the frame - decide who's due, run them inside the budget
+    // ═══════════════════════════════════════════════════════════════
+
+    _bucketOf(task, now) {
+        const size = this.CADENCES[task.cadence];
+        return size > 0 ? Math.floor(now / size) : 0;
+    },
+
+    _isDue(task, now) {
+        if (task.requested) return true;
+        if (task.cadence === 'demand') return false;
+        const bucket = this._bucketOf(task, now);
+        if (task.lastIndex === null) {
+            // first sighting - minute tasks run straight away, slower cadences
+            // wait for their next boundary so a fresh load doesn't pay wages twice
+            task.lastIndex = bucket;
+            task.lastMinute = now;
+            return task.cadence === 'minute';
+        }
+        return bucket !== task.lastIndex;
+    },
+
+    /**
+     * Advance the simulation to the given game minute
+     * @param {number} now - TimeMachine.getTotalMinutes()
+     * @returns {number} ms spent this frame
+     */
+    advance(now) {
+        const frameStart = performance.now();
+        this._lastMinute = now;
+
+        for (const task of this._order) {
+            // deferred tasks are due by definition - their minutes keep piling up
+            const pending = this._pending.has(task.id);
+            if (!pending && !this._isDue(task, now)) continue;
+
+            const spent = performance.now() - frameStart;
+            const overdue = pending && performance.now() - task.deferredSince >= this.maxDeferMs;
+            if (task.deferrable && spent >= this.frameBudgetMs && !overdue) {
+                if (!pending) this._defer(task);
+                continue;
+            }
+            this._pending.delete(task.id);
+            this._runTask(task, now, pending);
+        }
+
+        const frameMs = performance.now() - frameStart;
+        this.frameStats.frames++;
+        this.frameStats.totalMs += frameMs;
+        this.frameStats.lastMs = frameMs;
+        if (frameMs > this.frameStats.maxMs) this.frameStats.maxMs = frameMs;
+        return frameMs;
+    },
+
+    _runTask(task, now, deferred) {
+        const minutes = task.lastMinute === null ? 0 : Math.max(0, now - task.lastMinute);
+        const bucket = this._bucketOf(task, now);
+        const periods = task.lastIndex === null || task.cadence === 'demand' ? 1 : Math.max(1, bucket - task.lastIndex);
+
+        task.lastIndex = bucket;
+        task.lastMinute = now;
+        task.requested = false;
+
+        const start = performance.now();
+        try {
+            task.run({ minutes, periods, now, deferred });
+        } catch (err) {
+            console.error(`⏱️ SimulationScheduler: ${task.id} threw:`, err);
+        }
+        const ms = performance.now() - start;
+
+        const stats = task.stats;
+        stats.calls++;
+        stats.totalMs += ms;
+        stats.lastMs = ms;
+        stats.minutes += minutes;
+        if (ms > stats.maxMs) stats.maxMs = ms;
+        if (ms > task.budgetMs) stats.overBudget++;
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // idle spill - deferred work runs when the browser has nothing better to do
+    // ═══════════════════════════════════════════════════════════════
+
+    _defer(task) {
+        this._pending.add(task.id);
+        task.deferredSince = performance.now();
+        task.stats.deferred++;
+        this.frameStats.deferrals++;
+        this._scheduleIdle();
+    },
+
+    _scheduleIdle() {
+        if (this._idleHandle !== null) return;
+        const flush = (deadline) => {
+            this._idleHandle = null;
+            this._flushPending(deadline);
+        };
+        if (typeof requestIdleCallback === 'function') {
+            this._idleHandle = requestIdleCallback(flush, { timeout: this.maxDeferMs });
+        } else if (typeof TimerManager !== 'undefined') {
+            this._idleHandle = TimerManager.setTimeout(() => flush(null), 16);
+        } else {
+            this._idleHandle = setTimeout(() => flush(null), 16);
+        }
+    },
+
+    _flushPending(deadline) {
+        const now = this._lastMinute;
+        if (now === null) return;
+
+        for (const task of this._order) {
+            if (!this._pending.has(task.id)) continue;
+            // without a deadline we get one frame budget's worth and try again later
+            if (deadline && deadline.timeRemaining() < 1 && !deadline.didTimeout) break;
+            this._pending.delete(task.id);
+            this._runTask(task, now, true);
+            this.frameStats.idleRuns++;
+            if (!deadline) break;
+        }
+
+        if (this._pending.size > 0) this._scheduleIdle();
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // timing surface - what the debooger performance panel reads
+    // ═══════════════════════════════════════════════════════════════
+
+    getTimings() {
+        return this._order.map(task => {
+            const s = task.stats;
+            return {
+                system: task.id,
+                cadence: task.cadence,
+                calls: s.calls,
+                avgMs: s.calls > 0 ? +(s.totalMs / s.calls).toFixed(3) : 0,
+                maxMs: +s.maxMs.toFixed(3),
+                lastMs: +s.lastMs.toFixed(3),
+                totalMs: +s.totalMs.toFixed(1),
+                budgetMs: task.budgetMs,
+                overBudget: s.overBudget,
+                deferred: s.deferred,
+                pending: this._pending.has(task.id),
+                gameMinutes: s.minutes
+            };
+        });
+    },
+
+    getFrameStats() {
+        const f = this.frameStats;
+        return {
+            frames: f.frames,
+            avgMs: f.frames > 0 ? +(f.totalMs / f.frames).toFixed(3) : 0,
+            lastMs: +f.lastMs.toFixed(3),
+            maxMs: +f.maxMs.toFixed(3),
+            deferrals: f.deferrals,
+            idleRuns: f.idleRuns,
+            pending: this._pending.size
+        };
+    },
+
+    resetTimings() {
+        for (const task of this._tasks.values()) {
+            task.stats = { calls: 0, totalMs: 0, lastMs: 0, maxMs: 0, overBudget: 0, deferred: 0, minutes: 0 };
+        }
+        this.frameStats = { frames: 0, totalMs: 0, lastMs: 0, maxMs: 0, deferrals: 0, idleRuns: 0 };
+    }
+};
+
+window.SimulationScheduler = SimulationScheduler;
@@ -140,6 +140,20 @@ const SystemRegistry = {
         return result;
     },
 
+    /**
+     * Get a system, loading it through ModuleLoader first if it's lazy
+     * (settings, credits, doom, exploration - see module-loader.js)
+     * @param {string} name - System name
+     * @returns {Promise<Object|null>} - The system or null
+     */
+    async load(name) {
+        if (typeof ModuleLoader !== 'undefined' && ModuleLoader.isDeferred(name)) {
+            await ModuleLoader.load(ModuleLoader.moduleFor(name));
+            this.invalidate(name);
+        }
+        return this.get(name);
+    },
+
     // ═══════════════════════════════════════════════════════════════════════
     // CONVENIENCE METHODS - Common system access patterns
     // ═══════════════════════════════════════════════════════════════════════
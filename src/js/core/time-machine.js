@@ -672,57 +672,175 @@ const TimeMachine = {
     // time events - when time advances, stuff happens
     // ═══════════════════════════════════════════════════════════════
 
+    // every time-driven system lives in SimulationScheduler with its own cadence -
+    // this used to call all of them every frame whether anything was due or not
+    _simulationTasksRegistered: false,
+
     onTimeAdvance() {
-        // stat decay - hunger, thirst, stamina drain over time
-        this.processStatDecay();
+        if (typeof SimulationScheduler === 'undefined') {
+            this.runAllTimeSystems();
+            return;
+        }
+        if (!this._simulationTasksRegistered) {
+            this.registerSimulationTasks();
+        }
+        SimulationScheduler.advance(this.getTotalMinutes());
+    },
+
+    // cadence/budget for each system - the ones that move money or the player
+    // never defer, the ones that just refresh numbers can wait for idle time
+    registerSimulationTasks() {
+        const S = SimulationScheduler;
+        this._simulationTasksRegistered = true;
+
+        // travel progress - minute by minute, the player is watching
+        S.register('travel', {
+            cadence: 'minute', priority: 0, budgetMs: 2,
+            run: () => {
+                if (typeof TravelSystem !== 'undefined' && TravelSystem.playerPosition?.isTraveling) {
+                    TravelSystem.updateTravelProgress();
+                }
+            }
+        });
 
         // 💀 Fixed: midnight processing race condition at high speeds 💀
-        // Old code required exact hour=0 AND minute=0 which could be MISSED at fast speeds
-        // (time could jump from 23:55 to 0:05, skipping 0:00 entirely)
-        // New code: just check if we're in a new day - lastProcessedDay prevents double-processing
+        // day cadence fires on the first frame past midnight however far we jumped,
+        // lastProcessedDay still guards against double-processing (and is saved)
+        S.register('economy:daily', {
+            cadence: 'day', priority: 5, budgetMs: 8,
+            run: () => {
+                if (this.lastProcessedDay !== this.currentTime.day) {
+                    this.lastProcessedDay = this.currentTime.day;
+                    this.processDailyEvents();
+                }
+            }
+        });
+
+        // weekly wages - every 7 game days rather than day-of-month 7/14/21/28,
+        // which gave 10-day weeks across a 31-day month
+        S.register('economy:weekly', {
+            cadence: 'week', priority: 6, budgetMs: 8,
+            run: () => {
+                this.lastWageProcessedDay = this.currentTime.day;
+                this.processWeeklyEvents();
+            }
+        });
+
+        // 8am market refresh only needs to see the hour roll over
+        S.register('market:dailyRefresh', {
+            cadence: 'hour', priority: 10, budgetMs: 8,
+            run: () => {
+                if (typeof DynamicMarketSystem !== 'undefined' && DynamicMarketSystem.checkDailyRefresh) {
+                    DynamicMarketSystem.checkDailyRefresh();
+                }
+            }
+        });
+
+        // market prices - incremental engine, but still the heaviest per-minute job
+        S.register('market:prices', {
+            cadence: 'minute', priority: 20, budgetMs: 2, deferrable: true,
+            run: () => {
+                if (typeof DynamicMarketSystem === 'undefined') return;
+                const recomputed = DynamicMarketSystem.updateMarketPrices();
+                if (recomputed > 0) S.request('trading:priceAlerts');
+            }
+        });
+
+        // price alerts only matter when prices moved or we're looking at a new market
+        S.register('trading:priceAlerts', {
+            cadence: 'demand', priority: 25, budgetMs: 1, deferrable: true,
+            run: () => {
+                if (typeof TradingSystem !== 'undefined' && TradingSystem.checkPriceAlerts) {
+                    TradingSystem.checkPriceAlerts();
+                }
+            }
+        });
+
+        // city events expire on minute timestamps - a late sweep just ends them a frame later
+        S.register('world:cityEvents', {
+            cadence: 'minute', priority: 30, budgetMs: 1, deferrable: true,
+            run: () => {
+                if (typeof CityEventSystem !== 'undefined') {
+                    CityEventSystem.updateEvents();
+                }
+            }
+        });
+
+        // dungeon bonanza (July 18th special event) - it's a date, check it daily
+        S.register('world:dungeonBonanza', {
+            cadence: 'day', priority: 35, budgetMs: 1, deferrable: true,
+            run: () => {
+                if (typeof DungeonBonanzaSystem !== 'undefined') {
+                    DungeonBonanzaSystem.update();
+                }
+            }
+        });
+
+        // work queues compute progress from start time, so batching loses nothing
+        S.register('property:workQueues', {
+            cadence: 'minute', priority: 40, budgetMs: 2, deferrable: true,
+            run: () => {
+                if (typeof PropertySystem !== 'undefined' && PropertySystem.processWorkQueues) {
+                    PropertySystem.processWorkQueues();
+                }
+            }
+        });
+
+        // construction finishes and rent falls due on minute timestamps too
+        S.register('property:upkeep', {
+            cadence: 'minute', priority: 45, budgetMs: 1, deferrable: true,
+            run: () => {
+                if (typeof PropertySystem === 'undefined') return;
+                if (PropertySystem.processConstruction) PropertySystem.processConstruction();
+                if (PropertySystem.processRentPayments) PropertySystem.processRentPayments();
+            }
+        });
+
+        // arriving somewhere new means a new price board to check alerts against
+        if (typeof EventBus !== 'undefined') {
+            EventBus.on('location:changed', () => S.request('trading:priceAlerts'));
+        }
+    },
+
+    // the old run-everything-now path - used when the scheduler isn't loaded
+    runAllTimeSystems() {
+        this.processStatDecay();
+
         if (this.lastProcessedDay !== this.currentTime.day) {
             this.lastProcessedDay = this.currentTime.day;
             this.processDailyEvents();
         }
 
-        // weekly wage processing
         if (this.currentTime.day % 7 === 0 && this.lastWageProcessedDay !== this.currentTime.day) {
             this.lastWageProcessedDay = this.currentTime.day;
             this.processWeeklyEvents();
         }
 
-        // update market prices
         if (typeof DynamicMarketSystem !== 'undefined') {
             DynamicMarketSystem.updateMarketPrices();
-            // check for 8am daily market refresh
             if (DynamicMarketSystem.checkDailyRefresh) {
                 DynamicMarketSystem.checkDailyRefresh();
             }
         }
 
-        // city events
         if (typeof CityEventSystem !== 'undefined') {
             CityEventSystem.updateEvents();
         }
 
-        // dungeon bonanza (July 18th special event)
         if (typeof DungeonBonanzaSystem !== 'undefined') {
             DungeonBonanzaSystem.update();
         }
 
-        // property systems
         if (typeof PropertySystem !== 'undefined') {
             if (PropertySystem.processWorkQueues) PropertySystem.processWorkQueues();
             if (PropertySystem.processConstruction) PropertySystem.processConstruction();
             if (PropertySystem.processRentPayments) PropertySystem.processRentPayments();
         }
 
-        // price alerts
         if (typeof TradingSystem !== 'undefined' && TradingSystem.checkPriceAlerts) {
             TradingSystem.checkPriceAlerts();
         }
 
-        // travel progress
         if (typeof TravelSystem !== 'undefined' && TravelSystem.playerPosition?.isTraveling) {
             TravelSystem.updateTravelProgress();
         }
@@ -1275,6 +1393,11 @@ const TimeMachine = {
             this.lastStatDecayMinute = data.lastStatDecayMinute;
         }
 
+        // loaded time is a new timeline, not a catch-up from wherever we were
+        if (typeof SimulationScheduler !== 'undefined') {
+            SimulationScheduler.reset();
+        }
+
         // restore seasonal backdrop after load
         const season = this.getSeason();
         if (typeof GameWorldRenderer !== 'undefined' && GameWorldRenderer.loadSeasonalBackdrop) {
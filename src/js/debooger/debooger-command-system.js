@@ -1185,6 +1185,114 @@ const DeboogerCommandSystem = {
             return 'UnifiedItemSystem not found';
         });
 
+        // ═══════════════════════════════════════════════════════════════
+        // ⏱️ PERFORMANCE BENCHMARKS
+        // ═══════════════════════════════════════════════════════════════
+
+        // benchmarkmarket [ticks] - Compare full vs incremental market ticks
+        this.registerCommand('benchmarkmarket', 'Benchmark market tick cost vs city/item count: benchmarkmarket [ticks]', (args) => {
+            if (typeof DynamicMarketSystem === 'undefined') return 'DynamicMarketSystem not found';
+            const ticks = parseInt(args[0]) || 120;
+            DynamicMarketSystem.benchmarkMarketEngine({ ticks });
+            return 'See console';
+        });
+
+        // benchmarkrouting [queries] - Sorted-array A* vs heap A* vs cached route table
+        this.registerCommand('benchmarkrouting', 'Benchmark route lookups on synthetic worlds up to 2500 locations: benchmarkrouting [queries]', (args) => {
+            if (typeof TravelSystem === 'undefined') return 'TravelSystem not found';
+            const queries = parseInt(args[0]) || 200;
+            TravelSystem.benchmarkRouting({ queries });
+            return 'See console';
+        });
+
+        // benchmarksave [iterations] - Single-blob save vs chunked full/delta save
+        this.registerCommand('benchmarksave', 'Benchmark save/load time and bytes written, blob vs chunked: benchmarksave [iterations]', (args) => {
+            if (typeof SaveManager === 'undefined') return 'SaveManager not found';
+            const iterations = parseInt(args[0]) || 5;
+            SaveManager.benchmarkSaveFormats({ iterations });
+            return 'See console';
+        });
+
+        // benchmarkachievements [seconds] - Full sweep per track call vs indexed per-frame batches
+        this.registerCommand('benchmarkachievements', 'Benchmark achievement condition evaluations/sec, old vs indexed: benchmarkachievements [seconds]', (args) => {
+            if (typeof AchievementSystem === 'undefined') return 'AchievementSystem not found';
+            const seconds = parseInt(args[0]) || 10;
+            AchievementSystem.benchmarkEvaluation({ seconds });
+            const live = AchievementSystem.getEvaluationStats();
+            return `See console - live: ${live.evaluationsPerSecond} evals/sec over ${live.seconds}s`;
+        });
+
+        // benchmarkllm [baseUrl] [npcs] - Greeting TTFT, dedupe and cache hit rate against ollama or the mock server
+        this.registerCommand('benchmarkllm', 'Benchmark NPC greeting pipeline (TTFT, dedupe, cache hits): benchmarkllm [baseUrl] [npcs]', (args) => {
+            if (typeof NPCVoiceChatSystem === 'undefined') return 'NPCVoiceChatSystem not found';
+            const baseUrl = args[0] && args[0].startsWith('http') ? args[0] : null;
+            const npcCount = parseInt(args[baseUrl ? 1 : 0]) || 4;
+            NPCVoiceChatSystem.benchmarkLLMPipeline({ baseUrl, npcCount });
+            return `Running against ${baseUrl || NPCVoiceChatSystem.config.ollamaBaseUrl} - see console. NPCVoiceChatSystem.getLLMMetrics() for live numbers`;
+        });
+
+        // schedulerstats [reset] - Per-system time-tick cost from SimulationScheduler
+        this.registerCommand('schedulerstats', 'Show per-system simulation tick timings: schedulerstats [reset]', (args) => {
+            if (typeof SimulationScheduler === 'undefined') return 'SimulationScheduler not found';
+            if (args[0] === 'reset') {
+                SimulationScheduler.resetTimings();
+                return 'Simulation timings reset';
+            }
+            console.table(SimulationScheduler.getTimings());
+            const frame = SimulationScheduler.getFrameStats();
+            console.log('⏱️ Scheduler frames:', frame);
+            return `See console - ${frame.frames} ticks, avg ${frame.avgMs}ms, ${frame.deferrals} deferrals`;
+        });
+
+        // benchmarkmap [frames] [locations] - DOM markers vs canvas layers frame times
+        this.registerCommand('benchmarkmap', 'Benchmark world map DOM vs canvas rendering: benchmarkmap [frames] [locations]', (args) => {
+            if (typeof GameWorldRenderer === 'undefined') return 'GameWorldRenderer not found';
+            const frames = parseInt(args[0]) || 120;
+            const locations = parseInt(args[1]) || 0;
+            const rows = GameWorldRenderer.benchmarkRenderModes({ frames, locations });
+            if (rows.length < 2) return 'Map not ready - open the world map first';
+            const [dom, canvas] = rows;
+            return `Pan avg: DOM ${dom.panAvgMs}ms vs canvas ${canvas.panAvgMs}ms - see console for the full table`;
+        });
+
+        // maprendermode [dom|canvas|auto] - Pick how the world map draws
+        this.registerCommand('maprendermode', 'Set world map render mode: maprendermode [dom|canvas|auto]', (args) => {
+            if (typeof GameWorldRenderer === 'undefined') return 'GameWorldRenderer not found';
+            if (!args[0]) {
+                return `Render mode: ${GameWorldRenderer.renderMode} (drawing with ${GameWorldRenderer.isCanvasMode() ? 'canvas' : 'DOM'})`;
+            }
+            if (!GameWorldRenderer.setRenderMode(args[0])) return 'Usage: maprendermode [dom|canvas|auto]';
+            return `Map render mode set to ${args[0]}`;
+        });
+
+        // benchmarkprices [cities] [items] [days] - Price history rings vs the old per-entry arrays
+        this.registerCommand('benchmarkprices', 'Benchmark price history writes, stats queries and best-price lookups: benchmarkprices [cities] [items] [days]', (args) => {
+            if (typeof MarketPriceHistory === 'undefined') return 'MarketPriceHistory not found';
+            const cities = parseInt(args[0]) || 50;
+            const items = parseInt(args[1]) || 40;
+            const days = parseInt(args[2]) || 30;
+            const results = MarketPriceHistory.benchmarkPriceHistory({ cities, items, days });
+            const live = MarketPriceHistory.getHistoryStats();
+            return `See console - live history: ${live.series} watched series, ${Math.round(live.ringBytes / 1024)}KB of rings, save ${results[0].quota}`;
+        });
+
+        // startupstats [reset] - Time-to-menu / time-to-playable and per-module load times
+        this.registerCommand('startupstats', 'Show startup timings and lazy module loads: startupstats [reset]', (args) => {
+            if (typeof ModuleLoader === 'undefined') return 'ModuleLoader not found';
+            if (args[0] === 'reset') {
+                ModuleLoader.clearHistory();
+                return 'Startup history cleared';
+            }
+            const report = ModuleLoader.getStartupReport();
+            console.table(report.modules);
+            console.table(ModuleLoader.getHistory());
+            const menu = report.menuMs !== null ? `${report.menuMs}ms` : 'pending';
+            const playable = report.playableMs !== null ? `${report.playableMs}ms` : 'pending';
+            const median = report.medianMenuMs !== null ? ` (median of ${report.runs}: ${Math.round(report.medianMenuMs)}ms / ${Math.round(report.medianPlayableMs)}ms)` : '';
+            const flagged = report.regressions.length > 0 ? ` - REGRESSED: ${report.regressions.join(', ')}` : '';
+            return `Menu ${menu}, playable ${playable}${median}${flagged}`;
+        });
+
         // ═══════════════════════════════════════════════════════════════
         // 🏆 ACHIEVEMENT CHEATS
         // ═══════════════════════════════════════════════════════════════
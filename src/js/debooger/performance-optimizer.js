@@ -525,6 +525,7 @@ const PerformanceOptimizer = {
         const memory = this.metrics.memoryUsage.toFixed(1);
         const particles = this.metrics.particleCount;
         const quality = this.settings.animationQuality;
+        const simTick = typeof SimulationScheduler !== 'undefined' ? SimulationScheduler.getFrameStats().avgMs : null;
         
         // Color code based on performance
         let color = '#00ff00'; // Green
@@ -539,7 +540,8 @@ const PerformanceOptimizer = {
             FPS: ${fps}<br>
             Memory: ${memory}MB<br>
             Particles: ${particles}<br>
-            Quality: ${quality}
+            Quality: ${quality}${simTick !== null ? `<br>
+            Sim tick: ${simTick}ms` : ''}
         `;
         
         // Hide after 3 seconds if performance is good
@@ -702,6 +704,10 @@ const PerformanceOptimizer = {
                         <div>Active Particles: <span id="perf-active-particles">0</span></div>
                         <div>Active Animations: <span id="perf-active-animations">0</span></div>
                     </div>
+                    <div class="performance-info">
+                        <h4>Simulation Systems</h4>
+                        <div id="perf-sim-timings" style="font-family: monospace; font-size: 11px;">No timings yet</div>
+                    </div>
                 </div>
             `;
             
@@ -824,8 +830,41 @@ const PerformanceOptimizer = {
             panel.querySelector('#perf-memory-usage').textContent = this.metrics.memoryUsage.toFixed(1);
             panel.querySelector('#perf-active-particles').textContent = this.metrics.particleCount;
             panel.querySelector('#perf-active-animations').textContent = this.metrics.animationCount;
+            this.renderSimulationTimings(panel.querySelector('#perf-sim-timings'));
         }, 1000);
     },
+
+    // Per-system tick timings from SimulationScheduler - slowest first
+    renderSimulationTimings(container) {
+        if (!container || typeof SimulationScheduler === 'undefined') return;
+
+        const rows = SimulationScheduler.getTimings()
+            .filter(row => row.calls > 0 || row.pending)
+            .sort((a, b) => b.avgMs - a.avgMs);
+        if (rows.length === 0) {
+            container.textContent = 'No timings yet - unpause the game';
+            return;
+        }
+
+        const frame = SimulationScheduler.getFrameStats();
+        const cell = 'padding: 0 6px; text-align: right;';
+        container.innerHTML = `
+            <div>Tick avg ${frame.avgMs}ms · max ${frame.maxMs}ms · deferred ${frame.deferrals} · idle runs ${frame.idleRuns}</div>
+            <table style="border-collapse: collapse; margin-top: 4px;">
+                <tr><th style="text-align: left;">System</th><th style="${cell}">Cadence</th><th style="${cell}">Calls</th><th style="${cell}">Avg ms</th><th style="${cell}">Max ms</th><th style="${cell}">Over</th><th style="${cell}">Deferred</th></tr>
+                ${rows.map(row => `
+                    <tr style="color: ${row.overBudget > 0 ? '#ffff00' : 'inherit'};">
+                        <td>${row.system}${row.pending ? ' ⏳' : ''}</td>
+                        <td style="${cell}">${row.cadence}</td>
+                        <td style="${cell}">${row.calls}</td>
+                        <td style="${cell}">${row.avgMs}</td>
+                        <td style="${cell}">${row.maxMs}</td>
+                        <td style="${cell}">${row.overBudget}</td>
+                        <td style="${cell}">${row.deferred}</td>
+                    </tr>`).join('')}
+            </table>
+        `;
+    },
     
     // Initialize object pools
     initializeObjectPools() {
@@ -47,10 +47,11 @@ const ImmersiveExperienceIntegration = {
         }
         
         // Initialize settings panel - giving control to the mortals
+        // (usually lazy - ModuleLoader brings it in on first use)
         if (typeof SettingsPanel !== 'undefined') {
             SettingsPanel.init();
-            this.setupSettingsIntegration();
         }
+        this.setupSettingsIntegration();
         
         // 🔁 Start animation loops - the eternal cycles commence
         if (typeof VisualEffectsSystem !== 'undefined') {
@@ -389,7 +390,8 @@ const ImmersiveExperienceIntegration = {
         EventManager.addEventListener(document, 'keydown', (e) => {
             if (e.key === 'Escape' && e.ctrlKey) {
                 e.preventDefault();
-                SettingsPanel.openPanel();
+                if (typeof SettingsPanel !== 'undefined') SettingsPanel.openPanel();
+                else if (typeof ModuleLoader !== 'undefined') ModuleLoader.use('settings', () => SettingsPanel.openPanel());
             }
         });
     },
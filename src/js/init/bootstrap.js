@@ -23,6 +23,8 @@ const Bootstrap = {
     _initialized: new Set(),
     // init currently in progress (prevents double-init)
     _initializing: new Set(),
+    // late registrations (lazy-loaded modules) - name -> init promise
+    _lateInits: new Map(),
 
     // ═══════════════════════════════════════════════════════════
     // SEVERITY LEVELS - how bad is it if this module fails?
@@ -91,9 +93,9 @@ const Bootstrap = {
         // if Bootstrap already ran, init this module now
         if (this.initialized) {
             console.log(`🖤 Bootstrap: Late registration for ${name}, initializing now...`);
-            this._initModule(config).catch(err => {
+            this._lateInits.set(name, this._initModule(config).catch(err => {
                 console.error(`🖤 Bootstrap: Late init failed for ${name}:`, err);
-            });
+            }));
         }
     },
 
@@ -128,6 +130,14 @@ const Bootstrap = {
         return true;
     },
 
+    /**
+     * Settle the late inits of modules that registered after init() ran
+     * (unlike waitFor, a failed optional module doesn't hang the caller)
+     */
+    whenInitialized(names) {
+        return Promise.all(names.map(n => this._lateInits.get(n)));
+    },
+
     // ═══════════════════════════════════════════════════════════
     // INITIALIZATION ENGINE
     // ═══════════════════════════════════════════════════════════
@@ -232,8 +242,10 @@ const Bootstrap = {
                     if (this._registry.has(dep)) {
                         visit(dep);
                     } else {
-                        // dependency not registered - might be a window global
-                        if (typeof window[dep] === 'undefined') {
+                        // dependency not registered - might be a window global,
+                        // or one the ModuleLoader brings in after the menu
+                        const deferred = typeof ModuleLoader !== 'undefined' && ModuleLoader.isDeferred(dep);
+                        if (typeof window[dep] === 'undefined' && !deferred) {
                             console.warn(`⚠️ Bootstrap: ${name} depends on ${dep} which isn't registered`);
                         }
                     }
@@ -368,6 +380,17 @@ const Bootstrap = {
         }
     },
 
+    /**
+     * Init once the ModuleLoader's critical scripts have all executed
+     * (and straight away if there's no loader, e.g. a page with plain tags)
+     */
+    async start() {
+        if (typeof ModuleLoader !== 'undefined' && ModuleLoader.ready) {
+            await ModuleLoader.ready;
+        }
+        return this.init();
+    },
+
     // ═══════════════════════════════════════════════════════════
     // LOADING SCREEN UI - Uses existing HTML #loading-screen
     // LoadingManager handles the fancy progress display
@@ -464,13 +487,15 @@ const Bootstrap = {
 // ═══════════════════════════════════════════════════════════════
 // This is THE ONLY DOMContentLoaded handler that should exist.
 // All other systems should use Bootstrap.register() instead.
+// start() waits on ModuleLoader - injected scripts don't hold up
+// DOMContentLoaded, so the DOM being ready says nothing about them.
 
 if (document.readyState === 'loading') {
     document.addEventListener('DOMContentLoaded', () => {
         // small delay to let all register() calls complete
         setTimeout(() => {
             try {
-                Bootstrap.init();
+                Bootstrap.start();
             } catch (e) {
                 console.error('🖤 Bootstrap.init() failed:', e);
                 // Update the HTML loading screen with error
@@ -485,7 +510,7 @@ if (document.readyState === 'loading') {
     // DOM already loaded
     setTimeout(() => {
         try {
-            Bootstrap.init();
+            Bootstrap.start();
         } catch (e) {
             console.error('🖤 Bootstrap.init() failed:', e);
             const loadingTitle = document.getElementById('loading-title');
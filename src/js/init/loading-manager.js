@@ -721,6 +721,11 @@ const LoadingManager = {
             }
 
             console.log('🖤 LoadingManager: Main menu revealed. Let the games begin.');
+
+            // 📦 time-to-menu stops here - doom/exploration start streaming in behind it
+            if (typeof ModuleLoader !== 'undefined') {
+                ModuleLoader.markMenu();
+            }
         }, 500);
     },
 
@@ -0,0 +1,674 @@
+// ═══════════════════════════════════════════════════════════════
+// MODULE LOADER - scripts arrive when they're needed, not all at once
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+// index.html used to carry ~140 blocking <script> tags. now it carries
+// bootstrap.js, this file and loading-manager.js, and the manifest below
+// says what loads when:
+//   critical - everything the main menu and a running game need. fetched
+//              in parallel, executed in manifest order, then Bootstrap.init()
+//   gameplay - doom world + dungeon exploration. streamed in behind the
+//              main menu, awaited by startNewGame / save loading if the
+//              player is quicker than the network
+//   lazy     - settings + credits. loaded the first time someone asks
+// time-to-menu and time-to-playable are measured on every boot and kept
+// in localStorage so a slow build shows up as a warning, not a vibe.
+
+const ModuleLoader = {
+    BASE_PATH: 'src/js/',
+
+    // a stage only counts as slow when it's over budget AND this much
+    // slower than the median of recent boots
+    BUDGETS: {
+        menuMs: 4000,
+        playableMs: 6000
+    },
+    REGRESSION_RATIO: 1.25,
+    REGRESSION_MIN_MS: 250,
+    HISTORY_KEY: 'mtgStartupMetrics',
+    HISTORY_SIZE: 20,
+
+    // ═══════════════════════════════════════════════════════════
+    // MANIFEST - order matters inside the critical stage, same as the old tags
+    // dependencies name other manifest modules, provides names the globals
+    // a module defines so Bootstrap/SystemRegistry know they're coming later
+    // ═══════════════════════════════════════════════════════════
+    MODULES: [
+        {
+            name: 'core',
+            stage: 'critical',
+            files: [
+                'core/event-manager.js',
+                'core/timer-manager.js',
+                'core/dedupe-logger.js',
+                'core/game-logger.js',
+                'core/leaderboard-features.js',
+                'core/gold-manager.js',
+                'core/player-state-manager.js',
+                'core/event-system.js',
+                'systems/economy/transport-system.js',
+                'core/system-registry.js',
+                'core/event-bus.js'
+            ]
+        },
+        {
+            name: 'utils',
+            stage: 'critical',
+            files: [
+                'utils/color-utils.js',
+                'utils/virtual-list.js',
+                'utils/min-heap.js',
+                'utils/lru-cache.js',
+                'utils/string-hash.js',
+                'utils/spatial-grid.js'
+            ]
+        },
+        {
+            name: 'ai-voice',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'utils/ollama-installer.js',
+                'utils/ollama-model-manager.js',
+                'utils/kokoro-installer.js',
+                'utils/kokoro-tts.js'
+            ]
+        },
+        {
+            name: 'time',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'core/simulation-scheduler.js',
+                'core/time-machine.js'
+            ]
+        },
+        {
+            name: 'world-data',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'data/items/item-database.js',
+                'data/items/unified-item-system.js',
+                'data/game-world.js',
+                'data/tutorial-world.js'
+            ]
+        },
+        {
+            name: 'browser-ui',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'init/browser-compatibility.js',
+                'ui/components/modal-system.js'
+            ]
+        },
+        {
+            name: 'crafting-combat',
+            stage: 'critical',
+            dependencies: ['world-data'],
+            files: [
+                'systems/crafting/crafting-economy-system.js',
+                'systems/crafting/crafting-engine.js',
+                'systems/combat/combat-system.js',
+                'npc/npc-combat-stats.js',
+                'ui/components/combat-modal.js'
+            ]
+        },
+        {
+            name: 'market',
+            stage: 'critical',
+            dependencies: ['world-data', 'time'],
+            files: [
+                'systems/trading/market-price-history.js',
+                'systems/trading/dynamic-market-system.js',
+                'systems/world/city-reputation-system.js',
+                'systems/world/city-event-system.js',
+                'systems/world/dungeon-bonanza-system.js',
+                'systems/trading/trading-system.js',
+                'systems/trading/financial-tracker.js',
+                'ui/panels/inventory-panel.js'
+            ]
+        },
+        {
+            name: 'npc',
+            stage: 'critical',
+            dependencies: ['world-data', 'ai-voice'],
+            files: [
+                'npc/npc-manager.js',
+                'npc/npc-merchants.js',
+                'npc/npc-dialogue.js',
+                'npc/npc-workflow.js',
+                'npc/npc-data-embedded.js',
+                'npc/npc-instruction-templates.js',
+                'npc/npc-voice.js',
+                'npc/npc-chat-ui.js',
+                'npc/npc-encounters.js'
+            ]
+        },
+        {
+            name: 'tutorial',
+            stage: 'critical',
+            dependencies: ['npc'],
+            files: [
+                'npc/tutorial-npcs.js',
+                'systems/tutorial/tutorial-manager.js',
+                'ui/tutorial-highlighter.js',
+                'systems/story/initial-encounter.js',
+                'npc/npc-relationships.js',
+                'npc/npc-trade.js',
+                'ui/panels/trade-cart-panel.js'
+            ]
+        },
+        {
+            name: 'quests',
+            stage: 'critical',
+            dependencies: ['npc'],
+            files: [
+                'debooger/api-command-system.js',
+                'systems/progression/main-quests.js',
+                'systems/progression/side-quests.js',
+                'systems/progression/tutorial-quests.js',
+                'systems/progression/quest-system.js'
+            ]
+        },
+        {
+            name: 'property',
+            stage: 'critical',
+            dependencies: ['market'],
+            files: [
+                'systems/trading/merchant-rank-system.js',
+                'ui/panels/equipment-panel.js',
+                'property/property-types.js',
+                'property/property-storage.js',
+                'property/property-purchase.js',
+                'property/property-income.js',
+                'property/property-upgrades.js',
+                'property/property-map-picker.js',
+                'property/property-ui.js',
+                'property/property-system-facade.js',
+                'systems/employee/employee-system.js',
+                'systems/employee/companion-system.js',
+                'systems/employee/property-employee-bridge.js',
+                'systems/employee/property-employee-ui.js'
+            ]
+        },
+        {
+            name: 'travel',
+            stage: 'critical',
+            dependencies: ['world-data', 'time'],
+            files: [
+                'systems/travel/travel-system.js',
+                'systems/trading/trade-route-system.js',
+                'systems/travel/gatehouse-system.js',
+                'systems/crafting/resource-gathering-system.js'
+            ]
+        },
+        {
+            name: 'map',
+            stage: 'critical',
+            dependencies: ['travel', 'utils'],
+            files: [
+                'ui/map/map-renderer-base.js',
+                'ui/map/map-canvas-layer.js',
+                'ui/map/game-world-renderer.js',
+                'systems/travel/travel-panel-map.js'
+            ]
+        },
+        {
+            name: 'progression',
+            stage: 'critical',
+            dependencies: ['quests'],
+            files: [
+                'systems/progression/achievement-system.js',
+                'ui/panels/leaderboard-panel.js',
+                'systems/combat/death-cause-system.js',
+                'systems/combat/game-over-system.js'
+            ]
+        },
+        {
+            name: 'ui',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'ui/ui-enhancements.js',
+                'ui/ui-polish-system.js',
+                'ui/button-fix.js',
+                'ui/panels/people-panel.js',
+                'ui/panels/random-event-panel.js',
+                'ui/components/tooltip-system.js',
+                'ui/components/draggable-panels.js',
+                'ui/components/panel-manager.js',
+                'ui/components/ui-state-manager.js',
+                'ui/components/panel-update-manager.js'
+            ]
+        },
+        {
+            name: 'save',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'systems/save/chunked-save-store.js',
+                'systems/save/save-manager.js'
+            ]
+        },
+        {
+            name: 'world',
+            stage: 'critical',
+            dependencies: ['world-data', 'travel'],
+            files: [
+                'systems/world/weather-system.js',
+                'systems/world/day-night-cycle.js',
+                'systems/world/world-state-manager.js',
+                'systems/progression/faction-system.js',
+                'systems/progression/skill-system.js',
+                'systems/progression/reputation-system.js',
+                'systems/npc/npc-schedule-system.js',
+                'systems/travel/mount-system.js',
+                'systems/travel/ship-system.js'
+            ]
+        },
+        {
+            name: 'immersion',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'effects/visual-effects-system.js',
+                'audio/audio-system.js',
+                'audio/music-system.js',
+                'effects/animation-system.js',
+                'effects/environmental-effects-system.js',
+                'effects/immersive-experience-integration.js',
+                'effects/menu-weather-system.js'
+            ]
+        },
+        {
+            name: 'tools',
+            stage: 'critical',
+            dependencies: ['core'],
+            files: [
+                'debooger/performance-optimizer.js',
+                'core/debooger-system.js',
+                'systems/current-task-system.js',
+                'ui/key-bindings.js',
+                'ui/location-panel-stack.js',
+                'ui/perk-system.js'
+            ]
+        },
+        {
+            // must stay LAST of the game scripts - it depends on everything above
+            name: 'game',
+            stage: 'critical',
+            dependencies: ['core', 'world-data', 'market', 'npc', 'quests', 'property', 'travel', 'map', 'ui', 'save', 'world'],
+            files: ['core/game.js']
+        },
+        {
+            name: 'debooger-commands',
+            stage: 'critical',
+            dependencies: ['game'],
+            files: ['debooger/debooger-command-system.js']
+        },
+
+        // 💀 the apocalypse can wait until the menu is up
+        {
+            name: 'doom',
+            stage: 'gameplay',
+            dependencies: ['world-data', 'npc', 'quests', 'world'],
+            provides: ['DoomWorldConfig', 'DoomWorldNPCs', 'DOOM_NPC_EMBEDDED_DATA', 'DoomNPCInstructionTemplates', 'DoomQuests', 'DoomQuestSystem', 'DoomWorldSystem'],
+            files: [
+                'data/doom-world-config.js',
+                'data/doom-world-npcs.js',
+                'npc/doom-npc-data-embedded.js',
+                'npc/doom-npc-instruction-templates.js',
+                'systems/progression/doom-quests.js',
+                'systems/progression/doom-quest-system.js',
+                'systems/world/doom-world-system.js'
+            ]
+        },
+        {
+            name: 'exploration',
+            stage: 'gameplay',
+            dependencies: ['crafting-combat', 'travel', 'ui'],
+            provides: ['DungeonExplorationSystem', 'ExplorationConfig', 'ExplorationPanel'],
+            files: [
+                'systems/combat/dungeon-exploration-system.js',
+                'data/exploration-config.js',
+                'ui/panels/exploration-panel.js'
+            ]
+        },
+
+        // ⚙️ nobody needs 4700 lines of settings to see the title screen
+        {
+            name: 'settings',
+            stage: 'lazy',
+            dependencies: ['game'],
+            provides: ['SettingsPanel'],
+            files: ['ui/panels/settings-panel.js']
+        },
+        {
+            name: 'credits',
+            stage: 'lazy',
+            dependencies: ['core'],
+            provides: ['CreditsSystem'],
+            files: ['ui/credits-system.js']
+        }
+    ],
+
+    // ═══════════════════════════════════════════════════════════
+    // STATE
+    // ═══════════════════════════════════════════════════════════
+    ready: null,            // resolves once the critical stage has executed
+    _byName: new Map(),
+    _providers: new Map(),  // global name -> module name
+    _loads: new Map(),      // module name -> Promise
+    _loaded: new Set(),
+    _hooks: new Map(),      // module name -> [fn]
+    _fileCount: 0,
+    _filesDone: 0,
+
+    metrics: {
+        criticalMs: null,
+        menuMs: null,
+        playableMs: null,
+        modules: {}         // name -> { stage, files, ms, startedAt, failed }
+    },
+
+    // ═══════════════════════════════════════════════════════════
+    // BOOT
+    // ═══════════════════════════════════════════════════════════
+
+    start() {
+        for (const mod of this.MODULES) {
+            this._byName.set(mod.name, mod);
+            for (const global of mod.provides || []) {
+                this._providers.set(global, mod.name);
+            }
+        }
+
+        const critical = this.MODULES.filter(m => m.stage === 'critical');
+
+        // a scaled UI has to be applied before the menu shows, so settings
+        // rides along with the critical stage when the player changed it
+        if (this._hasSavedUiScale()) {
+            critical.push(this._byName.get('settings'));
+        }
+
+        const start = performance.now();
+        this._fileCount = critical.reduce((n, m) => n + m.files.length, 0);
+        this.ready = Promise.all(critical.map(mod => this.load(mod.name))).then(() => {
+            this.metrics.criticalMs = Math.round(performance.now() - start);
+            console.log(`📦 ModuleLoader: ${critical.length} critical modules (${this._fileCount} files) in ${this.metrics.criticalMs}ms`);
+        });
+        return this.ready;
+    },
+
+    _hasSavedUiScale() {
+        try {
+            const saved = JSON.parse(localStorage.getItem('tradingGameUiSettings') || 'null');
+            return !!(saved && saved.uiScale && saved.uiScale !== 1);
+        } catch (e) {
+            return false;
+        }
+    },
+
+    _versionQuery() {
+        const version = typeof GameConfig !== 'undefined' && GameConfig.version?.game ? GameConfig.version.game : '0.92.00';
+        return `?v=${version}`;
+    },
+
+    // ═══════════════════════════════════════════════════════════
+    // LOADING API
+    // ═══════════════════════════════════════════════════════════
+
+    /**
+     * Load a module (or a whole stage: 'gameplay') plus its dependencies
+     * Never rejects - a file that fails to load is logged and skipped, the
+     * same as a missing <script> tag always was
+     * @param {string} name - Module or stage name
+     * @returns {Promise<boolean>} true if every file loaded
+     */
+    load(name) {
+        if (this._loads.has(name)) return this._loads.get(name);
+
+        let promise;
+        if (!this._byName.has(name)) {
+            const stage = this.MODULES.filter(m => m.stage === name);
+            if (stage.length === 0) {
+                console.warn(`📦 ModuleLoader: unknown module '${name}'`);
+                return Promise.resolve(false);
+            }
+            promise = Promise.all(stage.map(m => this.load(m.name))).then(results => results.every(Boolean));
+        } else {
+            promise = this._loadModule(this._byName.get(name));
+        }
+
+        promise = promise.then(ok => {
+            this._loaded.add(name);
+            this._runHooks(name);
+            return ok;
+        });
+        this._loads.set(name, promise);
+        return promise;
+    },
+
+    async _loadModule(mod) {
+        const deps = (mod.dependencies || []).map(dep => this.load(dep));
+        const registeredBefore = typeof Bootstrap !== 'undefined' ? new Set(Bootstrap._registry.keys()) : new Set();
+        const started = performance.now();
+
+        // inject our files right away - async=false keeps execution in insertion
+        // order, so deps already in flight still run first, without waiting
+        // on their network round trip before we start ours
+        const files = mod.files.map(file => this._injectScript(this.BASE_PATH + file));
+        await Promise.all(deps);
+        const results = await Promise.all(files);
+        const ok = results.every(Boolean);
+
+        this.metrics.modules[mod.name] = {
+            stage: mod.stage,
+            files: mod.files.length,
+            ms: Math.round(performance.now() - started),
+            startedAt: Math.round(started),
+            failed: results.filter(r => !r).length
+        };
+
+        // cached nulls from before the module existed would hide it forever
+        if (typeof SystemRegistry !== 'undefined') {
+            for (const global of mod.provides || []) SystemRegistry.invalidate(global);
+        }
+
+        // anything that registered after Bootstrap ran was late-initialized -
+        // wait for that so hooks see fully initialized systems
+        if (typeof Bootstrap !== 'undefined' && Bootstrap.initialized) {
+            const fresh = [...Bootstrap._registry.keys()].filter(n => !registeredBefore.has(n));
+            await Bootstrap.whenInitialized(fresh);
+        }
+
+        if (mod.stage !== 'critical') {
+            console.log(`📦 ModuleLoader: ${mod.name} loaded in ${this.metrics.modules[mod.name].ms}ms`);
+        }
+        if (typeof EventBus !== 'undefined') {
+            EventBus.emit('module:loaded', { name: mod.name, stage: mod.stage, ms: this.metrics.modules[mod.name].ms, ok });
+        }
+        return ok;
+    },
+
+    _injectScript(src) {
+        return new Promise(resolve => {
+            const script = document.createElement('script');
+            script.src = src + this._versionQuery();
+            script.async = false;
+            script.onload = () => {
+                this._filesDone++;
+                this._reportProgress(src);
+                resolve(true);
+            };
+            script.onerror = () => {
+                this._filesDone++;
+                console.error(`📦 ModuleLoader: failed to load ${src}`);
+                resolve(false);
+            };
+            document.body.appendChild(script);
+        });
+    },
+
+    // the loading screen is up while scripts download - give it something to say
+    _reportProgress(src) {
+        if (this.metrics.criticalMs !== null) return;
+        const status = document.getElementById('loading-status');
+        if (status) status.textContent = `Loading scripts ${this._filesDone}/${this._fileCount} - ${src.split('/').pop()}`;
+    },
+
+    /**
+     * Run fn once a module is loaded - immediately if it already is
+     * @param {string} name - Module or stage name
+     * @param {Function} fn - Called with no arguments
+     * @returns {Promise} resolves with fn's result
+     */
+    use(name, fn) {
+        if (this._loaded.has(name)) return Promise.resolve(fn());
+        return this.load(name).then(() => fn());
+    },
+
+    /** 🪝 Run fn when a module (or stage) finishes loading - right now if it already has */
+    onLoad(name, fn) {
+        if (this._loaded.has(name)) {
+            fn();
+            return;
+        }
+        if (!this._hooks.has(name)) this._hooks.set(name, []);
+        this._hooks.get(name).push(fn);
+    },
+
+    _runHooks(name) {
+        for (const fn of this._hooks.get(name) || []) {
+            try {
+                fn();
+            } catch (e) {
+                console.error(`📦 ModuleLoader: onLoad hook for ${name} threw:`, e);
+            }
+        }
+        this._hooks.delete(name);
+    },
+
+    isLoaded(name) {
+        return this._loaded.has(name);
+    },
+
+    /** Which module defines this global (null for critical-stage globals) */
+    moduleFor(globalName) {
+        return this._providers.get(globalName) || null;
+    },
+
+    /** Is this global provided by a module that hasn't loaded yet? */
+    isDeferred(globalName) {
+        const mod = this._providers.get(globalName);
+        return !!mod && !this._loaded.has(mod);
+    },
+
+    // ═══════════════════════════════════════════════════════════
+    // STARTUP METRICS
+    // ═══════════════════════════════════════════════════════════
+
+    /**
+     * Main menu is on screen - record time-to-menu and stream in gameplay modules
+     * Called by LoadingManager.complete() when it reveals the menu
+     */
+    markMenu() {
+        if (this.metrics.menuMs !== null) return;
+        this.metrics.menuMs = Math.round(performance.now());
+        performance.mark?.('mtg:menu');
+        console.log(`📦 ModuleLoader: time-to-menu ${this.metrics.menuMs}ms`);
+
+        const prefetch = () => this.load('gameplay').then(() => this._markPlayable());
+        if (typeof requestIdleCallback === 'function') {
+            requestIdleCallback(prefetch, { timeout: 500 });
+        } else {
+            setTimeout(prefetch, 50);
+        }
+    },
+
+    // playable = menu is up and New Game / Load won't have to wait on anything
+    _markPlayable() {
+        if (this.metrics.playableMs !== null) return;
+        this.metrics.playableMs = Math.round(performance.now());
+        performance.mark?.('mtg:playable');
+        console.log(`📦 ModuleLoader: time-to-playable ${this.metrics.playableMs}ms`);
+        this._recordRun();
+        if (typeof EventBus !== 'undefined') {
+            EventBus.emit('startup:metrics', this.getStartupReport());
+        }
+    },
+
+    getHistory() {
+        try {
+            return JSON.parse(localStorage.getItem(this.HISTORY_KEY) || '[]');
+        } catch (e) {
+            return [];
+        }
+    },
+
+    clearHistory() {
+        localStorage.removeItem(this.HISTORY_KEY);
+    },
+
+    _median(values) {
+        if (values.length === 0) return null;
+        const sorted = [...values].sort((a, b) => a - b);
+        const mid = sorted.length >> 1;
+        return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+    },
+
+    // compare this boot to the recent ones, then add it to the pile
+    _recordRun() {
+        const history = this.getHistory();
+        const run = {
+            at: Date.now(),
+            criticalMs: this.metrics.criticalMs,
+            menuMs: this.metrics.menuMs,
+            playableMs: this.metrics.playableMs
+        };
+
+        this.metrics.regressions = [];
+        for (const key of ['menuMs', 'playableMs']) {
+            const median = this._median(history.map(h => h[key]).filter(v => typeof v === 'number'));
+            const value = run[key];
+            const overBudget = value > this.BUDGETS[key];
+            const slower = median !== null && value > median * this.REGRESSION_RATIO && value - median > this.REGRESSION_MIN_MS;
+            if (overBudget && (slower || median === null)) {
+                this.metrics.regressions.push(key);
+                console.warn(`📦 ModuleLoader: ${key} ${value}ms is over its ${this.BUDGETS[key]}ms budget` +
+                    (median !== null ? ` (recent median ${Math.round(median)}ms)` : ''));
+            }
+        }
+
+        history.push(run);
+        try {
+            localStorage.setItem(this.HISTORY_KEY, JSON.stringify(history.slice(-this.HISTORY_SIZE)));
+        } catch (e) {
+            // storage full - metrics are nice to have, not worth a save slot
+        }
+    },
+
+    getStartupReport() {
+        const history = this.getHistory();
+        return {
+            criticalMs: this.metrics.criticalMs,
+            menuMs: this.metrics.menuMs,
+            playableMs: this.metrics.playableMs,
+            medianMenuMs: this._median(history.map(h => h.menuMs).filter(v => typeof v === 'number')),
+            medianPlayableMs: this._median(history.map(h => h.playableMs).filter(v => typeof v === 'number')),
+            runs: history.length,
+            regressions: this.metrics.regressions || [],
+            modules: Object.entries(this.metrics.modules).map(([name, m]) => ({ module: name, ...m }))
+        };
+    }
+};
+
+window.ModuleLoader = ModuleLoader;
+ModuleLoader.start();
+console.log('📦 ModuleLoader loaded - critical scripts on the way');
@@ -888,14 +888,15 @@ const NPCChatUI = {
             // send to NPC voice system
             if (typeof NPCVoiceChatSystem !== 'undefined') {
                 const npcId = this.currentNPC?.id || 'npc_unknown';
-                const response = await NPCVoiceChatSystem.sendMessage(npcId, message);
+                const stream = this.createStreamingNPCMessage();
+                const response = await NPCVoiceChatSystem.sendMessage(npcId, message, { onToken: stream.onToken });
 
                 // erase the false thinking animation - the puppet has spoken
                 this.hideTypingIndicator();
 
                 if (response) {
                     // manifest the puppet's scripted words onto the screen
-                    this.addNPCMessage(response.text);
+                    this.finishStreamingNPCMessage(stream, response.text);
 
                     // refresh the turn counter - count down to dismissal
                     this.updateTurnsDisplay(response);
@@ -946,6 +947,54 @@ const NPCChatUI = {
     },
 
     addNPCMessage(text, isGreeting = false) {
+        const { bubbleEl } = this._createNPCMessageElement(text);
+
+        // locate the bubble that will birth these words - typewriter ritual begins
+        if (bubbleEl) {
+            this.typewriterEffect(bubbleEl, text);
+        }
+
+        if (!isGreeting) {
+            this.chatHistory.push({ role: 'npc', text: text });
+        }
+    },
+
+    // ═══════════════════════════════════════════════════════════
+    // streaming - words land as the llama coughs them up
+    // ═══════════════════════════════════════════════════════════
+
+    // returns an onToken handler for NPCVoiceChatSystem - first token swaps the typing dots for a live bubble
+    createStreamingNPCMessage() {
+        const stream = { bubbleEl: null, messageEl: null, text: '' };
+        stream.onToken = (displayText) => {
+            if (!stream.bubbleEl) {
+                this.hideTypingIndicator();
+                Object.assign(stream, this._createNPCMessageElement(''));
+            }
+            stream.text = displayText;
+            if (stream.bubbleEl) stream.bubbleEl.textContent = displayText;
+            this.scrollToBottom();
+        };
+        return stream;
+    },
+
+    // settle a streamed bubble on the final cleaned text - falls back to a normal message if nothing streamed
+    finishStreamingNPCMessage(stream, text, isGreeting = false) {
+        if (!stream?.bubbleEl) {
+            this.addNPCMessage(text, isGreeting);
+            return;
+        }
+        stream.bubbleEl.textContent = text;
+        const speakerBtn = stream.messageEl.querySelector('.message-speaker-btn');
+        if (speakerBtn) speakerBtn.dataset.text = text;
+        this.scrollToBottom();
+
+        if (!isGreeting) {
+            this.chatHistory.push({ role: 'npc', text: text });
+        }
+    },
+
+    _createNPCMessageElement(text) {
         const messagesContainer = document.getElementById('npc-chat-messages');
         const welcome = document.getElementById('chat-welcome');
         if (welcome) welcome.style.display = 'none';
@@ -983,15 +1032,7 @@ const NPCChatUI = {
             });
         }
 
-        // locate the bubble that will birth these words - typewriter ritual begins
-        const bubbleEl = messageEl.querySelector('.message-bubble');
-        if (bubbleEl) {
-            this.typewriterEffect(bubbleEl, text);
-        }
-
-        if (!isGreeting) {
-            this.chatHistory.push({ role: 'npc', text: text });
-        }
+        return { messageEl, bubbleEl: messageEl.querySelector('.message-bubble') };
     },
 
     // Replay TTS for a specific message
@@ -1361,13 +1402,14 @@ const NPCChatUI = {
 
         try {
             if (NPCVoiceChatSystem.getGreeting) {
-                const greetingResponse = await NPCVoiceChatSystem.getGreeting(npcData);
+                const stream = this.createStreamingNPCMessage();
+                const greetingResponse = await NPCVoiceChatSystem.getGreeting(npcData, { onToken: stream.onToken });
 
                 this.hideTypingIndicator();
 
                 if (greetingResponse && greetingResponse.text) {
                     console.log(`🦙 Got AI greeting for ${npcData.name}: "${greetingResponse.text.substring(0, 50)}..."`);
-                    this.addNPCMessage(greetingResponse.text, true);
+                    this.finishStreamingNPCMessage(stream, greetingResponse.text, true);
 
                     if (NPCVoiceChatSystem.settings?.voiceEnabled) {
                         const voice = npcData.voice || npcData.type || persona?.voice || 'merchant';
@@ -1378,6 +1420,7 @@ const NPCChatUI = {
 
                 // OLLAMA on but returned empty — use embedded data greeting
                 console.warn(`🦙 OLLAMA returned empty for ${npcData.name}`);
+                stream.messageEl?.remove();
                 this.displayFallbackGreeting(npcData, persona);
                 return;
             }
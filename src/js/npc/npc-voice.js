@@ -43,6 +43,16 @@ const NPCVoiceChatSystem = {
             }
             return 'mistral:7b-instruct';  // Default with tag
         },
+        // requests in flight to the local model at once - ollama serializes past its own parallel limit anyway
+        get maxConcurrentRequests() {
+            return (typeof GameConfig !== 'undefined' && GameConfig.api?.ollama?.maxConcurrent)
+                ? GameConfig.api.ollama.maxConcurrent
+                : 2;
+        },
+        // stream tokens into the chat as they arrive instead of waiting for the whole reply
+        get streamResponses() {
+            return !(typeof GameConfig !== 'undefined' && GameConfig.api?.ollama?.stream === false);
+        },
         get ollamaTimeout() {
             // 120 seconds - Ollama needs time to load model on first query, some responses take 10s+
             return (typeof GameConfig !== 'undefined' && GameConfig.api?.ollama?.timeout)
@@ -114,10 +124,31 @@ const NPCVoiceChatSystem = {
 
     // ═══════════════════════════════════════════════════════════
     // greeting cache - pre-fetched greetings for instant response
+    // LRU bounded by size, persisted so greetings survive a reload
     // ═══════════════════════════════════════════════════════════
-    greetingCache: new Map(),
-    pendingGreetings: new Map(),
-    cacheExpiry: 5 * 60 * 1000, // 5 minutes cache expiry
+    greetingCache: new LRUCache({
+        maxEntries: 300,
+        maxBytes: 512 * 1024,
+        ttl: 60 * 60 * 1000, // 1 hour - key already rotates with location and time of day
+        storageKey: 'npcResponseCache'
+    }),
+
+    // ═══════════════════════════════════════════════════════════
+    // request scheduler - bounded concurrency, identical requests share one fetch
+    // ═══════════════════════════════════════════════════════════
+    pendingRequests: new Map(), // dedupe key -> { promise, text, listeners, ticket }
+    _requestQueue: [],
+    _activeRequests: 0,
+    _runningJobs: new Set(),
+    _requestGeneration: 0, // bumped by cancelQueuedRequests - late finishers don't touch the new counts
+    llmMetrics: {
+        requests: 0,       // fetches actually sent to ollama
+        deduped: 0,        // callers that joined an in-flight request
+        failed: 0,
+        peakQueue: 0,
+        ttftMs: [],        // time to first token, last 100
+        totalMs: []        // time to full reply, last 100
+    },
 
     // ═══════════════════════════════════════════════════════════
     // initialization - awakening the voice demons
@@ -587,34 +618,12 @@ RELATIONSHIP MEMORY:
 
             console.log('🎙️ Sending request to Ollama...', { model: this.config.ollamaModel, promptLength: fullPrompt.length });
 
-            // Call Ollama with timeout
-            const controller = new AbortController();
-            const timeoutId = setTimeout(() => controller.abort(), this.config.ollamaTimeout);
-
-            const response = await fetch(this.config.ollamaEndpoint, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    model: this.config.ollamaModel,
-                    prompt: fullPrompt,
-                    stream: false,
-                    options: {
-                        temperature: this.config.defaults.temperature,
-                        num_predict: this.config.defaults.maxResponseTokens,
-                        stop: ['Player:', '\n\n']
-                    }
-                }),
-                signal: controller.signal
+            // scheduled + deduped - options.onToken gets (displayText, delta) while streaming
+            const rawText = await this._requestCompletion(fullPrompt, {
+                onToken: options.onToken || null,
+                priority: options.priority || 'high'
             });
-
-            clearTimeout(timeoutId);
-
-            if (!response.ok) {
-                throw new Error(`Ollama error: ${response.status}`);
-            }
-
-            const data = await response.json();
-            const rawAssistantMessage = data.response?.trim() || '';
+            const rawAssistantMessage = rawText.trim();
 
             console.log('🎙️ NPC raw response received:', rawAssistantMessage.substring(0, 50) + '...');
 
@@ -703,6 +712,312 @@ RELATIONSHIP MEMORY:
         }
     },
 
+    // ═══════════════════════════════════════════════════════════
+    // ollama pipeline - scheduler, dedupe, streaming
+    // ═══════════════════════════════════════════════════════════
+
+    /**
+     * Share one in-flight request between every caller with the same key
+     * Late joiners get the text streamed so far replayed, then live tokens
+     * @param {string} key - Dedupe key (greeting cache key, prompt hash, ...)
+     * @param {Function|null} onToken - (displayText, delta) listener
+     * @param {string|Object} priority - 'high' | 'low' or a shared ticket
+     * @param {Function} factory - (emit(delta), ticket) => Promise
+     */
+    _dedupeRequest(key, onToken, priority, factory) {
+        const existing = this.pendingRequests.get(key);
+        if (existing) {
+            this.llmMetrics.deduped++;
+            // someone is waiting on it now - bump a queued prefetch
+            if (this._priorityLevel(priority) === 'high') existing.ticket.level = 'high';
+            if (onToken) {
+                if (existing.text) onToken(this._stripCommandsForDisplay(existing.text), existing.text);
+                existing.listeners.add(onToken);
+            }
+            return existing.promise;
+        }
+
+        const ticket = typeof priority === 'object' && priority ? priority : { level: priority };
+        const entry = { text: '', listeners: new Set(onToken ? [onToken] : []), ticket };
+        const emit = (delta) => {
+            entry.text += delta;
+            const display = this._stripCommandsForDisplay(entry.text);
+            for (const listener of entry.listeners) {
+                try { listener(display, delta); } catch (e) { console.warn('🎙️ Token listener error:', e.message); }
+            }
+        };
+
+        this.pendingRequests.set(key, entry);
+        entry.promise = Promise.resolve()
+            .then(() => factory(emit, ticket))
+            .finally(() => {
+                // a cancel may have cleared the map and a fresh request taken the key
+                if (this.pendingRequests.get(key) === entry) this.pendingRequests.delete(key);
+            });
+        return entry.promise;
+    },
+
+    _priorityLevel(priority) {
+        return typeof priority === 'object' && priority ? priority.level : priority;
+    },
+
+    // run a task once a slot to the local model frees up - task gets an abort signal
+    _scheduleRequest(task, ticket) {
+        return new Promise((resolve, reject) => {
+            this._requestQueue.push({ task, ticket, resolve, reject, controller: new AbortController() });
+            this.llmMetrics.peakQueue = Math.max(this.llmMetrics.peakQueue, this._requestQueue.length);
+            this._drainRequestQueue();
+        });
+    },
+
+    _drainRequestQueue() {
+        while (this._activeRequests < this.config.maxConcurrentRequests && this._requestQueue.length > 0) {
+            // first high-priority job, else oldest
+            let index = this._requestQueue.findIndex(job => job.ticket.level === 'high');
+            if (index < 0) index = 0;
+            const job = this._requestQueue.splice(index, 1)[0];
+            const generation = this._requestGeneration;
+
+            this._activeRequests++;
+            this._runningJobs.add(job);
+            Promise.resolve()
+                .then(() => job.task(job.controller.signal))
+                .then(job.resolve, job.reject)
+                .finally(() => {
+                    if (generation !== this._requestGeneration) return;
+                    this._runningJobs.delete(job);
+                    this._activeRequests--;
+                    this._drainRequestQueue();
+                });
+        }
+    },
+
+    /**
+     * Reject everything queued, abort everything running and free every slot
+     * Awaiting callers get an AbortError instead of hanging forever
+     */
+    cancelQueuedRequests() {
+        const error = new Error('NPC voice request cancelled');
+        error.name = 'AbortError';
+
+        const queued = this._requestQueue.splice(0);
+        const running = [...this._runningJobs];
+        this._runningJobs.clear();
+        this._activeRequests = 0;
+        this._requestGeneration++;
+        this.pendingRequests.clear();
+
+        for (const job of running) {
+            job.controller.abort();
+            job.reject(error);
+        }
+        for (const job of queued) job.reject(error);
+    },
+
+    // hide {command} tags (and a half-streamed one at the end) while text is still arriving
+    _stripCommandsForDisplay(text) {
+        return text
+            .replace(/\{\w+(:[^}]*)?\}/g, '')
+            .replace(/\{[^}]*$/, '')
+            .trimStart();
+    },
+
+    /**
+     * Send a prompt to ollama through the scheduler
+     * @param {string} prompt - Full prompt string
+     * @param {Object} [options] - { onToken, priority }
+     * @returns {Promise<string>} Raw generated text
+     */
+    _requestCompletion(prompt, { onToken = null, priority = 'high' } = {}) {
+        const body = {
+            model: this.config.ollamaModel,
+            prompt,
+            options: {
+                temperature: this.config.defaults.temperature,
+                num_predict: this.config.defaults.maxResponseTokens,
+                stop: ['Player:', '\n\n']
+            }
+        };
+        const key = `${body.model}|${StringHash.cyrb53(JSON.stringify(body.options) + prompt)}`;
+        return this._dedupeRequest(key, onToken, priority, (emit, ticket) =>
+            this._scheduleRequest((signal) => this._runCompletion(body, emit, signal), ticket)
+        );
+    },
+
+    async _runCompletion(body, emit, signal = null) {
+        const stream = this.config.streamResponses;
+        const started = performance.now();
+        let firstTokenAt = null;
+        const onChunk = (delta) => {
+            if (!delta) return;
+            if (firstTokenAt === null) firstTokenAt = performance.now();
+            emit(delta);
+        };
+
+        // Call Ollama with timeout - covers the whole generation when streaming
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), this.config.ollamaTimeout);
+        const cancel = () => controller.abort();
+        signal?.addEventListener('abort', cancel);
+        if (signal?.aborted) controller.abort();
+        this.llmMetrics.requests++;
+
+        try {
+            const response = await fetch(this.config.ollamaEndpoint, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ ...body, stream }),
+                signal: controller.signal
+            });
+
+            if (!response.ok) {
+                throw new Error(`Ollama error: ${response.status}`);
+            }
+
+            let text = '';
+            if (!stream) {
+                const data = await response.json();
+                text = data.response || '';
+                onChunk(text);
+            } else {
+                // NDJSON - one {"response": "...", "done": false} object per line
+                const handleLine = (line) => {
+                    if (!line.trim()) return;
+                    const chunk = JSON.parse(line);
+                    if (chunk.error) throw new Error(`Ollama error: ${chunk.error}`);
+                    if (chunk.response) {
+                        text += chunk.response;
+                        onChunk(chunk.response);
+                    }
+                };
+
+                if (response.body?.getReader) {
+                    const reader = response.body.getReader();
+                    const decoder = new TextDecoder();
+                    let buffer = '';
+                    while (true) {
+                        const { done, value } = await reader.read();
+                        if (done) break;
+                        buffer += decoder.decode(value, { stream: true });
+                        let newline;
+                        while ((newline = buffer.indexOf('\n')) >= 0) {
+                            handleLine(buffer.slice(0, newline));
+                            buffer = buffer.slice(newline + 1);
+                        }
+                    }
+                    handleLine(buffer + decoder.decode());
+                } else {
+                    (await response.text()).split('\n').forEach(handleLine);
+                }
+            }
+
+            const metrics = this.llmMetrics;
+            metrics.ttftMs.push((firstTokenAt ?? performance.now()) - started);
+            metrics.totalMs.push(performance.now() - started);
+            if (metrics.ttftMs.length > 100) metrics.ttftMs.shift();
+            if (metrics.totalMs.length > 100) metrics.totalMs.shift();
+            return text;
+        } catch (error) {
+            this.llmMetrics.failed++;
+            throw error;
+        } finally {
+            clearTimeout(timeoutId);
+            signal?.removeEventListener('abort', cancel);
+        }
+    },
+
+    /**
+     * Time-to-first-token, dedupe and cache hit-rate numbers for the ollama pipeline
+     * @returns {Object}
+     */
+    getLLMMetrics() {
+        const percentile = (values, p) => {
+            if (values.length === 0) return 0;
+            const sorted = [...values].sort((a, b) => a - b);
+            return +sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))].toFixed(1);
+        };
+        const m = this.llmMetrics;
+        return {
+            requests: m.requests,
+            deduped: m.deduped,
+            failed: m.failed,
+            peakQueue: m.peakQueue,
+            active: this._activeRequests,
+            queued: this._requestQueue.length,
+            ttftP50: percentile(m.ttftMs, 0.5),
+            ttftP95: percentile(m.ttftMs, 0.95),
+            totalP50: percentile(m.totalMs, 0.5),
+            cache: this.greetingCache.getStats()
+        };
+    },
+
+    resetLLMMetrics() {
+        this.llmMetrics = { requests: 0, deduped: 0, failed: 0, peakQueue: 0, ttftMs: [], totalMs: [] };
+        this.greetingCache.hits = 0;
+        this.greetingCache.misses = 0;
+        this.greetingCache.evictions = 0;
+    },
+
+    /**
+     * Greeting round-trips against ollama or a stand-in server
+     * Round 1 is cold (every NPC asked twice at once - should dedupe), later rounds should hit the cache
+     * @param {Object} [options] - { baseUrl, npcCount, rounds }
+     * @returns {Promise<Array>} Rows printed with console.table
+     */
+    async benchmarkLLMPipeline({ baseUrl = null, npcCount = 4, rounds = 2 } = {}) {
+        const savedBaseUrl = this._ollamaBaseUrl;
+        const savedAvailable = this._ollamaAvailable;
+        if (baseUrl) {
+            this._ollamaBaseUrl = baseUrl.replace(/\/$/, '');
+            this._ollamaAvailable = true;
+        }
+
+        const types = typeof NPCPersonaDatabase !== 'undefined' ? NPCPersonaDatabase.getAllPersonaTypes() : ['merchant'];
+        const runId = Date.now().toString(36);
+        const npcs = Array.from({ length: npcCount }, (_, i) => ({
+            id: `benchmark_${runId}_${i}`,
+            name: `Benchmark NPC ${i + 1}`,
+            type: types[i % types.length]
+        }));
+        const rows = [];
+
+        try {
+            for (let round = 1; round <= rounds; round++) {
+                this.resetLLMMetrics();
+                const started = performance.now();
+                const ttfts = [];
+
+                await Promise.all(npcs.flatMap(npc => [0, 1].map(() => {
+                    const askedAt = performance.now();
+                    let first = null;
+                    return this.getGreeting(npc, {
+                        onToken: () => { if (first === null) first = performance.now() - askedAt; }
+                    }).then(response => ttfts.push(first ?? (response?.cached ? 0 : performance.now() - askedAt)));
+                })));
+
+                const metrics = this.getLLMMetrics();
+                rows.push({
+                    round,
+                    callers: npcs.length * 2,
+                    ollamaRequests: metrics.requests,
+                    deduped: metrics.deduped,
+                    cacheHitRate: metrics.cache.hitRate,
+                    avgTTFTms: +(ttfts.reduce((a, b) => a + b, 0) / Math.max(1, ttfts.length)).toFixed(1),
+                    ttftP95: metrics.ttftP95,
+                    wallMs: +(performance.now() - started).toFixed(1)
+                });
+            }
+        } finally {
+            npcs.forEach(npc => this.greetingCache.delete(this.getGreetingCacheKey(npc)));
+            this._ollamaBaseUrl = savedBaseUrl;
+            this._ollamaAvailable = savedAvailable;
+        }
+
+        console.log(`🦙 LLM pipeline benchmark against ${this.config.ollamaEndpoint} (max ${this.config.maxConcurrentRequests} concurrent, stream ${this.config.streamResponses})`);
+        console.table(rows);
+        return rows;
+    },
+
     // 🦙 FALLBACK SYSTEM - pre-written responses when Ollama is unavailable
     // Loaded from src/data/npc-fallbacks.json
     _fallbackData: null,
@@ -1027,106 +1342,72 @@ RELATIONSHIP MEMORY:
 
         const cacheKey = this.getGreetingCacheKey(npcData);
 
-        // Check if already cached and not expired
-        const cached = this.greetingCache.get(cacheKey);
-        if (cached && Date.now() - cached.timestamp < this.cacheExpiry) {
-            return; // Already have a valid cached greeting
-        }
-
-        // Check if already fetching
-        if (this.pendingGreetings.has(cacheKey)) {
-            return; // Already fetching
+        // Already cached or already fetching
+        if (this.greetingCache.has(cacheKey) || this.pendingRequests.has(cacheKey)) {
+            return;
         }
 
-        // 🦙 Start async fetch from Ollama with proper greeting action
+        // 🦙 Low priority - a player actually waiting on a greeting jumps ahead
         console.log(`🦙 Pre-fetching AI greeting for ${npcData.name || npcData.type}...`);
-        this.pendingGreetings.set(cacheKey, true);
-
-        this.generateNPCResponse(npcData, 'Hello there!', [], { action: 'greeting' })
-            .then(response => {
-                if (response.success && !response.fallbackUsed) {
-                    this.greetingCache.set(cacheKey, {
-                        text: response.text,
-                        timestamp: Date.now()
-                    });
-                    console.log(`🦙 AI greeting cached for ${npcData.name || npcData.type}`);
-                }
-            })
+        this._fetchGreeting(npcData, cacheKey, { priority: 'low' })
             .catch(err => {
                 console.warn(`🦙 Failed to pre-fetch AI greeting:`, err);
-            })
-            .finally(() => {
-                this.pendingGreetings.delete(cacheKey);
             });
     },
 
     /**
      * Get a greeting - returns cached version instantly if available
-     * Otherwise fetches in real-time from Ollama
+     * Otherwise fetches in real-time from Ollama, joining any prefetch already in flight
      * 🦙 This is the PRIMARY greeting method - uses Ollama, not hardcoded text
+     * @param {Object} npcData
+     * @param {Object} [options] - { onToken(displayText, delta) } to stream the greeting
      */
-    async getGreeting(npcData) {
+    async getGreeting(npcData, options = {}) {
         const cacheKey = this.getGreetingCacheKey(npcData);
 
         // Check cache first (cached Ollama responses, not hardcoded)
         const cached = this.greetingCache.get(cacheKey);
-        if (cached && Date.now() - cached.timestamp < this.cacheExpiry) {
+        if (cached) {
             console.log(`🦙 Using cached AI greeting for ${npcData.name || npcData.type}`);
             return { text: cached.text, success: true, cached: true };
         }
 
-        // Wait for pending fetch if one is in progress
-        if (this.pendingGreetings.has(cacheKey)) {
-            console.log(`🦙 Waiting for pending greeting fetch...`);
-            // Wait up to 3 seconds for pending fetch
-            for (let i = 0; i < 30; i++) {
-                await new Promise(resolve => setTimeout(resolve, 100));
-                const newCached = this.greetingCache.get(cacheKey);
-                if (newCached) {
-                    return { text: newCached.text, success: true, cached: true };
-                }
-                if (!this.pendingGreetings.has(cacheKey)) break;
-            }
-        }
-
-        // 🦙 Fetch fresh greeting from Ollama with proper action type
+        // 🦙 Fetch fresh greeting from Ollama (or join the pending prefetch)
         console.log(`🦙 Fetching AI greeting from Ollama for ${npcData.name || npcData.type}`);
-        const response = await this.generateNPCResponse(
-            npcData,
-            'Hello there!',  // Natural greeting prompt instead of [GREETING] marker
-            [],
-            { action: 'greeting' }  // Pass action so NPCInstructionTemplates is used
-        );
-
-        // Cache it for next time (only if actually from Ollama, not fallback)
-        if (response.success && !response.fallbackUsed) {
-            this.greetingCache.set(cacheKey, {
-                text: response.text,
-                timestamp: Date.now()
-            });
-            console.log(`🦙 Cached AI greeting for ${npcData.name || npcData.type}`);
-        }
+        return this._fetchGreeting(npcData, cacheKey, { onToken: options.onToken, priority: 'high' });
+    },
 
-        return response;
+    _fetchGreeting(npcData, cacheKey, { onToken = null, priority = 'high' } = {}) {
+        return this._dedupeRequest(cacheKey, onToken, priority, (emit, ticket) =>
+            this.generateNPCResponse(
+                npcData,
+                'Hello there!',  // Natural greeting prompt instead of [GREETING] marker
+                [],
+                { action: 'greeting', priority: ticket, onToken: (display, delta) => emit(delta) }
+            ).then(response => {
+                // Cache it for next time (only if actually from Ollama, not fallback)
+                if (response.success && !response.fallbackUsed && response.text) {
+                    this.greetingCache.set(cacheKey, { text: response.text });
+                    console.log(`🦙 Cached AI greeting for ${npcData.name || npcData.type}`);
+                }
+                return response;
+            })
+        );
     },
 
     getGreetingCacheKey(npcData) {
-        // Create unique key based on NPC type, location, and time of day
+        // Create unique key based on NPC, type, location, and time of day
         const location = game?.currentLocation?.id || 'unknown';
         const timeOfDay = this.getTimeOfDay();
-        return `${npcData.type}_${location}_${timeOfDay}`;
+        const who = npcData.id || npcData.name || 'anon';
+        return `${who}_${npcData.type}_${location}_${timeOfDay}`;
     },
 
     /**
      * Clear expired cache entries
      */
     cleanGreetingCache() {
-        const now = Date.now();
-        for (const [key, value] of this.greetingCache.entries()) {
-            if (now - value.timestamp > this.cacheExpiry) {
-                this.greetingCache.delete(key);
-            }
-        }
+        this.greetingCache.prune();
     },
 
     /**
@@ -1982,7 +2263,7 @@ RELATIONSHIP MEMORY:
         return this.activeConversations.get(npcId);
     },
 
-    async sendMessage(npcId, playerMessage) {
+    async sendMessage(npcId, playerMessage, options = {}) {
         let conversation = this.activeConversations.get(npcId);
 
         if (!conversation || !conversation.isActive) {
@@ -2012,7 +2293,8 @@ RELATIONSHIP MEMORY:
         const response = await this.generateNPCResponse(
             conversation.npcData,
             playerMessage,
-            conversation.history.slice(-6) // keep last 6 messages for context
+            conversation.history.slice(-6), // keep last 6 messages for context
+            { onToken: options.onToken || null }
         );
 
         // add NPC response to history
@@ -2192,9 +2474,9 @@ RELATIONSHIP MEMORY:
             this.currentAudio = null;
         }
 
-        // Clear caches
-        this.greetingCache.clear();
-        this.pendingGreetings.clear();
+        // Flush the persistent cache, settle anything still queued or running
+        this.greetingCache.persist();
+        this.cancelQueuedRequests();
 
         // Remove any lingering event listeners
         // Note: The quest listeners use named functions so they can be removed
@@ -419,7 +419,18 @@ const GameOverSystem = {
         }
 
         // Roll the credits - honor those who built your demise
-        if (typeof CreditsSystem !== 'undefined') {
+        const rollCredits = () => {
+            if (typeof CreditsSystem === 'undefined') {
+                // Fallback if CreditsSystem not loaded - go straight to menu
+                console.warn('CreditsSystem not loaded, going straight to menu');
+                this.isProcessingGameOver = false;
+                this.finalStats = null;
+                this.rankingResult = null;
+                if (typeof changeState === 'function') {
+                    changeState(GameState.MENU);
+                }
+                return;
+            }
             CreditsSystem.showCredits({
                 endingMessage: endingMessage,
                 returnToMenu: true,
@@ -430,15 +441,13 @@ const GameOverSystem = {
                     this.rankingResult = null;
                 }
             });
+        };
+
+        // credits load on first use
+        if (typeof CreditsSystem === 'undefined' && typeof ModuleLoader !== 'undefined') {
+            ModuleLoader.use('credits', rollCredits);
         } else {
-            // Fallback if CreditsSystem not loaded - go straight to menu
-            console.warn('CreditsSystem not loaded, going straight to menu');
-            this.isProcessingGameOver = false;
-            this.finalStats = null;
-            this.rankingResult = null;
-            if (typeof changeState === 'function') {
-                changeState(GameState.MENU);
-            }
+            rollCredits();
         }
     }
 };
@@ -9,6 +9,8 @@
 
 const AchievementSystem = {
     // Every hollow victory you'll cling to in the darkness - achievements for the desperate
+    // dependsOn lists the events that can flip a condition - stat reads
+    // (AchievementSystem.stats.x) are picked up from the condition itself
     achievements: {
         // --- WEALTH ACHIEVEMENTS ---
         first_gold: {
@@ -31,6 +33,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['gold:changed', 'player:gold:changed'],
             condition: () => game.player && game.player.gold >= 1000
         },
         merchant_master: {
@@ -42,6 +45,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['gold:changed', 'player:gold:changed'],
             condition: () => game.player && game.player.gold >= 10000
         },
         trade_tycoon: {
@@ -53,6 +57,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['gold:changed', 'player:gold:changed'],
             condition: () => game.player && game.player.gold >= 50000
         },
 
@@ -66,6 +71,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.id === 'vagrant'
         },
         rank_peddler: {
@@ -77,6 +83,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 2
         },
         rank_hawker: {
@@ -88,6 +95,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 3
         },
         rank_trader: {
@@ -99,6 +107,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 4
         },
         rank_merchant: {
@@ -110,6 +119,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 5
         },
         rank_magnate: {
@@ -121,6 +131,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 6
         },
         rank_tycoon: {
@@ -132,6 +143,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 7
         },
         rank_baron: {
@@ -143,6 +155,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 8
         },
         rank_mogul: {
@@ -154,6 +167,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 9
         },
         rank_royal_merchant: {
@@ -165,6 +179,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['merchant-rank-changed'],
             condition: () => typeof MerchantRankSystem !== 'undefined' && MerchantRankSystem.currentRank?.level >= 10
         },
 
@@ -178,6 +193,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['tutorial-finished'],
             condition: () => typeof game !== 'undefined' && game.tutorialCompleted === true && !game.tutorialSkipped
         },
 
@@ -191,6 +207,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.length >= 1
         },
         quest_helper: {
@@ -202,6 +219,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.length >= 10
         },
         quest_master: {
@@ -213,6 +231,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.length >= 50
         },
         quest_legend: {
@@ -224,6 +243,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.length >= 100
         },
 
@@ -237,6 +257,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('act1_quest7')
         },
         act2_complete: {
@@ -248,6 +269,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('act2_quest7')
         },
         act3_complete: {
@@ -259,6 +281,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('act3_quest7')
         },
         act4_complete: {
@@ -270,6 +293,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('act4_quest7')
         },
         act5_complete: {
@@ -281,6 +305,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('act5_quest7')
         },
         main_quest_complete: {
@@ -292,6 +317,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => {
                 if (typeof QuestSystem === 'undefined') return false;
                 const mainQuests = ['act1_quest7', 'act2_quest7', 'act3_quest7', 'act4_quest7', 'act5_quest7'];
@@ -309,6 +335,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('greendale_vermin_3')
         },
         grain_baron: {
@@ -320,6 +347,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('greendale_farm_3')
         },
         pirate_hunter: {
@@ -331,6 +359,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('sunhaven_pirates_4')
         },
         royal_vintner: {
@@ -342,6 +371,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('sunhaven_wine_3')
         },
         forge_defender: {
@@ -353,6 +383,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('ironforge_wars_4')
         },
         steel_magnate: {
@@ -364,6 +395,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('ironforge_steel_4')
         },
         smuggler_hunter: {
@@ -375,6 +407,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('jade_smugglers_3')
         },
         silk_emperor: {
@@ -386,6 +419,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('jade_silk_4')
         },
         knight_of_realm: {
@@ -397,6 +431,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('capital_guard_4')
         },
         merchant_prince: {
@@ -408,6 +443,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('capital_noble_4')
         },
         winters_bane: {
@@ -419,6 +455,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('frostholm_wolves_4')
         },
         fur_baron: {
@@ -430,6 +467,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('frostholm_fur_3')
         },
         frontier_marshal: {
@@ -441,6 +479,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('western_bandits_4')
         },
         western_tycoon: {
@@ -452,6 +491,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('western_pioneer_3')
         },
         side_quest_master: {
@@ -463,6 +503,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => {
                 if (typeof QuestSystem === 'undefined') return false;
                 const chainFinals = [
@@ -488,6 +529,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('doom_survival_5')
         },
         resistance_hero: {
@@ -499,6 +541,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('doom_resistance_5')
         },
         doom_champion: {
@@ -510,6 +553,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('doom_boss_3')
         },
         greed_defeated: {
@@ -521,6 +565,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => typeof QuestSystem !== 'undefined' && QuestSystem.completedQuests?.includes('doom_boss_5')
         },
         doom_ender: {
@@ -532,6 +577,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => {
                 if (typeof QuestSystem === 'undefined') return false;
                 const doomFinals = ['doom_survival_5', 'doom_resistance_5', 'doom_boss_5'];
@@ -547,6 +593,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['quest:completed'],
             condition: () => {
                 if (typeof QuestSystem === 'undefined') return false;
                 // Check main story, all side chains, and doom
@@ -575,6 +622,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['boss-defeated'],
             condition: () => typeof DungeonExplorationSystem !== 'undefined' && Object.keys(DungeonExplorationSystem.defeatedBosses || {}).length >= 1
         },
         boss_hunter: {
@@ -586,6 +634,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['boss-defeated'],
             condition: () => typeof DungeonExplorationSystem !== 'undefined' && Object.keys(DungeonExplorationSystem.defeatedBosses || {}).length >= 5
         },
         all_bosses: {
@@ -597,6 +646,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['boss-defeated'],
             condition: () => typeof DungeonExplorationSystem !== 'undefined' && Object.keys(DungeonExplorationSystem.defeatedBosses || {}).length >= 8
         },
 
@@ -740,6 +790,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['inventory:item:added', 'inventory:item:removed'],
             condition: () => {
                 const inv = (typeof PlayerStateManager !== 'undefined')
                     ? PlayerStateManager.inventory.get()
@@ -767,6 +818,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['inventory:item:added', 'inventory:item:removed'],
             condition: () => {
                 const inv = (typeof PlayerStateManager !== 'undefined')
                     ? PlayerStateManager.inventory.get()
@@ -785,6 +837,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['time:dayChanged'],
             condition: () => typeof TimeSystem !== 'undefined' && TimeSystem.getTotalDays() >= 10
         },
         year_of_trading: {
@@ -796,6 +849,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['time:dayChanged'],
             condition: () => typeof TimeSystem !== 'undefined' && TimeSystem.getTotalDays() >= 365
         },
 
@@ -1242,6 +1296,7 @@ const AchievementSystem = {
             unlocked: false,
             unlockedAt: null,
             hidden: true,
+            dependsOn: ['gold:changed', 'player:gold:changed'],
             condition: () => AchievementSystem.stats.pennyPincherEligible && game.player && game.player.gold >= 10000
         },
         ghost_trader: {
@@ -1324,6 +1379,7 @@ const AchievementSystem = {
             unlocked: false,
             unlockedAt: null,
             hidden: true,
+            dependsOn: ['time:dayChanged', 'gold:changed', 'player:gold:changed'],
             condition: () => {
                 const days = typeof TimeSystem !== 'undefined' ? TimeSystem.getTotalDays() : 999;
                 return days <= 30 && game.player && game.player.gold >= 10000;
@@ -1339,6 +1395,7 @@ const AchievementSystem = {
             unlocked: false,
             unlockedAt: null,
             hidden: true,
+            dependsOn: ['achievement:unlocked'],
             condition: () => {
                 const nonHidden = Object.values(AchievementSystem.achievements).filter(a => !a.hidden && a.id !== 'completionist');
                 return nonHidden.every(a => a.unlocked);
@@ -1358,6 +1415,7 @@ const AchievementSystem = {
             rarity: 'common',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['faction-rep-changed', 'reputation:changed'],
             condition: () => {
                 if (typeof FactionSystem === 'undefined') return false;
                 return Object.keys(FactionSystem.factions).some(f => FactionSystem.getReputation(f) >= 25);
@@ -1372,6 +1430,7 @@ const AchievementSystem = {
             rarity: 'uncommon',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['faction-rep-changed', 'reputation:changed'],
             condition: () => {
                 if (typeof FactionSystem === 'undefined') return false;
                 return Object.keys(FactionSystem.factions).filter(f => FactionSystem.getReputation(f) >= 50).length >= 3;
@@ -1386,6 +1445,7 @@ const AchievementSystem = {
             rarity: 'rare',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['faction-rep-changed', 'reputation:changed'],
             condition: () => {
                 if (typeof FactionSystem === 'undefined') return false;
                 return Object.keys(FactionSystem.factions).some(f => FactionSystem.getReputation(f) >= 100);
@@ -1400,6 +1460,7 @@ const AchievementSystem = {
             rarity: 'legendary',
             unlocked: false,
             unlockedAt: null,
+            dependsOn: ['faction-rep-changed', 'reputation:changed'],
             condition: () => {
                 if (typeof FactionSystem === 'undefined') return false;
                 return Object.keys(FactionSystem.factions).every(f => FactionSystem.getReputation(f) >= 100);
@@ -1434,6 +1495,7 @@ const AchievementSystem = {
                 item: 'blade_of_the_hacker',
                 unlockDebooger: true
             },
+            dependsOn: ['achievement:unlocked'],
             condition: () => {
                 // Must have ALL other achievements unlocked (except this one)
                 const allOthers = Object.values(AchievementSystem.achievements).filter(
@@ -1539,6 +1601,20 @@ const AchievementSystem = {
     _tutorialComplete: false,  // Tutorial done but waiting for first unpause
     _firstUnpauseInNormalWorld: false,  // True after player unpauses in normal world
 
+    //  Event-indexed evaluation - only re-check achievements whose inputs changed
+    _dependencyIndex: null,        // stat key / event name -> achievement ids
+    _dependencyEvents: null,       // event names declared via dependsOn
+    _unindexedAchievements: [],    // no known inputs - checked on every batch
+    _dirtyAchievements: new Set(),
+    _fullSweepPending: false,
+    _evaluationScheduled: false,
+    evaluationStats: {
+        evaluations: 0,    // condition() calls
+        batches: 0,        // per-frame dirty flushes
+        fullSweeps: 0,     // checkAchievements() passes over everything
+        since: Date.now()
+    },
+
     // wake up this monument to your gaming addiction
     init() {
         console.log('🏆 Achievement System awakened from its slumber... waiting for first unpause in normal world');
@@ -1586,6 +1662,9 @@ const AchievementSystem = {
         document.addEventListener('game-unpaused', () => {
             this._onGameUnpaused();
         });
+
+        this._buildDependencyIndex();
+        this._subscribeDependencyEvents();
     },
 
     //  Called on every unpause - check if this is the first unpause in normal world
@@ -1710,11 +1789,22 @@ const AchievementSystem = {
     // Judge every deed - wrapped in safety because even perfection can crash at 3am
     // Collect your hollow victories like trophies of temporary joy
     checkAchievements() {
-        if (!game.player) return;
+        if (!this._canEvaluate()) return;
+
+        //  DEBUG: Log first_journey stats to trace why it's not unlocking 
+        console.log(`🏆 checkAchievements called - journeysStarted: ${this.stats.journeysStarted}, first_journey unlocked: ${this.achievements.first_journey?.unlocked}`);
+
+        this.evaluationStats.fullSweeps++;
+        this._evaluateAchievements(Object.keys(this.achievements));
+    },
+
+    //  Shared gate for every evaluation path - enabled, unpaused in normal world, not in tutorial
+    _canEvaluate() {
+        if (!game.player) return false;
 
         //  FIX: Don't check achievements until tutorial is complete
         if (!this._achievementsEnabled) {
-            return; // Achievements not enabled yet - tutorial not complete
+            return false; // Achievements not enabled yet - tutorial not complete
         }
 
         // ═══════════════════════════════════════════════════════════════
@@ -1722,7 +1812,7 @@ const AchievementSystem = {
         // ═══════════════════════════════════════════════════════════════
         if (!this._firstUnpauseInNormalWorld) {
             console.log('🏆 checkAchievements blocked - no first unpause in normal world yet');
-            return;
+            return false;
         }
 
         // ═══════════════════════════════════════════════════════════════
@@ -1736,17 +1826,22 @@ const AchievementSystem = {
                 this._achievementsEnabled = false;
                 this._firstUnpauseInNormalWorld = false;
             }
-            return;
+            return false;
         }
 
-        //  DEBUG: Log first_journey stats to trace why it's not unlocking 
-        console.log(`🏆 checkAchievements called - journeysStarted: ${this.stats.journeysStarted}, first_journey unlocked: ${this.achievements.first_journey?.unlocked}`);
+        return true;
+    },
 
+    //  Run the conditions for the given ids - locked ones only
+    _evaluateAchievements(ids) {
         const newlyUnlocked = [];
 
-        for (const [id, achievement] of Object.entries(this.achievements)) {
+        for (const id of ids) {
+            const achievement = this.achievements[id];
+            if (!achievement || achievement.unlocked) continue;
+            this.evaluationStats.evaluations++;
             try {
-                if (!achievement.unlocked && achievement.condition()) {
+                if (achievement.condition()) {
                     // Mark as unlocked but don't show popup yet
                     achievement.unlocked = true;
                     achievement.unlockedAt = Date.now();
@@ -1767,7 +1862,195 @@ const AchievementSystem = {
         if (newlyUnlocked.length > 0) {
             this.saveProgress();
             this.queueAchievementPopups(newlyUnlocked);
+            this.markDependenciesChanged('achievement:unlocked');
+        }
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // EVENT-INDEXED EVALUATION
+    // stat/event -> achievements index, dirty set flushed once per frame
+    // ═══════════════════════════════════════════════════════════════
+
+    _buildDependencyIndex() {
+        const index = new Map();
+        const events = new Set();
+        const unindexed = [];
+
+        for (const [id, achievement] of Object.entries(this.achievements)) {
+            const deps = new Set(achievement.dependsOn || []);
+            achievement.dependsOn?.forEach(event => events.add(event));
+            for (const match of String(achievement.condition).matchAll(/AchievementSystem\.stats\.(\w+)/g)) {
+                deps.add(match[1]);
+            }
+            if (deps.size === 0) unindexed.push(id);
+            for (const dep of deps) {
+                if (!index.has(dep)) index.set(dep, []);
+                index.get(dep).push(id);
+            }
+        }
+
+        this._dependencyIndex = index;
+        this._dependencyEvents = events;
+        this._unindexedAchievements = unindexed;
+        return index;
+    },
+
+    _subscribeDependencyEvents() {
+        for (const event of this._dependencyEvents) {
+            const handler = () => this.markDependenciesChanged(event);
+            // some of these go out on EventBus, some as DOM events - listen to both, the dirty set dedupes
+            if (typeof EventBus !== 'undefined') EventBus.on(event, handler);
+            document.addEventListener(event, handler);
+        }
+
+        // daily safety sweep - catches stats other systems poke directly
+        if (typeof EventBus !== 'undefined') {
+            EventBus.on('time:dayChanged', () => this._queueFullSweep());
+        }
+    },
+
+    /**
+     * Flag stat keys or event names as changed - dependent locked achievements
+     * are re-checked together on the next frame
+     * @param {...string} deps - Stat keys (e.g. 'tradesCompleted') or event names
+     */
+    markDependenciesChanged(...deps) {
+        // nothing to do until enabling runs its own full check
+        if (!this._achievementsEnabled) return;
+        if (!this._dependencyIndex) this._buildDependencyIndex();
+        for (const dep of deps) {
+            const ids = this._dependencyIndex.get(dep);
+            if (!ids) continue;
+            for (const id of ids) {
+                if (!this.achievements[id].unlocked) this._dirtyAchievements.add(id);
+            }
+        }
+        if (this._dirtyAchievements.size > 0) this._scheduleEvaluation();
+    },
+
+    _queueFullSweep() {
+        this._fullSweepPending = true;
+        this._scheduleEvaluation();
+    },
+
+    _scheduleEvaluation() {
+        if (this._evaluationScheduled) return;
+        this._evaluationScheduled = true;
+        const run = () => this._flushPendingEvaluations();
+        if (typeof requestAnimationFrame === 'function') {
+            requestAnimationFrame(run);
+        } else {
+            setTimeout(run, 0);
+        }
+    },
+
+    _flushPendingEvaluations() {
+        this._evaluationScheduled = false;
+        const dirty = this._dirtyAchievements;
+        this._dirtyAchievements = new Set();
+
+        if (this._fullSweepPending) {
+            this._fullSweepPending = false;
+            this.checkAchievements();
+            return;
+        }
+        if (dirty.size === 0 || !this._canEvaluate()) return;
+
+        this._unindexedAchievements.forEach(id => dirty.add(id));
+        this.evaluationStats.batches++;
+        this._evaluateAchievements(dirty);
+    },
+
+    /**
+     * Condition evaluation counters since the last reset
+     * @returns {Object} evaluations, batches, fullSweeps, evaluationsPerSecond
+     */
+    getEvaluationStats() {
+        const seconds = Math.max(0.001, (Date.now() - this.evaluationStats.since) / 1000);
+        return {
+            ...this.evaluationStats,
+            seconds: +seconds.toFixed(1),
+            evaluationsPerSecond: +(this.evaluationStats.evaluations / seconds).toFixed(1),
+            indexedDependencies: this._dependencyIndex?.size || 0
+        };
+    },
+
+    resetEvaluationStats() {
+        this.evaluationStats = { evaluations: 0, batches: 0, fullSweeps: 0, since: Date.now() };
+    },
+
+    // dry-run conditions without unlocking anything - benchmark only
+    _countConditionCalls(ids) {
+        let calls = 0;
+        for (const id of ids) {
+            const achievement = this.achievements[id];
+            if (!achievement || achievement.unlocked) continue;
+            calls++;
+            try { achievement.condition(); } catch (e) { /* broken condition still counts */ }
         }
+        return calls;
+    },
+
+    /**
+     * Compare condition evaluations/sec: full sweep per track call (old) vs
+     * dirty set flushed once per frame (new), for a simulated burst of play
+     * @param {Object} [options] - { seconds, tradesPerSecond, journeysPerSecond, fps }
+     * @returns {Array} Rows printed with console.table
+     */
+    benchmarkEvaluation({ seconds = 10, tradesPerSecond = 5, journeysPerSecond = 1, fps = 60 } = {}) {
+        if (!this._dependencyIndex) this._buildDependencyIndex();
+        const allIds = Object.keys(this.achievements);
+
+        // per-frame event list - what the track* calls and EventBus fire
+        const frames = [];
+        let tradeCount = 0;
+        for (let f = 0; f < seconds * fps; f++) {
+            const frame = [];
+            const trades = Math.floor((f + 1) * tradesPerSecond / fps) - Math.floor(f * tradesPerSecond / fps);
+            for (let t = 0; t < trades; t++) {
+                tradeCount++;
+                // old trackTrade ran a second full sweep on big profits
+                const bigProfit = tradeCount % 4 === 0;
+                frame.push({ legacyChecks: bigProfit ? 2 : 1, deps: ['tradesCompleted', 'totalGoldEarned', 'highestProfit', 'gold:changed', 'player:gold:changed', 'inventory:item:added'] });
+            }
+            const journeys = Math.floor((f + 1) * journeysPerSecond / fps) - Math.floor(f * journeysPerSecond / fps);
+            for (let j = 0; j < journeys; j++) {
+                frame.push({ legacyChecks: 1, deps: ['journeysStarted'] });
+                frame.push({ legacyChecks: 2, deps: ['uniqueLocationsVisited', 'locationsVisited', 'journeysCompleted', 'distanceTraveled'] });
+            }
+            frames.push(frame);
+        }
+
+        let legacyCalls = 0;
+        let start = performance.now();
+        for (const frame of frames) {
+            for (const entry of frame) {
+                for (let c = 0; c < entry.legacyChecks; c++) legacyCalls += this._countConditionCalls(allIds);
+            }
+        }
+        const legacyMs = performance.now() - start;
+
+        let indexedCalls = 0;
+        start = performance.now();
+        for (const frame of frames) {
+            if (frame.length === 0) continue;
+            const dirty = new Set(this._unindexedAchievements);
+            for (const entry of frame) {
+                for (const dep of entry.deps) {
+                    this._dependencyIndex.get(dep)?.forEach(id => dirty.add(id));
+                }
+            }
+            indexedCalls += this._countConditionCalls(dirty);
+        }
+        const indexedMs = performance.now() - start;
+
+        const rows = [
+            { mode: 'full sweep per track call', conditionCalls: legacyCalls, evaluationsPerSecond: +(legacyCalls / seconds).toFixed(1), ms: +legacyMs.toFixed(2) },
+            { mode: 'indexed, batched per frame', conditionCalls: indexedCalls, evaluationsPerSecond: +(indexedCalls / seconds).toFixed(1), ms: +indexedMs.toFixed(2) }
+        ];
+        console.log(`🏆 Achievement evaluation benchmark: ${seconds}s of play, ${tradesPerSecond} trades/s, ${journeysPerSecond} journeys/s, ${allIds.length} achievements`);
+        console.table(rows);
+        return rows;
     },
 
     // Unlock a single achievement directly (for manual unlocks)
@@ -1798,6 +2081,7 @@ const AchievementSystem = {
 
         // Queue and show popup
         this.queueAchievementPopups([achievement]);
+        this.markDependenciesChanged('achievement:unlocked');
 
         console.log(`Achievement unlocked: ${achievement.name}`);
     },
@@ -2448,10 +2732,7 @@ const AchievementSystem = {
         if (profit > AchievementSystem.stats.highestProfit) {
             AchievementSystem.stats.highestProfit = profit;
         }
-        if (profit >= 500) {
-            this.checkAchievements();
-        }
-        this.checkAchievements();
+        this.markDependenciesChanged('tradesCompleted', 'totalGoldEarned', 'highestProfit');
     },
 
     // track location visit - blocked in tutorial OR before first unpause
@@ -2467,7 +2748,7 @@ const AchievementSystem = {
         }
         AchievementSystem.stats.uniqueLocationsVisited.add(locationId);
         AchievementSystem.stats.locationsVisited = AchievementSystem.stats.uniqueLocationsVisited.size;
-        this.checkAchievements();
+        this.markDependenciesChanged('uniqueLocationsVisited', 'locationsVisited');
     },
 
     // track journey start - blocked in tutorial OR before first unpause
@@ -2483,7 +2764,7 @@ const AchievementSystem = {
         }
         AchievementSystem.stats.journeysStarted++;
         console.log(`🗺️ Journey started to ${destinationId}! Total: ${AchievementSystem.stats.journeysStarted}`);
-        this.checkAchievements();
+        this.markDependenciesChanged('journeysStarted');
     },
 
     // track journey completion - blocked in tutorial OR before first unpause
@@ -2499,7 +2780,7 @@ const AchievementSystem = {
         }
         AchievementSystem.stats.journeysCompleted++;
         AchievementSystem.stats.distanceTraveled += distance;
-        this.checkAchievements();
+        this.markDependenciesChanged('journeysCompleted', 'distanceTraveled');
     },
 
     // track encounter survival - blocked in tutorial OR before first unpause
@@ -2523,7 +2804,7 @@ const AchievementSystem = {
         if (survived && game.player && game.player.gold < 10) {
             AchievementSystem.stats.narrowEscapes++;
         }
-        this.checkAchievements();
+        this.markDependenciesChanged('encountersSurvived', 'banditsDefeated', 'narrowEscapes');
     },
 
     // track treasure found - blocked in tutorial OR before first unpause
@@ -2538,7 +2819,7 @@ const AchievementSystem = {
             return;
         }
         AchievementSystem.stats.treasuresFound++;
-        this.checkAchievements();
+        this.markDependenciesChanged('treasuresFound');
     },
 
     // track rags to riches - blocked in tutorial OR before first unpause
@@ -2556,7 +2837,7 @@ const AchievementSystem = {
             if (game.player.gold >= 5000) {
                 // crawled up from poverty's depths
                 AchievementSystem.stats.ragsToRiches = true;
-                this.checkAchievements();
+                this.markDependenciesChanged('ragsToRiches');
             }
         }
     },
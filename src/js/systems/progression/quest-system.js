@@ -930,7 +930,15 @@ const QuestSystem = {
             console.warn('   ⚠️ SideQuests not found - regional side quests unavailable');
         }
 
-        //  DOOM QUESTS (15 quests + Greedy Won Boss)
+        //  DOOM QUESTS - usually not here yet, ModuleLoader brings them in
+        // behind the main menu and calls loadDoomQuests() when they land
+        this.loadDoomQuests();
+
+        console.log('📦 External quest loading complete');
+    },
+
+    //  DOOM QUESTS (15 quests + Greedy Won Boss)
+    loadDoomQuests() {
         if (typeof DoomQuests !== 'undefined') {
             let doomLoaded = 0;
             const doomQuestsList = DoomQuests.getAllQuests?.() || [];
@@ -945,11 +953,11 @@ const QuestSystem = {
             this.doomItems = DoomQuests.doomItems;
             this.greedyWon = DoomQuests.greedyWon;
             console.log(`   💀 DoomQuests loaded: ${doomLoaded} quests + Greedy Won boss`);
+        } else if (typeof ModuleLoader !== 'undefined' && ModuleLoader.isDeferred('DoomQuests')) {
+            console.log('   💀 DoomQuests arrive with the doom module - merging them then');
         } else {
             console.warn('   ⚠️ DoomQuests not found - Doom World content unavailable');
         }
-
-        console.log('📦 External quest loading complete');
     },
 
     // 
@@ -5695,4 +5703,9 @@ Bootstrap.register('QuestSystem', () => QuestSystem.init(), {
     severity: 'required'
 });
 
+// doom quests come in with the doom module, after the main menu is up
+if (typeof ModuleLoader !== 'undefined') {
+    ModuleLoader.onLoad('doom', () => QuestSystem.loadDoomQuests());
+}
+
 console.log('📜 QuestSystem loaded... your suffering awaits');
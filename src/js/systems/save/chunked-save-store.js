@@ -0,0 +1,460 @@
+//
+// CHUNKED SAVE STORE - only write the parts of your life that changed
+//
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+//
+// saves are split into per-system chunks (player, timeState, npcRelationships,
+// dynamicMarketState, ...). each chunk is hashed and stored once under its hash,
+// so an autosave only writes chunks that changed since the last one.
+// chunks are compressed to binary in a Worker and kept in IndexedDB, with a
+// base64 localStorage fallback. the manifest stays in localStorage under the
+// usual save key so the settings panel can still list it.
+
+const ChunkedSaveStore = {
+    MANIFEST_PREFIX: 'CS:',
+    FORMAT: 'chunked-v1',
+    DB_NAME: 'MedievalTradingGameSaves',
+    DB_STORE: 'chunks',
+    LOCAL_CHUNK_PREFIX: 'tradingGameChunk_',
+
+    _db: null,
+    _dbPromise: null,
+    _backend: null,          // 'indexeddb' | 'localstorage'
+    _knownChunks: null,      // hashes already in storage
+    _worker: null,
+    _workerFailed: false,
+    _pending: new Map(),
+    _nextRequestId: 1,
+    _lock: Promise.resolve(), // writes, reads and garbage collection run one at a time
+
+    // last save/load timings - read by the benchmark and the debooger
+    lastStats: null,
+
+    //
+    // storage backend - IndexedDB first, localStorage when it's not there
+    //
+
+    async _openStorage() {
+        if (this._backend) return this._backend;
+        if (this._dbPromise) return this._dbPromise;
+
+        this._dbPromise = new Promise((resolve) => {
+            if (typeof indexedDB === 'undefined') {
+                this._backend = 'localstorage';
+                resolve(this._backend);
+                return;
+            }
+            try {
+                const request = indexedDB.open(this.DB_NAME, 1);
+                request.onupgradeneeded = () => {
+                    request.result.createObjectStore(this.DB_STORE);
+                };
+                request.onsuccess = () => {
+                    this._db = request.result;
+                    this._backend = 'indexeddb';
+                    resolve(this._backend);
+                };
+                request.onerror = () => {
+                    console.warn('💾 ChunkedSaveStore: IndexedDB unavailable, using localStorage');
+                    this._backend = 'localstorage';
+                    resolve(this._backend);
+                };
+            } catch (e) {
+                // private mode in some browsers throws on open
+                this._backend = 'localstorage';
+                resolve(this._backend);
+            }
+        });
+        return this._dbPromise;
+    },
+
+    _idbRequest(mode, action) {
+        return new Promise((resolve, reject) => {
+            const tx = this._db.transaction(this.DB_STORE, mode);
+            const request = action(tx.objectStore(this.DB_STORE));
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    },
+
+    async _putChunk(hash, record) {
+        if (await this._openStorage() === 'indexeddb') {
+            await this._idbRequest('readwrite', store => store.put(record, hash));
+        } else {
+            localStorage.setItem(this.LOCAL_CHUNK_PREFIX + hash, JSON.stringify({
+                encoding: record.encoding,
+                data: this._bytesToBase64(record.data)
+            }));
+        }
+        this._knownChunks?.add(hash);
+    },
+
+    async _getChunk(hash) {
+        if (await this._openStorage() === 'indexeddb') {
+            return this._idbRequest('readonly', store => store.get(hash));
+        }
+        const raw = localStorage.getItem(this.LOCAL_CHUNK_PREFIX + hash);
+        if (!raw) return null;
+        const parsed = JSON.parse(raw);
+        return { encoding: parsed.encoding, data: this._base64ToBytes(parsed.data) };
+    },
+
+    async _deleteChunk(hash) {
+        if (await this._openStorage() === 'indexeddb') {
+            await this._idbRequest('readwrite', store => store.delete(hash));
+        } else {
+            localStorage.removeItem(this.LOCAL_CHUNK_PREFIX + hash);
+        }
+        this._knownChunks?.delete(hash);
+    },
+
+    async _listChunks() {
+        if (await this._openStorage() === 'indexeddb') {
+            return this._idbRequest('readonly', store => store.getAllKeys());
+        }
+        const keys = [];
+        for (let i = 0; i < localStorage.length; i++) {
+            const key = localStorage.key(i);
+            if (key?.startsWith(this.LOCAL_CHUNK_PREFIX)) {
+                keys.push(key.slice(this.LOCAL_CHUNK_PREFIX.length));
+            }
+        }
+        return keys;
+    },
+
+    async _getKnownChunks() {
+        if (!this._knownChunks) {
+            this._knownChunks = new Set(await this._listChunks());
+        }
+        return this._knownChunks;
+    },
+
+    //
+    // compression worker - gzip via CompressionStream, off the main thread
+    //
+
+    _getWorkerCode() {
+        return `
+            async function pump(stream) {
+                return new Uint8Array(await new Response(stream).arrayBuffer());
+            }
+            async function compress(text) {
+                const bytes = new TextEncoder().encode(text);
+                if (typeof CompressionStream === 'undefined') return { encoding: 'utf8', data: bytes };
+                const stream = new Blob([bytes]).stream().pipeThrough(new CompressionStream('gzip'));
+                return { encoding: 'gzip', data: await pump(stream) };
+            }
+            async function decompress(encoding, data) {
+                if (encoding === 'gzip') {
+                    const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('gzip'));
+                    data = await pump(stream);
+                }
+                return new TextDecoder().decode(data);
+            }
+            self.onmessage = async (e) => {
+                const { id, type, text, encoding, data } = e.data;
+                try {
+                    if (type === 'compress') {
+                        const result = await compress(text);
+                        self.postMessage({ id, ok: true, encoding: result.encoding, data: result.data }, [result.data.buffer]);
+                    } else {
+                        self.postMessage({ id, ok: true, text: await decompress(encoding, data) });
+                    }
+                } catch (err) {
+                    self.postMessage({ id, ok: false, error: err.message });
+                }
+            };
+        `;
+    },
+
+    _getWorker() {
+        if (this._worker || this._workerFailed) return this._worker;
+        try {
+            const blob = new Blob([this._getWorkerCode()], { type: 'application/javascript' });
+            this._worker = new Worker(URL.createObjectURL(blob));
+            this._worker.onmessage = (e) => {
+                const pending = this._pending.get(e.data.id);
+                if (!pending) return;
+                this._pending.delete(e.data.id);
+                if (e.data.ok) pending.resolve(e.data);
+                else pending.reject(new Error(e.data.error));
+            };
+            this._worker.onerror = (e) => {
+                console.warn('💾 ChunkedSaveStore: compression worker died, compressing inline', e.message);
+                this._workerFailed = true;
+                this._worker = null;
+                for (const pending of this._pending.values()) pending.reject(new Error('worker error'));
+                this._pending.clear();
+            };
+        } catch (e) {
+            this._workerFailed = true;
+            this._worker = null;
+        }
+        return this._worker;
+    },
+
+    _callWorker(message, transfer = []) {
+        const worker = this._getWorker();
+        if (!worker) return null;
+        const id = this._nextRequestId++;
+        return new Promise((resolve, reject) => {
+            this._pending.set(id, { resolve, reject });
+            worker.postMessage({ ...message, id }, transfer);
+        });
+    },
+
+    // inline fallback - same format as the worker, just on this thread
+    async _compressInline(text) {
+        const bytes = new TextEncoder().encode(text);
+        if (typeof CompressionStream === 'undefined') return { encoding: 'utf8', data: bytes };
+        const stream = new Blob([bytes]).stream().pipeThrough(new CompressionStream('gzip'));
+        return { encoding: 'gzip', data: new Uint8Array(await new Response(stream).arrayBuffer()) };
+    },
+
+    async _decompressInline(encoding, data) {
+        if (encoding === 'gzip') {
+            const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('gzip'));
+            data = new Uint8Array(await new Response(stream).arrayBuffer());
+        }
+        return new TextDecoder().decode(data);
+    },
+
+    async _compress(text) {
+        const viaWorker = this._callWorker({ type: 'compress', text });
+        if (viaWorker) {
+            try {
+                const result = await viaWorker;
+                return { encoding: result.encoding, data: result.data };
+            } catch (e) {
+                // fall through to inline
+            }
+        }
+        return this._compressInline(text);
+    },
+
+    async _decompress(encoding, data) {
+        const viaWorker = this._callWorker({ type: 'decompress', encoding, data });
+        if (viaWorker) {
+            try {
+                return (await viaWorker).text;
+            } catch (e) {
+                // fall through to inline
+            }
+        }
+        return this._decompressInline(encoding, data);
+    },
+
+    //
+    // hashing + base64 helpers
+    //
+
+    // chunk id - cyrb53 plus the length, so existing saves keep their hashes
+    hashString(str, seed = 0) {
+        return StringHash.cyrb53(str, seed) + str.length.toString(36);
+    },
+
+    _bytesToBase64(bytes) {
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    },
+
+    _base64ToBytes(base64) {
+        const binary = atob(base64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        return bytes;
+    },
+
+    // chain a task behind whatever store operation is running - a collection must never
+    // see chunks a write has stored but not yet put in its manifest
+    _withLock(task) {
+        const run = this._lock.then(task);
+        this._lock = run.catch(() => {});
+        return run;
+    },
+
+    //
+    // manifests - live in localStorage under the normal save key
+    //
+
+    isManifest(raw) {
+        return typeof raw === 'string' && raw.startsWith(this.MANIFEST_PREFIX);
+    },
+
+    parseManifest(raw) {
+        if (!this.isManifest(raw)) return null;
+        try {
+            return JSON.parse(raw.slice(this.MANIFEST_PREFIX.length));
+        } catch (e) {
+            return null;
+        }
+    },
+
+    // enough of the save to list it without touching any chunk
+    _buildSummary(gameData) {
+        return {
+            player: gameData.player ? { name: gameData.player.name, gold: gameData.player.gold, level: gameData.player.level } : null,
+            currentLocation: gameData.currentLocation ? { name: gameData.currentLocation.name } : null,
+            timeState: gameData.timeState?.currentTime ? { currentTime: { ...gameData.timeState.currentTime } } : null
+        };
+    },
+
+    /**
+     * Write a save as chunks - only chunks whose hash isn't stored yet get compressed and written
+     * @param {string} saveKey - localStorage key for the manifest (e.g. tradingGameAutoSave_3)
+     * @param {Object} saveData - Full save object from SaveManager.getCompleteGameState()
+     * @returns {Promise<Object>} Stats: chunks, written, bytesWritten, serializeMs, totalMs
+     */
+    writeSave(saveKey, saveData) {
+        return this._withLock(() => this._writeSave(saveKey, saveData));
+    },
+
+    async _writeSave(saveKey, saveData) {
+        const start = performance.now();
+        const gameData = saveData.gameData || {};
+
+        // one consistent snapshot - stringify every chunk before yielding
+        const serialized = [];
+        for (const [name, value] of Object.entries(gameData)) {
+            if (value === undefined) continue;
+            const text = JSON.stringify(value);
+            serialized.push({ name, text, hash: this.hashString(text) });
+        }
+        const summary = this._buildSummary(gameData);
+        const serializeMs = performance.now() - start;
+
+        const known = await this._getKnownChunks();
+        const chunks = {};
+        let written = 0;
+        let bytesWritten = 0;
+        let rawBytes = 0;
+
+        for (const chunk of serialized) {
+            chunks[chunk.name] = chunk.hash;
+            rawBytes += chunk.text.length;
+            if (known.has(chunk.hash)) continue;
+
+            const compressed = await this._compress(chunk.text);
+            await this._putChunk(chunk.hash, compressed);
+            written++;
+            bytesWritten += compressed.data.byteLength;
+        }
+
+        const manifest = {
+            format: this.FORMAT,
+            version: saveData.version,
+            _saveFormat: saveData._saveFormat,
+            timestamp: saveData.timestamp,
+            chunks,
+            summary
+        };
+        localStorage.setItem(saveKey, this.MANIFEST_PREFIX + JSON.stringify(manifest));
+
+        await this._collectGarbage();
+
+        this.lastStats = {
+            op: 'write',
+            backend: this._backend,
+            chunks: serialized.length,
+            written,
+            bytesWritten,
+            rawBytes,
+            serializeMs: +serializeMs.toFixed(2),
+            totalMs: +(performance.now() - start).toFixed(2)
+        };
+        return this.lastStats;
+    },
+
+    /**
+     * Read a chunked save back into the normal save object shape
+     * @param {string|Object} manifestOrRaw - Raw localStorage string or parsed manifest
+     * @returns {Promise<Object|null>} { version, _saveFormat, timestamp, gameData } or null when a chunk is missing
+     */
+    readSave(manifestOrRaw) {
+        return this._withLock(() => this._readSave(manifestOrRaw));
+    },
+
+    async _readSave(manifestOrRaw) {
+        const start = performance.now();
+        const manifest = typeof manifestOrRaw === 'string' ? this.parseManifest(manifestOrRaw) : manifestOrRaw;
+        if (!manifest?.chunks) return null;
+
+        const names = Object.keys(manifest.chunks);
+        const texts = await Promise.all(names.map(async (name) => {
+            const record = await this._getChunk(manifest.chunks[name]);
+            if (!record) throw new Error(`missing chunk ${name}`);
+            return this._decompress(record.encoding, record.data);
+        })).catch((e) => {
+            console.warn('💾 ChunkedSaveStore: save is missing data -', e.message);
+            return null;
+        });
+        if (!texts) return null;
+
+        const gameData = {};
+        names.forEach((name, i) => { gameData[name] = JSON.parse(texts[i]); });
+
+        this.lastStats = {
+            op: 'read',
+            backend: this._backend,
+            chunks: names.length,
+            totalMs: +(performance.now() - start).toFixed(2)
+        };
+
+        return {
+            version: manifest.version,
+            _saveFormat: manifest._saveFormat,
+            timestamp: manifest.timestamp,
+            gameData
+        };
+    },
+
+    // every hash still referenced by a manifest in localStorage
+    _collectReferencedChunks() {
+        const referenced = new Set();
+        for (let i = 0; i < localStorage.length; i++) {
+            const key = localStorage.key(i);
+            if (!key || key.startsWith(this.LOCAL_CHUNK_PREFIX)) continue;
+            const raw = localStorage.getItem(key);
+            if (!this.isManifest(raw)) continue;
+            const manifest = this.parseManifest(raw);
+            for (const hash of Object.values(manifest?.chunks || {})) referenced.add(hash);
+        }
+        return referenced;
+    },
+
+    // drop chunks no manifest points at (deleted or rotated-out saves)
+    collectGarbage() {
+        return this._withLock(() => this._collectGarbage());
+    },
+
+    async _collectGarbage() {
+        const referenced = this._collectReferencedChunks();
+        const known = await this._getKnownChunks();
+        let removed = 0;
+        for (const hash of Array.from(known)) {
+            if (!referenced.has(hash)) {
+                await this._deleteChunk(hash);
+                removed++;
+            }
+        }
+        return removed;
+    },
+
+    // total bytes held in chunk storage - for the settings storage meter and benchmarks
+    async getStorageBytes() {
+        let total = 0;
+        for (const hash of await this._getKnownChunks()) {
+            const record = await this._getChunk(hash);
+            if (record?.data) total += record.data.byteLength;
+        }
+        return total;
+    }
+};
+
+window.ChunkedSaveStore = ChunkedSaveStore;
@@ -99,6 +99,9 @@ const SaveManager = {
     currentSaveSlot: null,
     lastAutoSave: Date.now(),
     isAutoSaving: false,
+    _autoSavePromise: null, // chunked autosave still writing - the next one waits for it
+    // autosaves go through ChunkedSaveStore - only changed per-system chunks get written
+    useChunkedAutoSave: true,
     _selectedSaveSlot: null,
     _selectedLoadSlot: null,
     _selectedLoadType: 'manual',
@@ -478,6 +481,10 @@ const SaveManager = {
                 dynamicMarketState: typeof DynamicMarketSystem !== 'undefined' && DynamicMarketSystem.getSaveData
                     ? DynamicMarketSystem.getSaveData()
                     : null,
+                // Market price history - day rollups per city/item, compact rows
+                priceHistoryState: typeof MarketPriceHistory !== 'undefined' && MarketPriceHistory.getSaveData
+                    ? MarketPriceHistory.getSaveData()
+                    : null,
                 // World state manager - location, world state, doom visited locations
                 worldStateManagerData: typeof WorldStateManager !== 'undefined' && WorldStateManager.getSaveData
                     ? WorldStateManager.getSaveData()
@@ -644,21 +651,35 @@ const SaveManager = {
     },
 
     trimSaveData(saveData) {
-        const trimmed = JSON.parse(JSON.stringify(saveData));
-        if (trimmed.gameData) {
-            // Limit arrays
-            if (trimmed.gameData.tradingState?.tradeHistory) {
-                trimmed.gameData.tradingState.tradeHistory = trimmed.gameData.tradingState.tradeHistory.slice(-20);
-            }
-            if (trimmed.gameData.eventState?.scheduledEvents) {
-                trimmed.gameData.eventState.scheduledEvents = trimmed.gameData.eventState.scheduledEvents.slice(-20);
-            }
-        }
-        return trimmed;
+        // shallow copies down the trimmed paths only - the full deep clone cost
+        // a second stringify+parse of the whole save on every write
+        if (!saveData?.gameData) return saveData;
+        const gameData = { ...saveData.gameData };
+        // Limit arrays
+        if (gameData.tradingState?.tradeHistory) {
+            gameData.tradingState = { ...gameData.tradingState, tradeHistory: gameData.tradingState.tradeHistory.slice(-20) };
+        }
+        if (gameData.eventState?.scheduledEvents) {
+            gameData.eventState = { ...gameData.eventState, scheduledEvents: gameData.eventState.scheduledEvents.slice(-20) };
+        }
+        return { ...saveData, gameData };
     },
 
     decompressSaveData(compressedData) {
         try {
+            // chunked saves only carry a manifest here - hand back the summary so
+            // lists can render it, loaders pull the chunks via loadChunkedSave()
+            if (typeof ChunkedSaveStore !== 'undefined' && ChunkedSaveStore.isManifest(compressedData)) {
+                const manifest = ChunkedSaveStore.parseManifest(compressedData);
+                if (!manifest) return null;
+                return {
+                    version: manifest.version,
+                    _saveFormat: manifest._saveFormat,
+                    timestamp: manifest.timestamp,
+                    gameData: manifest.summary || {},
+                    _chunkManifest: manifest
+                };
+            }
             if (compressedData.startsWith('UC:')) {
                 return JSON.parse(this.unicodeDecompress(compressedData.slice(3)));
             }
@@ -1162,14 +1183,12 @@ const SaveManager = {
         }
 
         //  Restore additional system states 
-        // Doom World
-        if (gameData.doomWorldState && typeof DoomWorldSystem !== 'undefined' && DoomWorldSystem.loadSaveData) {
-            try {
-                DoomWorldSystem.loadSaveData(gameData.doomWorldState);
-                console.log('🖤 Doom world state restored');
-            } catch (e) {
-                console.warn('🖤 Failed to restore doom world state:', e.message);
-            }
+        // Doom World + dungeon exploration stream in behind the main menu -
+        // a quick Load click can beat them here, so their state waits for them
+        if (typeof ModuleLoader !== 'undefined' && !ModuleLoader.isLoaded('gameplay')) {
+            ModuleLoader.load('gameplay').then(() => this._restoreGameplayModuleState(gameData));
+        } else {
+            this._restoreGameplayModuleState(gameData);
         }
 
         // Weather System
@@ -1267,16 +1286,6 @@ const SaveManager = {
             }
         }
 
-        //  Dungeon exploration state - boss progress and defeated bosses
-        if (gameData.explorationState && typeof DungeonExplorationSystem !== 'undefined' && DungeonExplorationSystem.loadBossState) {
-            try {
-                DungeonExplorationSystem.loadBossState(gameData.explorationState);
-                console.log('🖤 Dungeon exploration state restored');
-            } catch (e) {
-                console.warn('🖤 Failed to restore dungeon exploration state:', e.message);
-            }
-        }
-
         // 💰 Financial tracker state - weekly totals and transaction history
         if (gameData.financialState && typeof FinancialTracker !== 'undefined' && FinancialTracker.loadSaveData) {
             try {
@@ -1317,6 +1326,16 @@ const SaveManager = {
             }
         }
 
+        // 📈 Market price history - per-slot, so trends don't leak between saves
+        if (typeof MarketPriceHistory !== 'undefined' && MarketPriceHistory.loadSaveData) {
+            try {
+                MarketPriceHistory.loadSaveData(gameData.priceHistoryState || null);
+                console.log('📈 Market price history restored');
+            } catch (e) {
+                console.warn('📈 Failed to restore market price history:', e.message);
+            }
+        }
+
         // 🗺️ World state manager - location, world state, doom visited locations
         if (gameData.worldStateManagerData && typeof WorldStateManager !== 'undefined' && WorldStateManager.loadSaveData) {
             try {
@@ -1328,6 +1347,29 @@ const SaveManager = {
         }
     },
 
+    // state owned by the ModuleLoader 'gameplay' stage (doom + exploration)
+    _restoreGameplayModuleState(gameData) {
+        // Doom World
+        if (gameData.doomWorldState && typeof DoomWorldSystem !== 'undefined' && DoomWorldSystem.loadSaveData) {
+            try {
+                DoomWorldSystem.loadSaveData(gameData.doomWorldState);
+                console.log('🖤 Doom world state restored');
+            } catch (e) {
+                console.warn('🖤 Failed to restore doom world state:', e.message);
+            }
+        }
+
+        //  Dungeon exploration state - boss progress and defeated bosses
+        if (gameData.explorationState && typeof DungeonExplorationSystem !== 'undefined' && DungeonExplorationSystem.loadBossState) {
+            try {
+                DungeonExplorationSystem.loadBossState(gameData.explorationState);
+                console.log('🖤 Dungeon exploration state restored');
+            } catch (e) {
+                console.warn('🖤 Failed to restore dungeon exploration state:', e.message);
+            }
+        }
+    },
+
     //
     // AUTO-SAVE & QUICK SAVE
     //
@@ -1341,56 +1383,73 @@ const SaveManager = {
      */
     autoSave(silent = false) {
         const now = Date.now();
-        if (now - this.lastAutoSave < 30000 || this.isAutoSaving) return;
+        if (now - this.lastAutoSave < 30000 || this.isAutoSaving || this._autoSavePromise) return;
 
         this.isAutoSaving = true;
         try {
             const saveData = this.getCompleteGameState();
             if (!saveData) return;
 
-            const compressedData = this.compressSaveData(saveData);
             const saveKey = `tradingGameAutoSave_${this.currentAutoSaveIndex}`;
+            if (this.useChunkedAutoSave && typeof ChunkedSaveStore !== 'undefined') {
+                // async - _autoSavePromise holds off the next autosave until the chunks land
+                this._autoSavePromise = ChunkedSaveStore.writeSave(saveKey, this.trimSaveData(saveData))
+                    .then(() => this._recordAutoSave(now, silent))
+                    .catch((e) => {
+                        console.warn('💾 Chunked autosave failed, falling back to single-blob save:', e);
+                        localStorage.setItem(saveKey, this.compressSaveData(saveData));
+                        this._recordAutoSave(now, silent);
+                    })
+                    .finally(() => { this._autoSavePromise = null; });
+                return;
+            }
+
+            const compressedData = this.compressSaveData(saveData);
             localStorage.setItem(saveKey, compressedData);
+            this._recordAutoSave(now, silent);
+        } finally {
+            this.isAutoSaving = false;
+        }
+    },
 
-            const slotInfo = {
-                index: this.currentAutoSaveIndex,
-                timestamp: now,
-                formattedTime: new Date().toLocaleString(),
-                playerName: game.player?.name || 'Unknown',
-                gold: game.player?.gold || 0,
-                location: game.currentLocation?.name || 'Unknown',
-                day: typeof TimeSystem !== 'undefined' ? TimeSystem.currentTime?.day || 1 : 1
-            };
+    // slot metadata + rotation after an autosave write landed
+    _recordAutoSave(now, silent) {
+        const slotInfo = {
+            index: this.currentAutoSaveIndex,
+            timestamp: now,
+            formattedTime: new Date().toLocaleString(),
+            playerName: game.player?.name || 'Unknown',
+            gold: game.player?.gold || 0,
+            location: game.currentLocation?.name || 'Unknown',
+            day: typeof TimeSystem !== 'undefined' ? TimeSystem.currentTime?.day || 1 : 1
+        };
 
-            const existingIdx = this.autoSaveSlots.findIndex(s => s.index === this.currentAutoSaveIndex);
-            if (existingIdx >= 0) {
-                this.autoSaveSlots[existingIdx] = slotInfo;
-            } else {
-                this.autoSaveSlots.push(slotInfo);
-            }
+        const existingIdx = this.autoSaveSlots.findIndex(s => s.index === this.currentAutoSaveIndex);
+        if (existingIdx >= 0) {
+            this.autoSaveSlots[existingIdx] = slotInfo;
+        } else {
+            this.autoSaveSlots.push(slotInfo);
+        }
 
-            this.autoSaveSlots.sort((a, b) => b.timestamp - a.timestamp);
-            if (this.autoSaveSlots.length > this.maxAutoSaveSlots) {
-                const removed = this.autoSaveSlots.pop();
-                localStorage.removeItem(`tradingGameAutoSave_${removed.index}`);
-            }
+        this.autoSaveSlots.sort((a, b) => b.timestamp - a.timestamp);
+        if (this.autoSaveSlots.length > this.maxAutoSaveSlots) {
+            const removed = this.autoSaveSlots.pop();
+            localStorage.removeItem(`tradingGameAutoSave_${removed.index}`);
+        }
 
-            this.currentAutoSaveIndex = (this.currentAutoSaveIndex + 1) % this.maxAutoSaveSlots;
-            this.saveSaveSlotsMetadata();
-            this.lastAutoSave = now;
+        this.currentAutoSaveIndex = (this.currentAutoSaveIndex + 1) % this.maxAutoSaveSlots;
+        this.saveSaveSlotsMetadata();
+        this.lastAutoSave = now;
 
-            if (!silent && typeof addMessage === 'function') {
-                addMessage('💾 Auto-saved!', 'info');
-            }
-        } finally {
-            this.isAutoSaving = false;
+        if (!silent && typeof addMessage === 'function') {
+            addMessage('💾 Auto-saved!', 'info');
         }
     },
 
     /**
      * Load game state from an auto-save slot
      * @param {number} slotIndex - Auto-save slot index (0-9)
-     * @returns {boolean} True if load succeeded, false otherwise
+     * @returns {boolean|Promise<boolean>} True if load succeeded - chunked autosaves resolve async
      */
     loadAutoSave(slotIndex) {
         const saveData = localStorage.getItem(`tradingGameAutoSave_${slotIndex}`);
@@ -1399,6 +1458,10 @@ const SaveManager = {
             return false;
         }
 
+        if (typeof ChunkedSaveStore !== 'undefined' && ChunkedSaveStore.isManifest(saveData)) {
+            return this.loadChunkedSave(saveData);
+        }
+
         try {
             let parsed = this.decompressSaveData(saveData);
             //  Apply migrations if needed 
@@ -1412,6 +1475,121 @@ const SaveManager = {
         }
     },
 
+    /**
+     * Load a chunked (manifest + chunk store) save
+     * @param {string} rawManifest - The CS: string from localStorage
+     * @returns {Promise<boolean>} Resolves true if load succeeded
+     */
+    async loadChunkedSave(rawManifest) {
+        try {
+            let parsed = await ChunkedSaveStore.readSave(rawManifest);
+            if (!parsed) {
+                if (typeof addMessage === 'function') addMessage('Auto-save is missing data!', 'error');
+                return false;
+            }
+            parsed = this.migrateSaveData(parsed);
+            this.loadGameState(parsed.gameData);
+            if (typeof addMessage === 'function') addMessage('Auto-save loaded!', 'success');
+            return true;
+        } catch (e) {
+            console.error('Failed to load chunked auto-save:', e);
+            return false;
+        }
+    },
+
+    /**
+     * Turn any stored save string into a self-contained one (chunked manifests get inflated)
+     * @param {string} raw - Raw localStorage value
+     * @returns {Promise<string>} Portable save string - used by save export
+     */
+    async toPortableSaveString(raw) {
+        if (typeof ChunkedSaveStore === 'undefined' || !ChunkedSaveStore.isManifest(raw)) return raw;
+        const full = await ChunkedSaveStore.readSave(raw);
+        return full ? this.compressSaveData(full) : raw;
+    },
+
+    /**
+     * Compare the single-blob save format with chunked/delta saves
+     * @param {Object} [options] - { iterations }
+     * @returns {Promise<Array>} Rows printed with console.table
+     */
+    async benchmarkSaveFormats({ iterations = 5 } = {}) {
+        if (typeof ChunkedSaveStore === 'undefined') {
+            console.warn('💾 benchmarkSaveFormats: ChunkedSaveStore not loaded');
+            return [];
+        }
+        const saveData = this.getCompleteGameState();
+        if (!saveData) return [];
+
+        const scratchKey = 'tradingGameBenchmarkSave';
+        const rows = [];
+        const time = async (fn) => {
+            let total = 0;
+            for (let i = 0; i < iterations; i++) {
+                const start = performance.now();
+                await fn(i);
+                total += performance.now() - start;
+            }
+            return +(total / iterations).toFixed(2);
+        };
+
+        try {
+            // legacy - one compressed blob, rewritten in full every time
+            let legacyString = '';
+            const legacySaveMs = await time(() => {
+                legacyString = this.compressSaveData(saveData);
+                localStorage.setItem(scratchKey, legacyString);
+            });
+            const legacyLoadMs = await time(() => {
+                this.decompressSaveData(localStorage.getItem(scratchKey));
+            });
+            localStorage.removeItem(scratchKey);
+            rows.push({
+                format: 'single blob (UC)',
+                saveMs: legacySaveMs,
+                loadMs: legacyLoadMs,
+                bytesWritten: legacyString.length * 2,
+                chunksWritten: 1
+            });
+
+            // chunked full write - forget known chunks so everything gets written
+            const trimmed = this.trimSaveData(saveData);
+            ChunkedSaveStore._knownChunks = new Set();
+            await ChunkedSaveStore.writeSave(scratchKey, trimmed);
+            const fullStats = ChunkedSaveStore.lastStats;
+
+            // delta write - only the clock chunk changes, like a typical autosave
+            let deltaStats = null;
+            const deltaSaveMs = await time((i) => {
+                const changed = { ...trimmed, gameData: { ...trimmed.gameData, timeState: { ...trimmed.gameData.timeState, _benchmarkTick: i } } };
+                return ChunkedSaveStore.writeSave(scratchKey, changed).then(stats => { deltaStats = stats; });
+            });
+            const chunkedLoadMs = await time(() => ChunkedSaveStore.readSave(localStorage.getItem(scratchKey)));
+
+            rows.push({
+                format: `chunked full (${fullStats.backend})`,
+                saveMs: fullStats.totalMs,
+                loadMs: chunkedLoadMs,
+                bytesWritten: fullStats.bytesWritten,
+                chunksWritten: `${fullStats.written}/${fullStats.chunks}`
+            });
+            rows.push({
+                format: `chunked delta (${deltaStats.backend})`,
+                saveMs: deltaSaveMs,
+                loadMs: chunkedLoadMs,
+                bytesWritten: deltaStats.bytesWritten,
+                chunksWritten: `${deltaStats.written}/${deltaStats.chunks}`
+            });
+        } finally {
+            localStorage.removeItem(scratchKey);
+            ChunkedSaveStore._knownChunks = null;
+            await ChunkedSaveStore.collectGarbage();
+        }
+
+        console.table(rows);
+        return rows;
+    },
+
     /**
      * Quick save to current slot or slot 1 (keyboard shortcut: F5)
      * @returns {void}
@@ -2099,14 +2277,21 @@ const SaveManager = {
             success = this.loadAutoSave(this._selectedLoadSlot);
         }
 
-        if (success) {
-            this.closeLoadDialog();
-            // Hide main menu if visible
-            const mainMenu = document.getElementById('main-menu');
-            if (mainMenu) {
-                mainMenu.classList.add('hidden');
-                mainMenu.style.display = 'none';
-            }
+        // chunked autosaves load async - wait for the verdict before closing
+        if (success instanceof Promise) {
+            success.then(ok => { if (ok) this._afterLoadConfirmed(); });
+            return;
+        }
+        if (success) this._afterLoadConfirmed();
+    },
+
+    _afterLoadConfirmed() {
+        this.closeLoadDialog();
+        // Hide main menu if visible
+        const mainMenu = document.getElementById('main-menu');
+        if (mainMenu) {
+            mainMenu.classList.add('hidden');
+            mainMenu.style.display = 'none';
         }
     },
 
@@ -1,94 +1,458 @@
-// 
+//
 // MARKET PRICE HISTORY - graphs of your failures
-// 
+//
 // Version: 0.92.00 | Unity AI Lab
 // Creators: Hackall360, Sponge, GFourteen
 // www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
 // unityailabcontact@gmail.com
-// 
+//
+// every watched city+item pair gets a series: typed-array rings at
+// minute/hour/day resolution, each bucket holding open/close/min/max/sum/count.
+// rings are direct-indexed (slot = bucket % capacity) so finding "the bucket
+// for day N" is one modulo, and each bucket remembers the series running
+// totals from before it started - window averages are a subtraction, not a scan.
+//
+// the world has ~20k city+item pairs, so only the ones the player trades,
+// looks at or sets alerts on are watched. rings start tiny and double when a
+// new bucket would overwrite one still inside the tier's window.
 
 const MarketPriceHistory = {
-    // price history data - memories of better prices
-    priceHistory: {},
-    
-    // Maximum history entries per item per city
+    // legacy localStorage key - only read once to migrate old data
+    LEGACY_STORAGE_KEY: 'tradingGamePriceHistory',
+
+    // rollup tiers - minutes per bucket and how many buckets of window each ring covers
+    TIERS: [
+        { name: 'minute', minutes: 1, capacity: 60 },    // the last hour, sample by sample
+        { name: 'hour', minutes: 60, capacity: 48 },     // the last two days
+        { name: 'day', minutes: 1440, capacity: 60 }     // the last two months
+    ],
+
+    // Float32 fields per bucket
+    OPEN: 0,
+    CLOSE: 1,
+    MIN: 2,
+    MAX: 3,
+    SUM: 4,
+    COUNT: 5,
+    VALUE_FIELDS: 6,
+
+    // Float64 fields per bucket - bucket number and the series totals before it
+    BUCKET: 0,
+    BASE_SUM: 1,
+    BASE_COUNT: 2,
+    STAMP_FIELDS: 3,
+
+    // buckets a fresh ring starts with - doubles up to the tier's capacity as data arrives
+    RING_START: 4,
+
+    // default window (days) for trend and stats - the trade panel asks for 7
+    statsWindowDays: 7,
+
+    // how many day buckets go into a save - the rest regrows as you play
+    saveHistoryDays: 30,
+
+    // most recently touched series that go into a save, and the byte budget they share -
+    // manual saves are a single localStorage blob, this can't eat the quota
+    saveMaxSeries: 400,
+    saveBudgetBytes: 256 * 1024,
+
+    // live series cap - past it the least recently touched tenth is dropped
+    maxSeries: 2000,
+
+    // Maximum entries getPriceHistoryDisplay will list
     maxHistoryEntries: 50,
-    
+
+    // `${cityId}_${itemId}` -> series
+    series: new Map(),
+
+    // itemId -> { cities: Map(cityId -> series), cheapest, dearest }
+    bestPrices: new Map(),
+
+    stats: { writes: 0, bestRescans: 0, ringGrowths: 0, evictions: 0 },
+
+    // bumped whenever a series is created or dropped - the market engine
+    // rebuilds its slot -> series table when this moves
+    version: 0,
+
     // wake up the price tracker - time to document financial pain
     init() {
         this.loadPriceHistory();
     },
-    
-    // resurrect old price data from the digital tomb
+
+    // price history lives in the save slot now - this only migrates the old localStorage blob
     loadPriceHistory() {
-        const saved = localStorage.getItem('tradingGamePriceHistory');
-        if (saved) {
-            try {
-                this.priceHistory = JSON.parse(saved);
-            } catch (e) {
-                // corrupt data? Nuke it and start fresh - silent fallback
-                localStorage.removeItem('tradingGamePriceHistory');
-                this.priceHistory = {};
-            }
+        let saved = null;
+        try {
+            saved = localStorage.getItem(this.LEGACY_STORAGE_KEY);
+        } catch (e) {
+            return;
         }
-    },
-    
-    // bury price memories in localStorage for future torment
-    savePriceHistory() {
+        if (!saved) return;
+
         try {
-            localStorage.setItem('tradingGamePriceHistory', JSON.stringify(this.priceHistory));
+            this._importLegacy(JSON.parse(saved));
         } catch (e) {
-            // storage full or blocked - silent fail, not critical
+            // corrupt data? start fresh - silent fallback
+        }
+        localStorage.removeItem(this.LEGACY_STORAGE_KEY);
+    },
+
+    // saved per-slot via getSaveData() - no more localStorage on every price tick
+    savePriceHistory() {
+        // no-op - SaveManager handles persistence now
+        // kept for backwards compat with any code calling this
+    },
+
+    //
+    // series storage
+    //
+
+    _createRing(capacity) {
+        const stamps = new Float64Array(capacity * this.STAMP_FIELDS);
+        for (let i = 0; i < capacity; i++) stamps[i * this.STAMP_FIELDS] = -1;
+        return {
+            capacity,
+            head: -1,
+            values: new Float32Array(capacity * this.VALUE_FIELDS),
+            stamps
+        };
+    },
+
+    // biggest a ring gets - a power of two so doubling never collides two live buckets
+    _maxCapacity(tier) {
+        let capacity = this.RING_START;
+        while (capacity < tier.capacity) capacity *= 2;
+        return capacity;
+    },
+
+    _createSeries(cityId, itemId) {
+        const series = {
+            cityId,
+            itemId,
+            count: 0,
+            sum: 0,
+            min: Infinity,
+            max: -Infinity,
+            last: 0,
+            lastAt: -1,
+            touchedAt: this._gameMinute(),
+            tiers: this.TIERS.map(() => this._createRing(this.RING_START)),
+            // closed-bucket min/max for the last window asked about - valid until the day rolls
+            windowCache: null
+        };
+        this.series.set(`${cityId}_${itemId}`, series);
+
+        let best = this.bestPrices.get(itemId);
+        if (!best) {
+            best = { cities: new Map(), cheapest: null, dearest: null };
+            this.bestPrices.set(itemId, best);
+        }
+        best.cities.set(cityId, series);
+        this.version++;
+
+        if (this.series.size > this.maxSeries) this._evictStale(series);
+        return series;
+    },
+
+    _getSeries(cityId, itemId) {
+        return this.series.get(`${cityId}_${itemId}`);
+    },
+
+    _resetSeries(series) {
+        series.count = 0;
+        series.sum = 0;
+        series.min = Infinity;
+        series.max = -Infinity;
+        series.lastAt = -1;
+        series.windowCache = null;
+        series.tiers = this.TIERS.map(() => this._createRing(this.RING_START));
+    },
+
+    // drop the least recently touched tenth - never the series being created right now
+    _evictStale(keep) {
+        const byAge = [...this.series.values()]
+            .filter(series => series !== keep)
+            .sort((a, b) => a.touchedAt - b.touchedAt || a.lastAt - b.lastAt);
+        const drop = Math.min(byAge.length, Math.max(1, Math.floor(this.maxSeries / 10)));
+        for (let i = 0; i < drop; i++) {
+            this._deleteSeries(byAge[i].cityId, byAge[i].itemId);
+            this.stats.evictions++;
+        }
+    },
+
+    // double the ring, re-slotting every bucket it holds
+    _growRing(ring) {
+        const capacity = ring.capacity * 2;
+        const grown = this._createRing(capacity);
+        grown.head = ring.head;
+        for (let slot = 0; slot < ring.capacity; slot++) {
+            const bucket = ring.stamps[slot * this.STAMP_FIELDS + this.BUCKET];
+            if (bucket < 0) continue;
+            const to = bucket % capacity;
+            grown.stamps.set(ring.stamps.subarray(slot * this.STAMP_FIELDS, (slot + 1) * this.STAMP_FIELDS), to * this.STAMP_FIELDS);
+            grown.values.set(ring.values.subarray(slot * this.VALUE_FIELDS, (slot + 1) * this.VALUE_FIELDS), to * this.VALUE_FIELDS);
+        }
+        this.stats.ringGrowths++;
+        return grown;
+    },
+
+    // fold one price into a tier ring - new bucket or update the current one
+    _writeBucket(series, t, price, now) {
+        const tier = this.TIERS[t];
+        let ring = series.tiers[t];
+        const bucket = Math.floor(now / tier.minutes);
+        let slot = bucket % ring.capacity;
+
+        if (bucket !== ring.head) {
+            // the slot still holds a bucket inside the window - make room instead of losing it
+            const oldest = bucket - tier.capacity + 1;
+            const maxCapacity = this._maxCapacity(tier);
+            while (ring.capacity < maxCapacity && ring.stamps[slot * this.STAMP_FIELDS + this.BUCKET] >= oldest) {
+                ring = series.tiers[t] = this._growRing(ring);
+                slot = bucket % ring.capacity;
+            }
+
+            const v = slot * this.VALUE_FIELDS;
+            const s = slot * this.STAMP_FIELDS;
+            ring.stamps[s + this.BUCKET] = bucket;
+            ring.stamps[s + this.BASE_SUM] = series.sum - price;
+            ring.stamps[s + this.BASE_COUNT] = series.count - 1;
+            ring.values[v + this.OPEN] = price;
+            ring.values[v + this.CLOSE] = price;
+            ring.values[v + this.MIN] = price;
+            ring.values[v + this.MAX] = price;
+            ring.values[v + this.SUM] = price;
+            ring.values[v + this.COUNT] = 1;
+            ring.head = bucket;
+            return;
         }
+
+        const values = ring.values;
+        const v = slot * this.VALUE_FIELDS;
+        values[v + this.CLOSE] = price;
+        if (price < values[v + this.MIN]) values[v + this.MIN] = price;
+        if (price > values[v + this.MAX]) values[v + this.MAX] = price;
+        values[v + this.SUM] += price;
+        values[v + this.COUNT]++;
     },
-    
+
     // carve another price into history's flesh - never forget what you paid
-    recordPrice(cityId, itemId, price) {
-        if (!this.priceHistory[cityId]) {
-            this.priceHistory[cityId] = {};
-        }
-        
-        if (!this.priceHistory[cityId][itemId]) {
-            this.priceHistory[cityId][itemId] = [];
-        }
-        
-        const priceEntry = {
-            price: price,
-            timestamp: TimeSystem.getTotalMinutes(),
-            date: new Date().toISOString()
+    recordPrice(cityId, itemId, price, now = this._gameMinute()) {
+        const series = this._getSeries(cityId, itemId) || this._createSeries(cityId, itemId);
+        series.touchedAt = Math.max(series.touchedAt, now);
+        this.recordSeriesPrice(series, price, now);
+    },
+
+    /**
+     * Append a price to a series that already exists - the market tick's path,
+     * it only ever writes to pairs somebody is watching
+     */
+    recordSeriesPrice(series, price, now) {
+        // time went backwards (older save, debooger time travel) - this history is fiction now
+        if (now < series.lastAt) this._resetSeries(series);
+
+        const previous = series.count > 0 ? series.last : null;
+        series.count++;
+        series.sum += price;
+        if (price < series.min) series.min = price;
+        if (price > series.max) series.max = price;
+        series.last = price;
+        series.lastAt = now;
+
+        for (let t = 0; t < this.TIERS.length; t++) {
+            this._writeBucket(series, t, price, now);
+        }
+
+        this._updateBestPrice(this.bestPrices.get(series.itemId), series, previous);
+        this.stats.writes++;
+    },
+
+    //
+    // watching - which pairs keep history at all
+    //
+
+    _gameMinute() {
+        return typeof TimeSystem !== 'undefined' && TimeSystem.getTotalMinutes ? TimeSystem.getTotalMinutes() : 0;
+    },
+
+    /**
+     * Start (or keep) remembering prices for a city+item - trades, views and alerts call this.
+     * A new series is seeded with the market's current price so it has something to show
+     */
+    watch(cityId, itemId) {
+        const now = this._gameMinute();
+        let series = this._getSeries(cityId, itemId);
+        if (series) {
+            series.touchedAt = Math.max(series.touchedAt, now);
+            return series;
+        }
+
+        series = this._createSeries(cityId, itemId);
+        const current = typeof GameWorld !== 'undefined' ? GameWorld.locations?.[cityId]?.marketPrices?.[itemId] : null;
+        if (typeof current?.price === 'number') this.recordSeriesPrice(series, current.price, now);
+        return series;
+    },
+
+    // watch an item in every city whose market carries it - comparisons and price alerts
+    watchItem(itemId) {
+        if (typeof GameWorld === 'undefined' || !GameWorld.locations) return;
+        for (const [cityId, city] of Object.entries(GameWorld.locations)) {
+            if (city?.marketPrices?.[itemId]) this.watch(cityId, itemId);
+        }
+    },
+
+    //
+    // cross-city best price index - cheapest place to buy, dearest place to sell
+    //
+
+    _updateBestPrice(best, series, previous) {
+        const price = series.last;
+
+        if (best.cheapest === series) {
+            // the champion got worse - someone else might be cheaper now
+            if (previous !== null && price > previous) best.cheapest = this._scanBest(best, 1);
+        } else if (!best.cheapest || price < best.cheapest.last) {
+            best.cheapest = series;
+        }
+
+        if (best.dearest === series) {
+            if (previous !== null && price < previous) best.dearest = this._scanBest(best, -1);
+        } else if (!best.dearest || price > best.dearest.last) {
+            best.dearest = series;
+        }
+    },
+
+    // direction 1 = lowest price wins, -1 = highest
+    _scanBest(best, direction) {
+        this.stats.bestRescans++;
+        let winner = null;
+        for (const series of best.cities.values()) {
+            if (series.count === 0) continue;
+            if (!winner || (series.last - winner.last) * direction < 0) winner = series;
+        }
+        return winner;
+    },
+
+    _rebuildBestPrices() {
+        for (const best of this.bestPrices.values()) {
+            best.cheapest = this._scanBest(best, 1);
+            best.dearest = this._scanBest(best, -1);
+        }
+    },
+
+    /**
+     * Where an item is cheapest to buy and dearest to sell right now
+     * @param {string} itemId
+     * @returns {{buy: {cityId, price}, sell: {cityId, price}}|null}
+     */
+    getBestPrices(itemId) {
+        const best = this.bestPrices.get(itemId);
+        if (!best?.cheapest) return null;
+        return {
+            buy: { cityId: best.cheapest.cityId, price: best.cheapest.last },
+            sell: { cityId: best.dearest.cityId, price: best.dearest.last }
+        };
+    },
+
+    //
+    // window queries - O(1) off the running totals
+    //
+
+    _getTier(name) {
+        const index = this.TIERS.findIndex(tier => tier.name === name);
+        return index === -1 ? null : index;
+    },
+
+    _now(series) {
+        return typeof TimeSystem !== 'undefined' ? TimeSystem.getTotalMinutes() : series.lastAt;
+    },
+
+    // smallest tier whose ring still covers the window
+    _tierForWindow(minutes) {
+        for (let t = 0; t < this.TIERS.length; t++) {
+            const tier = this.TIERS[t];
+            if (tier.minutes * (tier.capacity - 1) >= minutes) return t;
+        }
+        return this.TIERS.length - 1;
+    },
+
+    // first live bucket at or after fromBucket - one step unless the series has gaps
+    _firstBucket(ring, tier, fromBucket) {
+        if (ring.head < 0) return -1;
+        let bucket = Math.max(fromBucket, ring.head - tier.capacity + 1, 0);
+        for (; bucket <= ring.head; bucket++) {
+            if (ring.stamps[(bucket % ring.capacity) * this.STAMP_FIELDS + this.BUCKET] === bucket) return bucket;
+        }
+        return -1;
+    },
+
+    /**
+     * Aggregates for the samples in the last `minutes`, to bucket resolution
+     * @returns {{first, last, count, average, t, fromBucket}|null}
+     */
+    _windowAggregate(series, minutes, now) {
+        const t = this._tierForWindow(minutes);
+        const tier = this.TIERS[t];
+        const ring = series.tiers[t];
+        const fromBucket = this._firstBucket(ring, tier, Math.floor((now - minutes) / tier.minutes));
+        if (fromBucket < 0) return null;
+
+        const slot = fromBucket % ring.capacity;
+        const count = series.count - ring.stamps[slot * this.STAMP_FIELDS + this.BASE_COUNT];
+        const sum = series.sum - ring.stamps[slot * this.STAMP_FIELDS + this.BASE_SUM];
+        return {
+            first: ring.values[slot * this.VALUE_FIELDS + this.OPEN],
+            last: series.last,
+            count,
+            average: count > 0 ? sum / count : series.last,
+            t,
+            fromBucket
         };
-        
-        this.priceHistory[cityId][itemId].push(priceEntry);
-        
-        // forget ancient prices - we only keep fresh wounds
-        if (this.priceHistory[cityId][itemId].length > this.maxHistoryEntries) {
-            this.priceHistory[cityId][itemId] = this.priceHistory[cityId][itemId].slice(-this.maxHistoryEntries);
+    },
+
+    // min/max across the window - closed buckets cached until the head bucket moves
+    _windowExtremes(series, window) {
+        const ring = series.tiers[window.t];
+        const head = ring.head;
+        let cache = series.windowCache;
+
+        if (!cache || cache.t !== window.t || cache.fromBucket !== window.fromBucket || cache.head !== head) {
+            let min = Infinity;
+            let max = -Infinity;
+            for (let bucket = window.fromBucket; bucket < head; bucket++) {
+                const slot = bucket % ring.capacity;
+                if (ring.stamps[slot * this.STAMP_FIELDS + this.BUCKET] !== bucket) continue;
+                min = Math.min(min, ring.values[slot * this.VALUE_FIELDS + this.MIN]);
+                max = Math.max(max, ring.values[slot * this.VALUE_FIELDS + this.MAX]);
+            }
+            cache = { t: window.t, fromBucket: window.fromBucket, head, min, max };
+            series.windowCache = cache;
         }
-        
-        this.savePriceHistory();
+
+        // the open bucket is still moving, fold it in fresh
+        const headSlot = (head % ring.capacity) * this.VALUE_FIELDS;
+        return {
+            min: Math.min(cache.min, ring.values[headSlot + this.MIN]),
+            max: Math.max(cache.max, ring.values[headSlot + this.MAX])
+        };
     },
-    
+
     // watch prices rise or fall like your self-esteem during market hours
-    getPriceTrend(cityId, itemId, timeRange = 7) {
-        const history = this.priceHistory[cityId]?.[itemId];
-        if (!history || history.length < 2) {
+    getPriceTrend(cityId, itemId, timeRange = this.statsWindowDays) {
+        // somebody's looking - keep remembering this one
+        const series = this.watch(cityId, itemId);
+        if (!series || series.count < 2) {
             return 'stable';
         }
-        
-        // Get recent prices within time range (in minutes)
-        const currentTime = TimeSystem.getTotalMinutes();
-        const recentPrices = history.filter(entry => currentTime - entry.timestamp <= timeRange * 24 * 60); // timeRange days in minutes
-        
-        if (recentPrices.length < 2) {
+
+        // timeRange is in days
+        const window = this._windowAggregate(series, timeRange * 24 * 60, this._now(series));
+        if (!window || window.count < 2) {
             return 'stable';
         }
-        
-        // crunch the numbers - is this going up or down to hell?
-        const prices = recentPrices.map(entry => entry.price);
-        const firstPrice = prices[0];
-        const lastPrice = prices[prices.length - 1];
-        const avgPrice = prices.reduce((sum, price) => sum + price, 0) / prices.length;
-        
+
+        const { first: firstPrice, last: lastPrice, average: avgPrice } = window;
+
         // is it rising (pain) or falling (missed opportunity)?
         if (lastPrice > firstPrice * 1.05) { // 5% increase
             return 'rising';
@@ -102,42 +466,47 @@ const MarketPriceHistory = {
             return 'falling';
         }
     },
-    
+
     // compile the damage - min, max, avg prices to haunt you
-    getPriceStats(cityId, itemId) {
-        const history = this.priceHistory[cityId]?.[itemId];
-        if (!history || history.length === 0) {
+    getPriceStats(cityId, itemId, days = this.statsWindowDays) {
+        const series = this.watch(cityId, itemId);
+        if (!series || series.count === 0) {
             return null;
         }
-        
-        const prices = history.map(entry => entry.price);
-        const minPrice = Math.min(...prices);
-        const maxPrice = Math.max(...prices);
-        const avgPrice = prices.reduce((sum, price) => sum + price, 0) / prices.length;
-        const currentPrice = prices[prices.length - 1];
-        
+
+        const window = this._windowAggregate(series, days * 24 * 60, this._now(series));
+        if (!window) {
+            return null;
+        }
+
+        const { min: minPrice, max: maxPrice } = this._windowExtremes(series, window);
+        const avgPrice = window.average;
+
         return {
             min: minPrice,
             max: maxPrice,
             average: Math.round(avgPrice),
-            current: currentPrice,
-            volatility: Math.round(((maxPrice - minPrice) / avgPrice) * 100) / 100
+            current: series.last,
+            volatility: Math.round(((maxPrice - minPrice) / avgPrice) * 100) / 100,
+            samples: window.count
         };
     },
-    
+
     // shop around - find which city bleeds you the least
     comparePrices(itemId) {
         const comparisons = [];
-        
-        for (const [cityId, cityData] of Object.entries(GameWorld.locations)) {
-            const history = this.priceHistory[cityId]?.[itemId];
-            if (!history || history.length === 0) continue;
-            
+        this.watchItem(itemId);
+        const best = this.bestPrices.get(itemId);
+        if (!best) return comparisons;
+
+        // only the cities that ever priced this item, not the whole world
+        for (const [cityId, series] of best.cities) {
+            const cityData = GameWorld.locations[cityId];
+            if (!cityData || series.count === 0) continue;
+
             const stats = this.getPriceStats(cityId, itemId);
             if (!stats) continue;
-            
-            const trend = this.getPriceTrend(cityId, itemId);
-            
+
             comparisons.push({
                 cityId: cityId,
                 cityName: cityData.name,
@@ -145,67 +514,256 @@ const MarketPriceHistory = {
                 averagePrice: stats.average,
                 minPrice: stats.min,
                 maxPrice: stats.max,
-                trend: trend,
+                trend: this.getPriceTrend(cityId, itemId),
                 stock: cityData.marketPrices?.[itemId]?.stock || 0
             });
         }
-        
+
         // sort by who'll screw you over the least
         comparisons.sort((a, b) => a.currentPrice - b.currentPrice);
-        
+
         return comparisons;
     },
-    
+
+    /**
+     * Rollup buckets for one series, oldest first
+     * @param {string} [tierName='day'] - minute | hour | day
+     * @returns {Array<{start, open, close, min, max, average, count}>}
+     */
+    getSeriesHistory(cityId, itemId, tierName = 'day') {
+        const series = this._getSeries(cityId, itemId);
+        const t = this._getTier(tierName);
+        if (!series || t === null) return [];
+
+        const tier = this.TIERS[t];
+        const ring = series.tiers[t];
+        const buckets = [];
+        if (ring.head < 0) return buckets;
+
+        for (let bucket = ring.head - tier.capacity + 1; bucket <= ring.head; bucket++) {
+            if (bucket < 0) continue;
+            const slot = bucket % ring.capacity;
+            if (ring.stamps[slot * this.STAMP_FIELDS + this.BUCKET] !== bucket) continue;
+            const v = slot * this.VALUE_FIELDS;
+            const count = ring.values[v + this.COUNT];
+            buckets.push({
+                start: bucket * tier.minutes,
+                open: ring.values[v + this.OPEN],
+                close: ring.values[v + this.CLOSE],
+                min: ring.values[v + this.MIN],
+                max: ring.values[v + this.MAX],
+                average: Math.round(ring.values[v + this.SUM] / count),
+                count
+            });
+        }
+        return buckets;
+    },
+
+    // game minute -> "Day 12, 8:05 AM"
+    _formatGameMinute(minute) {
+        const day = Math.floor(minute / 1440) + 1;
+        const hour = Math.floor((minute % 1440) / 60);
+        const clock = typeof TimeSystem !== 'undefined'
+            ? TimeSystem.formatTimeAMPM(hour, minute % 60)
+            : `${hour}:${String(minute % 60).padStart(2, '0')}`;
+        return `Day ${day}, ${clock}`;
+    },
+
     // Get price history for UI display
     getPriceHistoryDisplay(cityId, itemId, maxEntries = 10) {
-        const history = this.priceHistory[cityId]?.[itemId];
-        if (!history || history.length === 0) {
+        // freshly loaded saves only carry day rollups - fall back to the coarser rings
+        let history = [];
+        for (const tierName of ['minute', 'hour', 'day']) {
+            history = this.getSeriesHistory(cityId, itemId, tierName);
+            if (history.length > 0) break;
+        }
+        if (history.length === 0) {
             return '<p>No price history available.</p>';
         }
-        
-        const recentHistory = history.slice(-maxEntries).reverse();
-        
+
+        const recentHistory = history.slice(-Math.min(maxEntries, this.maxHistoryEntries)).reverse();
+
         return recentHistory.map(entry => `
             <div class="price-history-entry">
-                <div class="price">${entry.price} gold</div>
-                <div class="date">${new Date(entry.date).toLocaleString()}</div>
+                <div class="price">${entry.close} gold</div>
+                <div class="date">${this._formatGameMinute(entry.start)}</div>
             </div>
         `).join('');
     },
-    
+
+    //
+    // SAVE/LOAD INTEGRATION - per-slot, day rollups only
+    //
+
+    // series -> [cityId, itemId, count, sum, min, max, last, lastAt, ...buckets]
+    // each bucket is 7 numbers: gap from the previous bucket, open, close, min, max, sum, count.
+    // base totals aren't stored - loading walks them back from the series totals.
+    // only the most recently touched series go in, up to saveMaxSeries / saveBudgetBytes
+    getSaveData() {
+        const t = this._getTier('day');
+        const tier = this.TIERS[t];
+        const rows = [];
+        let bytes = 0;
+
+        const recent = [...this.series.values()]
+            .filter(series => series.count > 0)
+            .sort((a, b) => b.touchedAt - a.touchedAt || b.lastAt - a.lastAt);
+
+        for (const series of recent) {
+            if (rows.length >= this.saveMaxSeries) break;
+            const ring = series.tiers[t];
+            const row = [series.cityId, series.itemId, series.count, series.sum,
+                series.min, series.max, series.last, series.lastAt];
+
+            let previous = -1;
+            const from = Math.max(0, ring.head - Math.min(tier.capacity, this.saveHistoryDays) + 1);
+            for (let bucket = from; ring.head >= 0 && bucket <= ring.head; bucket++) {
+                const slot = bucket % ring.capacity;
+                if (ring.stamps[slot * this.STAMP_FIELDS + this.BUCKET] !== bucket) continue;
+                const v = slot * this.VALUE_FIELDS;
+                // first bucket absolute, the rest as gaps - mostly 1s
+                row.push(previous < 0 ? bucket : bucket - previous,
+                    ring.values[v + this.OPEN], ring.values[v + this.CLOSE],
+                    ring.values[v + this.MIN], ring.values[v + this.MAX],
+                    Math.round(ring.values[v + this.SUM]), ring.values[v + this.COUNT]);
+                previous = bucket;
+            }
+
+            // the budget holds even if every row is a full 30 days
+            const rowBytes = JSON.stringify(row).length + 1;
+            if (bytes + rowBytes > this.saveBudgetBytes) break;
+            bytes += rowBytes;
+            rows.push(row);
+        }
+
+        return { version: 2, series: rows };
+    },
+
+    loadSaveData(data) {
+        this.series = new Map();
+        this.bestPrices = new Map();
+        this.version++;
+        if (!data) return;
+
+        // pre-ring saves stored { cityId: { itemId: [{ price, timestamp }] } }
+        if (data.version !== 2) {
+            this._importLegacy(data);
+            return;
+        }
+
+        const t = this._getTier('day');
+        const tier = this.TIERS[t];
+        const BUCKET_FIELDS = 7;
+
+        for (const row of data.series || []) {
+            const [cityId, itemId, count, sum, min, max, last, lastAt] = row;
+            const series = this._createSeries(cityId, itemId);
+            Object.assign(series, { count, sum, min, max, last, lastAt, touchedAt: lastAt });
+
+            // saved buckets can span the whole window - start the day ring full size
+            const ring = series.tiers[t] = this._createRing(this._maxCapacity(tier));
+            const buckets = [];
+            let bucket = 0;
+            for (let i = 8; i + BUCKET_FIELDS <= row.length; i += BUCKET_FIELDS) {
+                bucket = buckets.length === 0 ? row[i] : bucket + row[i];
+                buckets.push([bucket, i]);
+            }
+
+            // base totals walk backwards from the series totals
+            let baseSum = sum;
+            let baseCount = count;
+            for (let b = buckets.length - 1; b >= 0; b--) {
+                const [number, i] = buckets[b];
+                const slot = number % ring.capacity;
+                const v = slot * this.VALUE_FIELDS;
+                const s = slot * this.STAMP_FIELDS;
+                baseSum -= row[i + 5];
+                baseCount -= row[i + 6];
+                ring.stamps[s + this.BUCKET] = number;
+                ring.stamps[s + this.BASE_SUM] = baseSum;
+                ring.stamps[s + this.BASE_COUNT] = baseCount;
+                ring.values[v + this.OPEN] = row[i + 1];
+                ring.values[v + this.CLOSE] = row[i + 2];
+                ring.values[v + this.MIN] = row[i + 3];
+                ring.values[v + this.MAX] = row[i + 4];
+                ring.values[v + this.SUM] = row[i + 5];
+                ring.values[v + this.COUNT] = row[i + 6];
+            }
+            ring.head = buckets.length > 0 ? buckets[buckets.length - 1][0] : -1;
+        }
+
+        this._rebuildBestPrices();
+    },
+
+    // replay the old array-of-objects format through recordPrice
+    _importLegacy(history) {
+        if (!history || typeof history !== 'object') return;
+        const entries = [];
+        for (const [cityId, items] of Object.entries(history)) {
+            for (const [itemId, list] of Object.entries(items || {})) {
+                if (!Array.isArray(list)) continue;
+                for (const entry of list) {
+                    if (typeof entry?.price === 'number') entries.push([entry.timestamp || 0, cityId, itemId, entry.price]);
+                }
+            }
+        }
+        entries.sort((a, b) => a[0] - b[0]);
+        for (const [timestamp, cityId, itemId, price] of entries) {
+            this.recordPrice(cityId, itemId, price, timestamp);
+        }
+    },
+
     // Get all price history for save system
     getAllPriceHistory() {
-        return this.priceHistory;
+        return this.getSaveData();
     },
-    
+
     // Load price history from save system (used when loading a saved game)
     loadPriceHistoryFromSave(history) {
-        this.priceHistory = history || {};
-        this.savePriceHistory();
+        this.loadSaveData(history);
     },
-    
+
     // erase the past - pretend you never paid those prices
     clearPriceHistory(cityId = null, itemId = null) {
         if (cityId && itemId) {
             // Clear specific item history in specific city
-            if (this.priceHistory[cityId]) {
-                delete this.priceHistory[cityId][itemId];
-            }
+            this._deleteSeries(cityId, itemId);
         } else if (cityId) {
             // Clear all history for specific city
-            delete this.priceHistory[cityId];
+            for (const series of [...this.series.values()]) {
+                if (series.cityId === cityId) this._deleteSeries(cityId, series.itemId);
+            }
         } else {
             // Clear all history
-            this.priceHistory = {};
+            this.series = new Map();
+            this.bestPrices = new Map();
+            this.version++;
         }
-        
-        this.savePriceHistory();
+
         addMessage('Price history cleared!');
     },
-    
+
+    _deleteSeries(cityId, itemId) {
+        const series = this._getSeries(cityId, itemId);
+        if (!series) return;
+        this.series.delete(`${cityId}_${itemId}`);
+        this.version++;
+
+        const best = this.bestPrices.get(itemId);
+        best.cities.delete(cityId);
+        if (best.cheapest === series) best.cheapest = this._scanBest(best, 1);
+        if (best.dearest === series) best.dearest = this._scanBest(best, -1);
+    },
+
     // download all your financial regrets as a nice JSON file
     exportPriceHistory() {
-        const dataStr = JSON.stringify(this.priceHistory, null, 2);
+        const history = {};
+        for (const series of this.series.values()) {
+            if (!history[series.cityId]) history[series.cityId] = {};
+            history[series.cityId][series.itemId] = this.getSeriesHistory(series.cityId, series.itemId, 'day');
+        }
+
+        const dataStr = JSON.stringify(history, null, 2);
         const blob = new Blob([dataStr], { type: 'application/json' });
         const url = URL.createObjectURL(blob);
         const a = document.createElement('a');
@@ -215,8 +773,136 @@ const MarketPriceHistory = {
         a.click();
         document.body.removeChild(a);
         URL.revokeObjectURL(url);
-        
+
         addMessage('Price history exported!');
+    },
+
+    getHistoryStats() {
+        let bytes = 0;
+        for (const series of this.series.values()) {
+            for (const ring of series.tiers) bytes += ring.values.byteLength + ring.stamps.byteLength;
+        }
+        return {
+            series: this.series.size,
+            items: this.bestPrices.size,
+            ringBytes: bytes,
+            ...this.stats
+        };
+    },
+
+    //
+    // benchmark - ring rollups vs the old filter-the-array approach
+    //
+
+    benchmarkPriceHistory({ cities = 50, items = 40, days = 30, samplesPerDay = 96, queries = 2000 } = {}) {
+        const saved = { series: this.series, bestPrices: this.bestPrices, stats: this.stats, maxSeries: this.maxSeries };
+        const step = Math.max(1, Math.floor(1440 / samplesPerDay));
+        const totalMinutes = days * 1440;
+        const legacy = {};
+        const results = [];
+
+        try {
+            this.series = new Map();
+            this.bestPrices = new Map();
+            this.stats = { writes: 0, bestRescans: 0, ringGrowths: 0, evictions: 0 };
+            // every bench pair stays live - eviction would skew the query numbers
+            this.maxSeries = Math.max(this.maxSeries, cities * items);
+            this.version++;
+
+            // writes - same price walk into both stores
+            const priceAt = (c, i, minute) => 100 + ((c * 31 + i * 17 + minute) % 41) - 20;
+            let start = performance.now();
+            for (let minute = 0; minute < totalMinutes; minute += step) {
+                for (let c = 0; c < cities; c++) {
+                    for (let i = 0; i < items; i++) {
+                        this.recordPrice(`bench_city_${c}`, `bench_item_${i}`, priceAt(c, i, minute), minute);
+                    }
+                }
+            }
+            const writeMs = performance.now() - start;
+
+            start = performance.now();
+            for (let minute = 0; minute < totalMinutes; minute += step) {
+                for (let c = 0; c < cities; c++) {
+                    const cityItems = legacy[`bench_city_${c}`] || (legacy[`bench_city_${c}`] = {});
+                    for (let i = 0; i < items; i++) {
+                        const list = cityItems[`bench_item_${i}`] || (cityItems[`bench_item_${i}`] = []);
+                        list.push({ price: priceAt(c, i, minute), timestamp: minute });
+                        if (list.length > this.maxHistoryEntries) list.shift();
+                    }
+                }
+            }
+            const legacyMs = performance.now() - start;
+            const writes = this.stats.writes;
+
+            // trend + stats queries
+            const now = totalMinutes;
+            start = performance.now();
+            for (let q = 0; q < queries; q++) {
+                const cityId = `bench_city_${q % cities}`;
+                const itemId = `bench_item_${(q * 7) % items}`;
+                const series = this._getSeries(cityId, itemId);
+                const window = this._windowAggregate(series, this.statsWindowDays * 1440, now);
+                this._windowExtremes(series, window);
+            }
+            const ringQueryMs = (performance.now() - start) / queries;
+
+            start = performance.now();
+            for (let q = 0; q < queries; q++) {
+                const list = legacy[`bench_city_${q % cities}`][`bench_item_${(q * 7) % items}`];
+                const recent = list.filter(entry => now - entry.timestamp <= this.statsWindowDays * 1440);
+                const prices = recent.map(entry => entry.price);
+                Math.min(...prices);
+                Math.max(...prices);
+                prices.reduce((sum, price) => sum + price, 0);
+            }
+            const legacyQueryMs = (performance.now() - start) / queries;
+
+            // best price lookup vs scanning every city
+            start = performance.now();
+            for (let q = 0; q < queries; q++) this.getBestPrices(`bench_item_${q % items}`);
+            const bestMs = (performance.now() - start) / queries;
+
+            start = performance.now();
+            for (let q = 0; q < queries; q++) {
+                const itemId = `bench_item_${q % items}`;
+                let bestCity = null;
+                let bestPrice = Infinity;
+                for (const [cityId, cityItems] of Object.entries(legacy)) {
+                    const list = cityItems[itemId];
+                    const price = list[list.length - 1].price;
+                    if (price < bestPrice) {
+                        bestPrice = price;
+                        bestCity = cityId;
+                    }
+                }
+            }
+            const legacyBestMs = (performance.now() - start) / queries;
+
+            // quota test - every bench series is touched, so the save has to hold its own cap
+            const saveSize = JSON.stringify(this.getSaveData()).length;
+            const legacySize = JSON.stringify(legacy).length;
+            const ringBytes = this.getHistoryStats().ringBytes;
+            const quota = size => (size <= this.saveBudgetBytes ? 'ok' : 'OVER');
+
+            results.push(
+                { store: 'rings', writeUs: +(writeMs / writes * 1000).toFixed(3), statsQueryUs: +(ringQueryMs * 1000).toFixed(2), bestPriceUs: +(bestMs * 1000).toFixed(2), memoryKB: +(ringBytes / 1024).toFixed(1), saveKB: +(saveSize / 1024).toFixed(1), quota: quota(saveSize), coverage: `${days} days` },
+                { store: 'legacy arrays', writeUs: +(legacyMs / writes * 1000).toFixed(3), statsQueryUs: +(legacyQueryMs * 1000).toFixed(2), bestPriceUs: +(legacyBestMs * 1000).toFixed(2), memoryKB: null, saveKB: +(legacySize / 1024).toFixed(1), quota: quota(legacySize), coverage: `${this.maxHistoryEntries} samples` }
+            );
+        } finally {
+            this.series = saved.series;
+            this.bestPrices = saved.bestPrices;
+            this.stats = saved.stats;
+            this.maxSeries = saved.maxSeries;
+            this.version++;
+        }
+
+        console.log(`📈 MarketPriceHistory benchmark (${cities} cities x ${items} items, ${days} days @ ${samplesPerDay}/day):`);
+        console.table(results);
+        if (results[0]?.quota !== 'ok') {
+            console.error(`📈 price history save is over its ${Math.round(this.saveBudgetBytes / 1024)} KB budget`);
+        }
+        return results;
     }
 };
 
@@ -225,4 +911,4 @@ Bootstrap.register('MarketPriceHistory', () => MarketPriceHistory.init(), {
     dependencies: ['ItemDatabase', 'GameWorld'],
     priority: 44,
     severity: 'optional'
-});
\ No newline at end of file
+});
@@ -383,7 +383,10 @@ const TradingSystem = {
             type: type, // 'below' or 'above'
             active: true
         });
-        
+
+        // alerted items keep a price history in every city that sells them
+        if (typeof MarketPriceHistory !== 'undefined') MarketPriceHistory.watchItem(itemId);
+
         this.updatePriceAlertsDisplay();
     },
     
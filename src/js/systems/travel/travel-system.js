@@ -899,6 +899,7 @@ const TravelSystem = {
     // steal location data from GameWorld (why reinvent the misery)
     syncWithGameWorld() {
         this.locations = {};
+        this.invalidateRouteIndex();
 
         // blow up the coordinates so we have room to breathe
         const scaleX = 10; // 0-800 becomes 0-8000 (because bigger is... something)
@@ -1291,6 +1292,7 @@ const TravelSystem = {
     // weave paths between locations like threads of fate
     generatePaths() {
         this.paths = [];
+        this.invalidateRouteIndex();
         const processedPairs = new Set();
 
         // carve paths from the connections (if they even exist)
@@ -1825,7 +1827,202 @@ const TravelSystem = {
         return Math.sqrt(dx * dx + dy * dy) / 500; // Convert scaled coords to miles
     },
 
-    // Find path between locations using A* pathfinding
+    //
+    // route index - adjacency, heap pathfinding, lazy all-pairs table
+    //
+    // rebuilt only when locations or paths change. weather and season scale every
+    // segment by the same factor (applied in calculateTravelInfo), so they never
+    // change which route wins and don't invalidate the table
+
+    _routeIndex: null,
+
+    // drop the route index - rebuilt lazily on the next lookup
+    invalidateRouteIndex() {
+        this._routeIndex = null;
+    },
+
+    // undirected pair key for path lookups
+    _routePairKey(fromId, toId) {
+        return fromId < toId ? `${fromId}|${toId}` : `${toId}|${fromId}`;
+    },
+
+    // cheapest possible cost per mile - keeps the A* heuristic admissible
+    _minTerrainPenalty() {
+        let best = Infinity;
+        for (const info of Object.values(this.PATH_TYPES)) {
+            best = Math.min(best, 1 / (info.speedMultiplier || 0.5));
+        }
+        return Number.isFinite(best) ? best : 1;
+    },
+
+    // build adjacency (following location.connections, same as the old A*) and the pair map
+    _buildRouteIndex() {
+        const locations = this.locations || {};
+        const paths = this.paths || [];
+        const ids = Object.keys(locations);
+        const idIndex = new Map();
+        ids.forEach((id, i) => idIndex.set(id, i));
+
+        const pairs = new Map();
+        for (const path of paths) {
+            const key = this._routePairKey(path.from, path.to);
+            if (!pairs.has(key)) pairs.set(key, path);
+        }
+
+        // flat edge lists per node - [target, cost, distance, safety, path]
+        const adjacency = new Array(ids.length);
+        for (let i = 0; i < ids.length; i++) {
+            const location = locations[ids[i]];
+            const edges = [];
+            for (const neighborId of location.connections || []) {
+                const j = idIndex.get(neighborId);
+                if (j === undefined || j === i) continue;
+
+                const segment = pairs.get(this._routePairKey(ids[i], neighborId)) || null;
+                const distance = segment?.distance || this.calculateDistance(location, locations[neighborId]);
+                const pathInfo = this.PATH_TYPES[segment?.type || 'trail'] || this.PATH_TYPES.trail;
+                const terrainPenalty = 1 / (pathInfo.speedMultiplier || 0.5); // Slower paths cost more
+
+                edges.push({
+                    to: j,
+                    cost: distance * terrainPenalty,
+                    distance,
+                    safety: segment ? (segment.safety ?? 0.7) : 0.5,
+                    path: segment
+                });
+            }
+            adjacency[i] = edges;
+        }
+
+        return {
+            locations,
+            paths,
+            pathCount: paths.length,
+            ids,
+            idIndex,
+            pairs,
+            adjacency,
+            heuristicScale: this._minTerrainPenalty(),
+            rows: new Array(ids.length).fill(null),
+            stats: { rowsBuilt: 0, lookups: 0, rowHits: 0 }
+        };
+    },
+
+    _getRouteIndex() {
+        const index = this._routeIndex;
+        if (!index || index.locations !== this.locations || index.paths !== this.paths ||
+            index.pathCount !== (this.paths || []).length) {
+            this._routeIndex = this._buildRouteIndex();
+        }
+        return this._routeIndex;
+    },
+
+    // single-source dijkstra on a binary heap - one row of the all-pairs table
+    _buildRouteRow(index, source) {
+        const n = index.ids.length;
+        const row = {
+            cost: new Float64Array(n).fill(Infinity),
+            distance: new Float64Array(n),
+            hops: new Int32Array(n),
+            safety: new Float32Array(n),
+            prev: new Int32Array(n).fill(-1),
+            nextHop: new Int32Array(n).fill(-1)
+        };
+        const closed = new Uint8Array(n);
+        const heap = new MinHeap();
+
+        row.cost[source] = 0;
+        row.safety[source] = 1;
+        heap.push(source, 0);
+
+        while (heap.size > 0) {
+            const current = heap.pop();
+            if (closed[current]) continue;
+            closed[current] = 1;
+
+            for (const edge of index.adjacency[current]) {
+                const next = edge.to;
+                if (closed[next]) continue;
+
+                const tentative = row.cost[current] + edge.cost;
+                if (tentative < row.cost[next]) {
+                    row.cost[next] = tentative;
+                    row.distance[next] = row.distance[current] + edge.distance;
+                    row.hops[next] = row.hops[current] + 1;
+                    row.safety[next] = Math.min(row.safety[current], edge.safety);
+                    row.prev[next] = current;
+                    row.nextHop[next] = current === source ? next : row.nextHop[current];
+                    heap.push(next, tentative);
+                }
+            }
+        }
+
+        index.rows[source] = row;
+        index.stats.rowsBuilt++;
+        return row;
+    },
+
+    _getRouteRow(index, source) {
+        const row = index.rows[source];
+        if (row) {
+            index.stats.rowHits++;
+            return row;
+        }
+        return this._buildRouteRow(index, source);
+    },
+
+    // O(1) route metrics after warmup - null when unreachable
+    getRouteSummary(fromId, toId) {
+        const index = this._getRouteIndex();
+        const source = index.idIndex.get(fromId);
+        const target = index.idIndex.get(toId);
+        if (source === undefined || target === undefined) return null;
+
+        index.stats.lookups++;
+        const row = this._getRouteRow(index, source);
+        if (row.cost[target] === Infinity) return null;
+
+        return {
+            distance: row.distance[target],
+            cost: row.cost[target],
+            hops: row.hops[target],
+            safety: row.safety[target],
+            nextHop: row.nextHop[target] >= 0 ? index.ids[row.nextHop[target]] : null
+        };
+    },
+
+    // walk the predecessor chain of a cached row back into a route of ids
+    _routeFromRow(index, row, source, target) {
+        if (row.cost[target] === Infinity) return null;
+        const route = [];
+        for (let node = target; node !== -1; node = row.prev[node]) {
+            route.push(index.ids[node]);
+            if (node === source) break;
+        }
+        return route.reverse();
+    },
+
+    // warm every row at once - handy before a heavy trade-route planning pass
+    buildAllPairsRouteTable() {
+        const index = this._getRouteIndex();
+        for (let i = 0; i < index.ids.length; i++) {
+            if (!index.rows[i]) this._buildRouteRow(index, i);
+        }
+        return index.ids.length;
+    },
+
+    getRouteIndexStats() {
+        const index = this._routeIndex;
+        if (!index) return null;
+        return {
+            locations: index.ids.length,
+            paths: index.pathCount,
+            rowsCached: index.rows.filter(Boolean).length,
+            ...index.stats
+        };
+    },
+
+    // Find path between locations using the cached route table
     // Returns an object with the full route (array of location IDs), total distance, and path segments
     findPath(from, to) {
         // If same location, no path needed
@@ -1843,10 +2040,7 @@ const TravelSystem = {
         }
 
         // Check if there's a direct connection first
-        const directPath = this.paths.find(path =>
-            (path.from === from.id && path.to === to.id) ||
-            (path.from === to.id && path.to === from.id)
-        );
+        const directPath = this.getPathBetween(from.id, to.id);
 
         if (directPath) {
             return {
@@ -1861,8 +2055,13 @@ const TravelSystem = {
             };
         }
 
-        // A* pathfinding for multi-hop routes
-        const route = this.aStarPathfind(from.id, to.id);
+        // multi-hop routes come straight out of the cached dijkstra row
+        const index = this._getRouteIndex();
+        const source = index.idIndex.get(from.id);
+        const target = index.idIndex.get(to.id);
+        const route = (source !== undefined && target !== undefined)
+            ? this._routeFromRow(index, this._getRouteRow(index, source), source, target)
+            : null;
 
         if (!route || route.length === 0) {
             // No path found - return wilderness path (direct but dangerous)
@@ -1884,29 +2083,80 @@ const TravelSystem = {
         return this.buildPathFromRoute(route);
     },
 
-    // A* pathfinding algorithm - finds shortest path through connected locations
+    // A* pathfinding on a binary heap - finds shortest path through connected locations
     aStarPathfind(startId, goalId) {
+        const index = this._getRouteIndex();
+        const start = index.idIndex.get(startId);
+        const goal = index.idIndex.get(goalId);
+        if (start === undefined || goal === undefined) return null;
+
+        const locations = this.locations;
+        const goalLoc = locations[goalId];
+        const n = index.ids.length;
+        const gScore = new Float64Array(n).fill(Infinity);
+        const cameFrom = new Int32Array(n).fill(-1);
+        const closed = new Uint8Array(n);
+        const openSet = new MinHeap();
+
+        // scaled so the straight line never overestimates a main-road trip
+        const heuristic = (i) => this.calculateDistance(locations[index.ids[i]], goalLoc) * index.heuristicScale;
+
+        gScore[start] = 0;
+        openSet.push(start, heuristic(start));
+
+        while (openSet.size > 0) {
+            const current = openSet.pop();
+
+            //  Skip if already processed - prevents infinite loop with bidirectional paths 
+            if (closed[current]) continue;
+            closed[current] = 1;
+
+            if (current === goal) {
+                // Reconstruct path
+                const path = [];
+                for (let node = current; node !== -1; node = cameFrom[node]) {
+                    path.push(index.ids[node]);
+                }
+                return path.reverse();
+            }
+
+            for (const edge of index.adjacency[current]) {
+                if (closed[edge.to]) continue;
+
+                const tentativeG = gScore[current] + edge.cost;
+                if (tentativeG < gScore[edge.to]) {
+                    cameFrom[edge.to] = current;
+                    gScore[edge.to] = tentativeG;
+                    openSet.push(edge.to, tentativeG + heuristic(edge.to));
+                }
+            }
+        }
+
+        // No path found
+        return null;
+    },
+
+    // the pre-index A* (sorted array open set, linear path scans) - only kept as the benchmark baseline
+    _aStarPathfindSorted(startId, goalId) {
         const locations = this.locations;
         if (!locations[startId] || !locations[goalId]) return null;
+        const findSegment = (a, b) => this.paths.find(path =>
+            (path.from === a && path.to === b) || (path.from === b && path.to === a)
+        );
 
-        // Priority queue (using array with sorting - not optimal but works)
         const openSet = [startId];
-        const closedSet = new Set(); // track visited nodes to prevent infinite loops
+        const closedSet = new Set();
         const cameFrom = {};
         const gScore = { [startId]: 0 };
         const fScore = { [startId]: this.heuristicDistance(startId, goalId) };
 
         while (openSet.length > 0) {
-            // Get node with lowest fScore
             openSet.sort((a, b) => (fScore[a] || Infinity) - (fScore[b] || Infinity));
             const current = openSet.shift();
-
-            //  Skip if already processed - prevents infinite loop with bidirectional paths 
             if (closedSet.has(current)) continue;
             closedSet.add(current);
 
             if (current === goalId) {
-                // Reconstruct path
                 const path = [current];
                 let node = current;
                 while (cameFrom[node]) {
@@ -1916,42 +2166,145 @@ const TravelSystem = {
                 return path;
             }
 
-            // Get neighbors (connected locations)
-            const currentLoc = locations[current];
-            const neighbors = currentLoc?.connections || [];
-
-            for (const neighborId of neighbors) {
-                //  Skip already visited nodes and invalid locations 
+            for (const neighborId of locations[current]?.connections || []) {
                 if (!locations[neighborId] || closedSet.has(neighborId)) continue;
-
-                // Calculate cost to reach neighbor
-                const pathSegment = this.getPathBetween(current, neighborId);
-                const moveCost = pathSegment?.distance || this.calculateDistance(
-                    locations[current],
-                    locations[neighborId]
-                );
-
-                // Add terrain/path type penalty
-                const pathType = pathSegment?.type || 'trail';
-                const pathInfo = this.PATH_TYPES[pathType] || this.PATH_TYPES.trail;
-                const terrainPenalty = 1 / (pathInfo.speedMultiplier || 0.5); // Slower paths cost more
-
-                const tentativeG = gScore[current] + (moveCost * terrainPenalty);
+                const segment = findSegment(current, neighborId);
+                const moveCost = segment?.distance || this.calculateDistance(locations[current], locations[neighborId]);
+                const pathInfo = this.PATH_TYPES[segment?.type || 'trail'] || this.PATH_TYPES.trail;
+                const tentativeG = gScore[current] + moveCost / (pathInfo.speedMultiplier || 0.5);
 
                 if (tentativeG < (gScore[neighborId] || Infinity)) {
                     cameFrom[neighborId] = current;
                     gScore[neighborId] = tentativeG;
                     fScore[neighborId] = tentativeG + this.heuristicDistance(neighborId, goalId);
+                    if (!openSet.includes(neighborId)) openSet.push(neighborId);
+                }
+            }
+        }
+        return null;
+    },
 
-                    if (!openSet.includes(neighborId)) {
-                        openSet.push(neighborId);
-                    }
+    //
+    // routing benchmark - synthetic worlds from the live map size up to thousands of locations
+    //
+
+    // seeded world so every run compares the same map
+    _createBenchmarkWorld(size, seed = 1337) {
+        let state = seed >>> 0;
+        const random = () => {
+            state = (state * 1664525 + 1013904223) >>> 0;
+            return state / 4294967296;
+        };
+
+        // keep density roughly constant as the world grows
+        const spread = Math.sqrt(size / 42);
+        const types = ['village', 'village', 'town', 'city'];
+        const sizes = { village: 'small', town: 'medium', city: 'large' };
+        const locations = {};
+        const list = [];
+
+        for (let i = 0; i < size; i++) {
+            const type = types[Math.floor(random() * types.length)];
+            const location = {
+                id: `bench_${i}`,
+                name: `Bench ${i}`,
+                type,
+                size: sizes[type],
+                x: random() * 8000 * spread,
+                y: random() * 6000 * spread,
+                connections: []
+            };
+            locations[location.id] = location;
+            list.push(location);
+        }
+
+        // link each location to its 3 nearest neighbours (both directions)
+        for (const location of list) {
+            const nearest = list
+                .filter(other => other !== location)
+                .map(other => ({ other, d: (other.x - location.x) ** 2 + (other.y - location.y) ** 2 }))
+                .sort((a, b) => a.d - b.d)
+                .slice(0, 3);
+            for (const { other } of nearest) {
+                if (!location.connections.includes(other.id)) location.connections.push(other.id);
+                if (!other.connections.includes(location.id)) other.connections.push(location.id);
+            }
+        }
+
+        return locations;
+    },
+
+    benchmarkRouting(options = {}) {
+        const liveSize = Object.keys(this.locations || {}).length || 42;
+        const sizes = options.sizes || [liveSize, 250, 1000, 2500];
+        const queries = options.queries || 200;
+        const sources = options.sources || 20;
+        const legacyMaxNodes = options.legacyMaxNodes ?? 1000;
+        const legacyQueries = Math.min(queries, options.legacyQueries || 20);
+
+        // stash the live world - the benchmark swaps in its own
+        const saved = { locations: this.locations, paths: this.paths, index: this._routeIndex };
+        const results = [];
+
+        try {
+            for (const size of sizes) {
+                this.locations = this._createBenchmarkWorld(size, options.seed);
+                this.generatePaths();
+                const ids = Object.keys(this.locations);
+
+                // same query pairs for every strategy - few sources so warm rows get reused
+                let state = 99;
+                const pick = (n) => {
+                    state = (state * 1103515245 + 12345) & 0x7fffffff;
+                    return state % n;
+                };
+                const sourceIds = Array.from({ length: Math.min(sources, ids.length) }, () => ids[pick(ids.length)]);
+                const pairs = Array.from({ length: queries }, () => [sourceIds[pick(sourceIds.length)], ids[pick(ids.length)]]);
+
+                let legacyMs = null;
+                if (size <= legacyMaxNodes) {
+                    const start = performance.now();
+                    for (let q = 0; q < legacyQueries; q++) this._aStarPathfindSorted(pairs[q][0], pairs[q][1]);
+                    legacyMs = (performance.now() - start) / legacyQueries;
                 }
+
+                let start = performance.now();
+                this.invalidateRouteIndex();
+                this._getRouteIndex();
+                const indexMs = performance.now() - start;
+
+                start = performance.now();
+                for (const [from, to] of pairs) this.aStarPathfind(from, to);
+                const heapMs = (performance.now() - start) / queries;
+
+                start = performance.now();
+                for (const [from, to] of pairs) this.getRouteSummary(from, to);
+                const coldMs = (performance.now() - start) / queries;
+
+                start = performance.now();
+                for (const [from, to] of pairs) this.getRouteSummary(from, to);
+                const warmMs = (performance.now() - start) / queries;
+
+                results.push({
+                    locations: size,
+                    paths: this.paths.length,
+                    legacyAStarMs: legacyMs === null ? 'skipped' : +legacyMs.toFixed(4),
+                    heapAStarMs: +heapMs.toFixed(4),
+                    indexBuildMs: +indexMs.toFixed(3),
+                    tableColdMs: +coldMs.toFixed(4),
+                    tableWarmMs: +warmMs.toFixed(5),
+                    rowKB: +((size * 32) / 1024).toFixed(1)
+                });
             }
+        } finally {
+            this.locations = saved.locations;
+            this.paths = saved.paths;
+            this._routeIndex = saved.index;
         }
 
-        // No path found
-        return null;
+        console.log(`🗺️ TravelSystem routing benchmark (${queries} queries, ${sources} sources):`);
+        console.table(results);
+        return results;
     },
 
     // Heuristic distance for A* (straight line distance)
@@ -1964,10 +2317,7 @@ const TravelSystem = {
 
     // Get the path segment between two directly connected locations
     getPathBetween(fromId, toId) {
-        return this.paths.find(path =>
-            (path.from === fromId && path.to === toId) ||
-            (path.from === toId && path.to === fromId)
-        );
+        return this._getRouteIndex().pairs.get(this._routePairKey(fromId, toId));
     },
 
     // Build full path info from a route array
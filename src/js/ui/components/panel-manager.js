@@ -424,6 +424,9 @@ const PanelManager = {
                 } else {
                     SettingsPanel.show();
                 }
+            } else if (typeof ModuleLoader !== 'undefined') {
+                // not loaded yet, so it can't be open - load and show
+                ModuleLoader.use('settings', () => SettingsPanel.show());
             }
             return;
         }
@@ -465,6 +468,8 @@ const PanelManager = {
         if (panelId === 'settings-panel') {
             if (typeof SettingsPanel !== 'undefined' && SettingsPanel.show) {
                 SettingsPanel.show();
+            } else if (typeof ModuleLoader !== 'undefined') {
+                ModuleLoader.use('settings', () => SettingsPanel.show());
             }
             return;
         }
@@ -273,6 +273,7 @@ const KeyBindings = {
         if (this.matches(event, 'settings')) {
             event.preventDefault();
             if (typeof SettingsPanel !== 'undefined' && SettingsPanel.show) SettingsPanel.show();
+            else if (typeof ModuleLoader !== 'undefined') ModuleLoader.use('settings', () => SettingsPanel.show());
             if (typeof addMessage === 'function') addMessage('⚙️ Settings opened [,]');
             return;
         }
@@ -756,7 +757,9 @@ const KeyBindings = {
     // toggle settings panel
     openSettings() {
         if (typeof SettingsPanel === 'undefined') {
-            console.warn('SettingsPanel not found');
+            // settings loads on first use - once it's in, this toggles it open
+            if (typeof ModuleLoader !== 'undefined') ModuleLoader.use('settings', () => this.openSettings());
+            else console.warn('SettingsPanel not found');
             return;
         }
         const panel = SettingsPanel.panelElement || document.getElementById('settings-panel');
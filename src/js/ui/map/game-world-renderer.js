@@ -153,6 +153,9 @@ const GameWorldRenderer = {
  // resurrect your travel history from localStorage
         this.loadLocationHistory();
 
+ // dom / canvas / auto - remembered between sessions
+        this.loadRenderMode();
+
  // paint the world onto the canvas
         this.render();
 
@@ -651,6 +654,11 @@ const GameWorldRenderer = {
         document.addEventListener('touchmove', (e) => this.onTouchMove(e), { passive: false });
         document.addEventListener('touchend', (e) => this.onTouchEnd(e));
 
+ // Canvas mode hit-testing - markers on canvas have no listeners of their own
+        this.container.addEventListener('mousemove', (e) => this.onCanvasPointerMove(e));
+        this.container.addEventListener('mouseleave', () => this.onCanvasPointerLeave());
+        this.container.addEventListener('click', (e) => this.onCanvasClick(e));
+
         console.log('🗺️ Event listeners attached');
     },
 
@@ -691,10 +699,6 @@ const GameWorldRenderer = {
  // Calculate which locations are visible/explored
         const visibilityMap = this.calculateLocationVisibility();
 
- // Draw connection lines first (behind locations) - only for visible connections
-        this.drawConnections(visibilityMap);
-
- // Calculate label offsets to prevent overlapping text (only for visible locations)
         const locations = this.getActiveLocations();
         const visibleLocations = {};
         Object.entries(locations).forEach(([id, loc]) => {
@@ -702,19 +706,31 @@ const GameWorldRenderer = {
                 visibleLocations[id] = loc;
             }
         });
-        const labelOffsets = this.calculateLabelOffsets(visibleLocations);
+
+ // big worlds (or a forced setting) paint markers and routes onto canvas layers instead
+        if (this.resolveRenderMode(Object.keys(visibleLocations).length) === 'canvas') {
+            this.renderCanvasScene(visibleLocations, visibilityMap);
+        } else {
+            this.detachCanvasLayer();
+
+ // Draw connection lines first (behind locations) - only for visible connections
+            this.drawConnections(visibilityMap);
+
+ // Calculate label offsets to prevent overlapping text (only for visible locations)
+            const labelOffsets = this.calculateLabelOffsets(visibleLocations);
 
  // Draw each location with its calculated label offset and visibility state
-        let createdCount = 0;
-        Object.values(locations).forEach(location => {
-            const visibility = visibilityMap[location.id] || 'hidden';
-            if (visibility !== 'hidden') {
-                const offset = labelOffsets[location.id] || 0;
-                this.createLocationElement(location, offset, visibility);
-                createdCount++;
-            }
-        });
-        console.log(`🗺️ Created ${createdCount} location elements on map`);
+            let createdCount = 0;
+            Object.values(locations).forEach(location => {
+                const visibility = visibilityMap[location.id] || 'hidden';
+                if (visibility !== 'hidden') {
+                    const offset = labelOffsets[location.id] || 0;
+                    this.createLocationElement(location, offset, visibility);
+                    createdCount++;
+                }
+            });
+            console.log(`🗺️ Created ${createdCount} location elements on map`);
+        }
 
  // Apply current transform
         this.updateTransform();
@@ -731,15 +747,345 @@ const GameWorldRenderer = {
         }
     },
 
- // render property markers for player-owned properties
-    renderPropertyMarkers() {
-        if (typeof game === 'undefined' || !game.player || !game.player.ownedProperties) return;
-        if (!Array.isArray(game.player.ownedProperties) || game.player.ownedProperties.length === 0) return;
+    // ═══════════════════════════════════════════════════════════════
+    // CANVAS RENDER MODE - markers and routes painted by MapCanvasLayer
+    // ═══════════════════════════════════════════════════════════════
+ // 'dom' = one element per marker (the classic), 'canvas' = layered canvases,
+ // 'auto' = canvas once the visible world gets big enough to stutter
+    renderMode: 'auto',
+    RENDER_MODE_STORAGE_KEY: 'mapRenderMode',
+    CANVAS_AUTO_THRESHOLD: 150,
+    canvasLayer: null,
+    _canvasHover: null,
+    _canvasPointerDown: null,
+    _arrivedUntil: 0,
+
+    isCanvasMode() {
+        return !!this.canvasLayer && this.canvasLayer.isAttached();
+    },
+
+    resolveRenderMode(visibleCount) {
+        if (typeof MapCanvasLayer === 'undefined' || typeof SpatialGrid === 'undefined') return 'dom';
+        if (this.renderMode === 'canvas') return 'canvas';
+        if (this.renderMode === 'auto' && visibleCount >= this.CANVAS_AUTO_THRESHOLD) return 'canvas';
+        return 'dom';
+    },
+
+    setRenderMode(mode) {
+        if (!['dom', 'canvas', 'auto'].includes(mode)) return false;
+        this.renderMode = mode;
+        try {
+            localStorage.setItem(this.RENDER_MODE_STORAGE_KEY, mode);
+        } catch (e) {
+            // private mode - the setting just won't stick
+        }
+        this.render();
+        return true;
+    },
 
-        const locations = this.getActiveLocations();
+    loadRenderMode() {
+        try {
+            const saved = localStorage.getItem(this.RENDER_MODE_STORAGE_KEY);
+            if (['dom', 'canvas', 'auto'].includes(saved)) this.renderMode = saved;
+        } catch (e) {
+            // stick with the default
+        }
+    },
+
+    detachCanvasLayer() {
+        if (!this.canvasLayer) return;
+        this.canvasLayer.detach();
+        this.canvasLayer = null;
+        this._canvasHover = null;
+    },
+
+ // build the canvas scene - plain objects, no DOM, then one spatial index rebuild
+    renderCanvasScene(visibleLocations, visibilityMap) {
+        if (!this.canvasLayer) {
+            if (!MapCanvasLayer.attach(this)) return;
+            this.canvasLayer = MapCanvasLayer;
+        }
+ // the pin lives on the overlay canvas now - drop the DOM one so nothing pokes at it
+        this.playerMarker = null;
+
+        const currentId = game?.currentLocation?.id;
+        const propertiesByLocation = this.getPropertiesByLocation();
+        const markers = [];
 
- // Group properties by location
+        Object.values(visibleLocations).forEach(location => {
+            const scaledPos = this.scalePosition(location.mapPosition);
+            if (!scaledPos) return;
+            const look = this.getLocationMarkerStyle(location, visibilityMap[location.id]);
+            const properties = propertiesByLocation[location.id];
+
+            markers.push({
+                id: location.id,
+                location,
+                x: scaledPos.x,
+                y: scaledPos.y,
+                size: look.style.size,
+                icon: look.icon,
+                bgColor: look.bgColor,
+                darkColor: look.darkColor,
+                borderColor: look.borderColor,
+                opacity: parseFloat(look.opacity),
+                bonanza: look.hasBonanzaEffect,
+                label: look.label,
+                labelColor: look.labelColor,
+                labelItalic: look.isDiscovered,
+                isDiscovered: look.isDiscovered,
+                isCurrent: location.id === currentId,
+                properties: properties || null,
+                badge: properties ? this.getPropertyBadgeStyle(properties) : null
+            });
+        });
+
+        const routes = this.collectConnections(visibilityMap);
+        this.canvasLayer.setScene(markers, routes);
+        console.log(`🗺️ Canvas scene: ${markers.length} markers, ${routes.length} routes`);
+    },
+
+ // what the pin should say - mirrors the DOM marker's travelling/paused/arrived states
+    getPlayerMarkerState() {
+        const travel = this.currentTravel;
+        if (travel) {
+            const travelData = this.getTravelEmoji(travel.movingRight);
+            const isPaused = typeof TimeSystem !== 'undefined' && (TimeSystem.isPaused || TimeSystem.currentSpeed === 'PAUSED');
+            if (isPaused) {
+                return {
+                    emoji: travelData.emoji,
+                    flip: travelData.needsFlip,
+                    label: `PAUSED (${Math.round((travel.currentProgress || 0) * 100)}%)`,
+                    labelColor: '#777777',
+                    labelAbove: true
+                };
+            }
+            return {
+                emoji: travelData.emoji,
+                flip: travelData.needsFlip,
+                label: travel.returning ? 'RETURNING...' : 'TRAVELING...',
+                labelColor: travel.returning ? '#d4502a' : '#e8662a',
+                labelAbove: true
+            };
+        }
+        if (this._arrivedUntil > performance.now()) {
+            return { emoji: '📌', flip: false, label: 'ARRIVED!', labelColor: '#22cc22', labelAbove: false };
+        }
+        return { emoji: '📌', flip: false, label: 'YOU ARE HERE', labelColor: '#b3102f', labelAbove: false };
+    },
+
+ // no per-marker listeners in canvas mode - the pointer gets hit-tested instead
+    onCanvasPointerMove(e) {
+        if (!this.isCanvasMode() || this.mapState.isDragging) return;
+
+        const hit = this.canvasLayer.hitTest(e.clientX, e.clientY);
+        const hitKey = hit ? (hit.type === 'route' ? `route:${hit.route.key}` : `${hit.type}:${hit.marker.id}`) : null;
+        const previousKey = this._canvasHover?.key || null;
+
+        if (hitKey === previousKey) {
+            if (hit?.type === 'route') this.movePathTooltip(e);
+            return;
+        }
+
+        this.onCanvasPointerLeave();
+        if (!hit) return;
+        this._canvasHover = { key: hitKey, hit };
+
+        if (hit.type === 'location') {
+            this.mapElement.style.cursor = 'pointer';
+            this.onLocationHover(e, hit.marker.location, hit.marker.isDiscovered);
+        } else if (hit.type === 'property') {
+            this.mapElement.style.cursor = 'pointer';
+            const badge = this.canvasLayer.getBadgeRect(hit.marker);
+            const origin = this.container.getBoundingClientRect();
+            const anchor = {
+                getBoundingClientRect: () => ({
+                    left: origin.left + badge.left,
+                    top: origin.top + badge.top,
+                    right: origin.left + badge.right,
+                    bottom: origin.top + badge.bottom
+                })
+            };
+            this.showPropertyTooltip(hit.marker.location, hit.marker.properties, anchor);
+        } else {
+            const route = hit.route;
+            this.mapElement.style.cursor = 'help';
+ // path info is only worked out for the route you actually hover
+            if (!route.pathInfo) route.pathInfo = this.getPathInfo(route.location, route.target);
+            this.showPathTooltip(e, route.pathInfo, route.location, route.target, route.bothExplored);
+            this.canvasLayer.setRouteHighlight(route);
+        }
+    },
+
+    onCanvasPointerLeave() {
+        if (!this._canvasHover) return;
+        if (this._canvasHover.hit.type === 'route' && this.canvasLayer) {
+            this.canvasLayer.setRouteHighlight(null);
+        }
+        this._canvasHover = null;
+        this.hideTooltip();
+        if (this.mapElement && !this.mapState.isDragging) this.mapElement.style.cursor = 'grab';
+    },
+
+    onCanvasClick(e) {
+        if (!this.isCanvasMode()) return;
+ // a drag that happens to end on a marker isn't a click
+        const down = this._canvasPointerDown;
+        if (down && Math.hypot(e.clientX - down.x, e.clientY - down.y) > 4) return;
+
+        const hit = this.canvasLayer.hitTest(e.clientX, e.clientY);
+        if (!hit) return;
+        if (hit.type === 'location') {
+            this.onLocationClick(e, hit.marker.location, hit.marker.isDiscovered);
+        } else if (hit.type === 'property') {
+            e.stopPropagation();
+            if (typeof PropertyEmployeeUI !== 'undefined') {
+                PropertyEmployeeUI.openPropertyEmployeePanel();
+            }
+        }
+    },
+
+    /**
+     * Frame-time benchmark - DOM markers vs canvas layers on the same world
+     * Times a full render, a pan/zoom sweep and a travel animation run per mode.
+     * Layout is forced after each DOM frame so the reflow cost shows up in the numbers.
+     * @param {Object} [options]
+     * @param {number} [options.frames=120] - Pan and travel frames per mode
+     * @param {number} [options.locations=0] - Swap in a synthetic grid world this big (0 = the real world)
+     * @returns {Array} One row per mode
+     */
+    benchmarkRenderModes({ frames = 120, locations = 0 } = {}) {
+        if (!this.mapElement || !this.container) {
+            console.warn('🗺️ benchmarkRenderModes: map not initialised');
+            return [];
+        }
+
+        const savedMode = this.renderMode;
+        const savedState = { ...this.mapState };
+        const savedTravel = this.currentTravel;
+        const originalGetLocations = this.getActiveLocations;
+        const originalVisibility = this.calculateLocationVisibility;
+        const originalLog = console.log;
+
+        // a grid world with 4-neighbour roads, all explored - the worst case for marker count
+        if (locations > 0) {
+            const side = Math.ceil(Math.sqrt(locations));
+            const types = Object.keys(this.locationStyles);
+            const world = {};
+            for (let i = 0; i < locations; i++) {
+                const col = i % side;
+                const row = Math.floor(i / side);
+                const connections = [];
+                if (col + 1 < side && i + 1 < locations) connections.push(`bench_${i + 1}`);
+                if (i + side < locations) connections.push(`bench_${i + side}`);
+                world[`bench_${i}`] = {
+                    id: `bench_${i}`,
+                    name: `Bench ${i}`,
+                    type: types[i % types.length],
+                    region: 'benchmark',
+                    mapPosition: { x: (col + 0.5) * (this.ORIGINAL_WIDTH / side), y: (row + 0.5) * (this.ORIGINAL_HEIGHT / side) },
+                    connections
+                };
+            }
+            this.getActiveLocations = () => world;
+            this.calculateLocationVisibility = () => Object.fromEntries(Object.keys(world).map(id => [id, 'visible']));
+        }
+
+        const percentile = (values, p) => {
+            const sorted = [...values].sort((a, b) => a - b);
+            return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+        };
+        const round = (n) => +n.toFixed(3);
+        const rows = [];
+
+        try {
+            console.log = () => {}; // render() is chatty - keep the table readable
+            for (const mode of ['dom', 'canvas']) {
+                this.renderMode = mode;
+                this.currentTravel = null;
+                Object.assign(this.mapState, savedState);
+
+                // a frame = the work + whatever layout/paint prep it forces
+                const settle = () => {
+                    if (this.isCanvasMode()) {
+                        this.canvasLayer.redrawNow();
+                    } else {
+                        void this.mapElement.offsetHeight;
+                    }
+                };
+
+                let start = performance.now();
+                this.render();
+                settle();
+                const renderMs = performance.now() - start;
+                const elementCount = this.mapElement.querySelectorAll('*').length;
+
+                // pan + zoom sweep - what stutters while dragging around a big world
+                const panTimes = [];
+                for (let i = 0; i < frames; i++) {
+                    start = performance.now();
+                    this.mapState.offsetX = savedState.offsetX + Math.sin(i / 10) * 300;
+                    this.mapState.offsetY = savedState.offsetY + Math.cos(i / 10) * 200;
+                    this.mapState.zoom = Math.max(this.mapState.minZoom, Math.min(this.mapState.maxZoom, 1 + Math.sin(i / 15) * 0.5));
+                    this.updateTransform();
+                    settle();
+                    panTimes.push(performance.now() - start);
+                }
+                Object.assign(this.mapState, savedState);
+                this.updateTransform();
+                settle();
+
+                // travel frames - only the pin moves
+                const travelTimes = [];
+                const from = { x: this.MAP_WIDTH * 0.25, y: this.MAP_HEIGHT * 0.5 };
+                const to = { x: this.MAP_WIDTH * 0.75, y: this.MAP_HEIGHT * 0.4 };
+                for (let i = 0; i < frames; i++) {
+                    const t = i / frames;
+                    start = performance.now();
+                    this.updatePlayerMarker(from.x + (to.x - from.x) * t, from.y + (to.y - from.y) * t, true);
+                    if (this.isCanvasMode()) {
+                        this.canvasLayer._flushOverlay();
+                    } else {
+                        void this.mapElement.offsetHeight;
+                    }
+                    travelTimes.push(performance.now() - start);
+                }
+
+                const canvasStats = this.isCanvasMode() ? this.canvasLayer.getStats() : null;
+                rows.push({
+                    mode,
+                    locations: Object.keys(this.getActiveLocations()).length,
+                    domElements: elementCount,
+                    renderMs: round(renderMs),
+                    panAvgMs: round(panTimes.reduce((a, b) => a + b, 0) / frames),
+                    panP95Ms: round(percentile(panTimes, 0.95)),
+                    travelAvgMs: round(travelTimes.reduce((a, b) => a + b, 0) / frames),
+                    travelP95Ms: round(percentile(travelTimes, 0.95)),
+                    markersDrawn: canvasStats ? canvasStats.markersDrawn : '-',
+                    overlayRepaint: canvasStats ? canvasStats.overlayRepaintRatio : '-'
+                });
+            }
+        } finally {
+            console.log = originalLog;
+            this.getActiveLocations = originalGetLocations;
+            this.calculateLocationVisibility = originalVisibility;
+            this.currentTravel = savedTravel;
+            this.renderMode = savedMode;
+            Object.assign(this.mapState, savedState);
+            this.render();
+        }
+
+        console.log(`🗺️ Map render benchmark (${frames} frames per phase)`);
+        console.table(rows);
+        return rows;
+    },
+
+ // Group player-owned properties by location
+    getPropertiesByLocation() {
         const propertiesByLocation = {};
+        if (typeof game === 'undefined' || !game.player || !Array.isArray(game.player.ownedProperties)) {
+            return propertiesByLocation;
+        }
         game.player.ownedProperties.forEach(property => {
             const locId = property.location;
             if (!propertiesByLocation[locId]) {
@@ -747,6 +1093,18 @@ const GameWorldRenderer = {
             }
             propertiesByLocation[locId].push(property);
         });
+        return propertiesByLocation;
+    },
+
+ // render property markers for player-owned properties
+    renderPropertyMarkers() {
+        if (typeof game === 'undefined' || !game.player || !game.player.ownedProperties) return;
+        if (!Array.isArray(game.player.ownedProperties) || game.player.ownedProperties.length === 0) return;
+ // canvas mode paints the badges with the location markers
+        if (this.isCanvasMode()) return;
+
+        const locations = this.getActiveLocations();
+        const propertiesByLocation = this.getPropertiesByLocation();
 
  // Render markers for each location with properties
         Object.entries(propertiesByLocation).forEach(([locationId, properties]) => {
@@ -757,34 +1115,39 @@ const GameWorldRenderer = {
         });
     },
 
- // create a property marker badge at a location
-    createPropertyMarker(location, properties) {
-        if (!location.mapPosition) return;
-
- // scale position for larger map
-        const scaledPos = this.scalePosition(location.mapPosition);
-        if (!scaledPos) return;
-
-        const style = this.locationStyles[location.type] || this.locationStyles.town;
-
+ // badge color/icon by majority property state
+    getPropertyBadgeStyle(properties) {
  // Count different property states
         const underConstruction = properties.filter(p => p.underConstruction).length;
         const rented = properties.filter(p => p.isRented && !p.underConstruction).length;
         const owned = properties.filter(p => !p.isRented && !p.underConstruction).length;
-        const total = properties.length;
 
  // Determine badge color based on majority type
-        let badgeColor = '#4CAF50'; // green for owned
-        let badgeIcon = '🏠';
+        let color = '#4CAF50'; // green for owned
+        let icon = '🏠';
 
         if (underConstruction > 0 && underConstruction >= owned && underConstruction >= rented) {
-            badgeColor = '#FF9800'; // orange for construction
-            badgeIcon = '🔨';
+            color = '#FF9800'; // orange for construction
+            icon = '🔨';
         } else if (rented > 0 && rented >= owned) {
-            badgeColor = '#2196F3'; // blue for rented
-            badgeIcon = '📝';
+            color = '#2196F3'; // blue for rented
+            icon = '📝';
         }
 
+        return { color, icon, count: properties.length, borderColor: this.lightenColor(color, 20) };
+    },
+
+ // create a property marker badge at a location
+    createPropertyMarker(location, properties) {
+        if (!location.mapPosition) return;
+
+ // scale position for larger map
+        const scaledPos = this.scalePosition(location.mapPosition);
+        if (!scaledPos) return;
+
+        const style = this.locationStyles[location.type] || this.locationStyles.town;
+        const { color: badgeColor, icon: badgeIcon, count: total } = this.getPropertyBadgeStyle(properties);
+
  // Create property marker badge
         const marker = document.createElement('div');
         marker.className = 'property-marker-badge';
@@ -1119,19 +1482,9 @@ const GameWorldRenderer = {
         }
     },
 
- // draw the threads of fate connecting your doom to various destinations
-    drawConnections(visibilityMap = {}) {
-        const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
-        svg.setAttribute('width', this.MAP_WIDTH.toString());
-        svg.setAttribute('height', this.MAP_HEIGHT.toString());
-        svg.style.cssText = `
-            position: absolute;
-            top: 0;
-            left: 0;
-            pointer-events: none;
-            z-index: 10; /* 🖤 ABOVE weather (2-3) - matches --z-map-connections 💀 */
-        `;
-
+ // every connection worth drawing - both ends visible or discovered, each pair once
+ // shared by the SVG lines and the canvas route layer
+    collectConnections(visibilityMap = {}) {
         const locations = this.getActiveLocations();
         // Get visited locations based on current mode (tutorial vs normal)
         // Use world-aware helper for doom/normal world separation
@@ -1143,7 +1496,9 @@ const GameWorldRenderer = {
                 ? GameWorld.getActiveVisitedLocations()
                 : (GameWorld.visitedLocations || []);
         }
+        const visitedSet = new Set(visited);
         const drawnConnections = new Set();
+        const connections = [];
 
         Object.values(locations).forEach(location => {
             if (!location.connections || !location.mapPosition) return;
@@ -1170,72 +1525,102 @@ const GameWorldRenderer = {
                 const scaledTo = this.scalePosition(target.mapPosition);
                 if (!scaledFrom || !scaledTo) return;
 
+ // Color based on exploration status
+                const bothExplored = visitedSet.has(location.id) && visitedSet.has(targetId);
+                const oneExplored = visitedSet.has(location.id) || visitedSet.has(targetId);
+
+                connections.push({
+                    key: connectionKey,
+                    location,
+                    target,
+                    x1: scaledFrom.x,
+                    y1: scaledFrom.y,
+                    x2: scaledTo.x,
+                    y2: scaledTo.y,
+                    bothExplored,
+                    ...this.getConnectionStroke(bothExplored, oneExplored)
+                });
+            });
+        });
+
+        return connections;
+    },
+
+    getConnectionStroke(bothExplored, oneExplored) {
+        if (bothExplored) {
+ // Fully explored path - gold
+            return { stroke: 'rgba(255, 215, 0, 0.5)', width: 3, dash: null };
+        } else if (oneExplored) {
+ // Partially explored - faded gold
+            return { stroke: 'rgba(255, 215, 0, 0.25)', width: 2, dash: [5, 5] };
+        }
+ // Discovered but not explored - grey
+        return { stroke: 'rgba(150, 150, 150, 0.3)', width: 2, dash: [5, 5] };
+    },
+
+ // draw the threads of fate connecting your doom to various destinations
+    drawConnections(visibilityMap = {}) {
+        const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
+        svg.setAttribute('width', this.MAP_WIDTH.toString());
+        svg.setAttribute('height', this.MAP_HEIGHT.toString());
+        svg.style.cssText = `
+            position: absolute;
+            top: 0;
+            left: 0;
+            pointer-events: none;
+            z-index: 10; /* 🖤 ABOVE weather (2-3) - matches --z-map-connections 💀 */
+        `;
+
+        this.collectConnections(visibilityMap).forEach(connection => {
+            const { location, target, bothExplored } = connection;
+
  // Create a group for the path (visible line + invisible hitbox)
-                const group = document.createElementNS('http://www.w3.org/2000/svg', 'g');
-                group.style.cursor = 'help';
+            const group = document.createElementNS('http://www.w3.org/2000/svg', 'g');
+            group.style.cursor = 'help';
 
  // Calculate path info for tooltip
-                const pathInfo = this.getPathInfo(location, target);
+            const pathInfo = this.getPathInfo(location, target);
 
  // Invisible wider line for easier hovering
-                const hitbox = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-                hitbox.setAttribute('x1', scaledFrom.x);
-                hitbox.setAttribute('y1', scaledFrom.y);
-                hitbox.setAttribute('x2', scaledTo.x);
-                hitbox.setAttribute('y2', scaledTo.y);
-                hitbox.setAttribute('stroke', 'transparent');
-                hitbox.setAttribute('stroke-width', '20');
-                hitbox.style.pointerEvents = 'stroke';
+            const hitbox = document.createElementNS('http://www.w3.org/2000/svg', 'line');
+            hitbox.setAttribute('x1', connection.x1);
+            hitbox.setAttribute('y1', connection.y1);
+            hitbox.setAttribute('x2', connection.x2);
+            hitbox.setAttribute('y2', connection.y2);
+            hitbox.setAttribute('stroke', 'transparent');
+            hitbox.setAttribute('stroke-width', '20');
+            hitbox.style.pointerEvents = 'stroke';
 
  // Visible path line
-                const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-                line.setAttribute('x1', scaledFrom.x);
-                line.setAttribute('y1', scaledFrom.y);
-                line.setAttribute('x2', scaledTo.x);
-                line.setAttribute('y2', scaledTo.y);
-                line.style.pointerEvents = 'none';
-
- // Color based on exploration status
-                const bothExplored = visited.includes(location.id) && visited.includes(targetId);
-                const oneExplored = visited.includes(location.id) || visited.includes(targetId);
-
-                if (bothExplored) {
- // Fully explored path - gold
-                    line.setAttribute('stroke', 'rgba(255, 215, 0, 0.5)');
-                    line.setAttribute('stroke-width', '3');
-                    line.setAttribute('stroke-dasharray', 'none');
-                } else if (oneExplored) {
- // Partially explored - faded gold
-                    line.setAttribute('stroke', 'rgba(255, 215, 0, 0.25)');
-                    line.setAttribute('stroke-width', '2');
-                    line.setAttribute('stroke-dasharray', '5,5');
-                } else {
- // Discovered but not explored - grey
-                    line.setAttribute('stroke', 'rgba(150, 150, 150, 0.3)');
-                    line.setAttribute('stroke-width', '2');
-                    line.setAttribute('stroke-dasharray', '5,5');
-                }
+            const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
+            line.setAttribute('x1', connection.x1);
+            line.setAttribute('y1', connection.y1);
+            line.setAttribute('x2', connection.x2);
+            line.setAttribute('y2', connection.y2);
+            line.style.pointerEvents = 'none';
+            line.setAttribute('stroke', connection.stroke);
+            line.setAttribute('stroke-width', String(connection.width));
+            line.setAttribute('stroke-dasharray', connection.dash ? connection.dash.join(',') : 'none');
 
  // Add hover events for tooltip
  // FIX: Only show detailed path info if BOTH locations are explored 
-                hitbox.addEventListener('mouseenter', (e) => {
-                    this.showPathTooltip(e, pathInfo, location, target, bothExplored);
-                    line.setAttribute('stroke-width', bothExplored ? '5' : '4');
-                    line.style.filter = 'drop-shadow(0 0 4px rgba(255, 215, 0, 0.8))';
-                });
-                hitbox.addEventListener('mousemove', (e) => {
-                    this.movePathTooltip(e);
-                });
-                hitbox.addEventListener('mouseleave', () => {
-                    this.hidePathTooltip();
-                    line.setAttribute('stroke-width', bothExplored ? '3' : '2');
-                    line.style.filter = 'none';
-                });
-
-                group.appendChild(line);
-                group.appendChild(hitbox);
-                svg.appendChild(group);
+            hitbox.addEventListener('mouseenter', (e) => {
+                this.showPathTooltip(e, pathInfo, location, target, bothExplored);
+                line.setAttribute('stroke-width', bothExplored ? '5' : '4');
+                line.style.filter = 'drop-shadow(0 0 4px rgba(255, 215, 0, 0.8))';
+            });
+            hitbox.addEventListener('mousemove', (e) => {
+                this.movePathTooltip(e);
             });
+            hitbox.addEventListener('mouseleave', () => {
+                this.hidePathTooltip();
+                line.setAttribute('stroke-width', bothExplored ? '3' : '2');
+                line.style.filter = 'none';
+            });
+
+            group.appendChild(line);
+            group.appendChild(hitbox);
+            svg.appendChild(group);
         });
 
         this.mapElement.appendChild(svg);
@@ -1512,6 +1897,39 @@ const GameWorldRenderer = {
         this.tooltipElement.style.display = 'none';
     },
 
+ // how a location marker looks - shared by the DOM elements and the canvas layer
+    getLocationMarkerStyle(location, visibility = 'visible') {
+        const style = this.locationStyles[location.type] || this.locationStyles.town;
+        const isDiscovered = visibility === 'discovered';
+
+ // check if July 18th Dungeon Bonanza is active AND this is a dungeon type
+        const dungeonTypes = ['dungeon', 'cave', 'ruins'];
+        const isDungeonType = dungeonTypes.includes(location.type);
+        const isBonanzaActive = typeof DungeonBonanzaSystem !== 'undefined' && DungeonBonanzaSystem.isDungeonBonanzaDay();
+        const hasBonanzaEffect = isDungeonType && isBonanzaActive && !isDiscovered;
+
+ // For discovered (unexplored) locations - make them VISIBLE but mysterious
+ // grey but solid, not translucent - players need to SEE where they can go!
+        const bgColor = isDiscovered ? '#4a4a5a' : style.color;
+        const isGate = this.isGatehouse(location.id);
+
+        return {
+            style,
+            isDiscovered,
+            hasBonanzaEffect,
+            bgColor,
+            darkColor: this.darkenColor(bgColor, 30),
+            borderColor: isDiscovered ? '#8888aa' : (hasBonanzaEffect ? '#a855f7' : this.lightenColor(style.color, 20)),
+            opacity: isDiscovered ? '0.9' : '1',
+            iconFilter: isDiscovered ? 'grayscale(80%)' : 'none',
+ // Show question mark for undiscovered, icon for explored
+            icon: isDiscovered ? '❓' : style.icon,
+            // use getLocationName for proper doom world name support
+            label: (isDiscovered && !isGate) ? '???' : this.getLocationName(location.id),
+            labelColor: isDiscovered ? '#aabbcc' : '#fff'
+        };
+    },
+
  // birth a location into existence on the map
  // visible = you've been there, discovered = mysterious fog vibes, hidden = doesn't exist yet
     createLocationElement(location, labelOffset = 0, visibility = 'visible') {
@@ -1522,25 +1940,13 @@ const GameWorldRenderer = {
         const scaledPos = this.scalePosition(location.mapPosition);
         if (!scaledPos) return;
 
-        const style = this.locationStyles[location.type] || this.locationStyles.town;
-        const isDiscovered = visibility === 'discovered';
+        const look = this.getLocationMarkerStyle(location, visibility);
+        const { style, isDiscovered, bgColor, borderColor, opacity, iconFilter, hasBonanzaEffect } = look;
         const el = document.createElement('div');
         el.className = 'map-location' + (isDiscovered ? ' discovered' : '');
         el.dataset.locationId = location.id;
         el.dataset.visibility = visibility;
 
- // check if July 18th Dungeon Bonanza is active AND this is a dungeon type
-        const dungeonTypes = ['dungeon', 'cave', 'ruins'];
-        const isDungeonType = dungeonTypes.includes(location.type);
-        const isBonanzaActive = typeof DungeonBonanzaSystem !== 'undefined' && DungeonBonanzaSystem.isDungeonBonanzaDay();
-        const hasBonanzaEffect = isDungeonType && isBonanzaActive && !isDiscovered;
-
- // For discovered (unexplored) locations - make them VISIBLE but mysterious
- // grey but solid, not translucent - players need to SEE where they can go!
-        const bgColor = isDiscovered ? '#4a4a5a' : style.color;
-        const borderColor = isDiscovered ? '#8888aa' : (hasBonanzaEffect ? '#a855f7' : this.lightenColor(style.color, 20));
-        const opacity = isDiscovered ? '0.9' : '1';
-        const iconFilter = isDiscovered ? 'grayscale(80%)' : 'none';
  // purple glow for dungeons during bonanza
         const boxShadowStyle = hasBonanzaEffect
             ? '0 0 20px 8px rgba(168, 85, 247, 0.7), 0 0 40px 15px rgba(168, 85, 247, 0.4)'
@@ -1553,7 +1959,7 @@ const GameWorldRenderer = {
             transform: translate(-50%, -50%);
             width: ${style.size}px;
             height: ${style.size}px;
-            background: radial-gradient(circle, ${bgColor} 0%, ${this.darkenColor(bgColor, 30)} 100%);
+            background: radial-gradient(circle, ${bgColor} 0%, ${look.darkColor} 100%);
             border: 3px solid ${borderColor};
             border-radius: 50%;
             display: flex;
@@ -1570,7 +1976,7 @@ const GameWorldRenderer = {
         `;
 
  // Show question mark for undiscovered, icon for explored
-        el.innerHTML = isDiscovered ? '❓' : style.icon;
+        el.innerHTML = look.icon;
         el.draggable = false; // Prevent browser drag behavior
 
  // add "30m" badge for dungeons during bonanza
@@ -1604,11 +2010,7 @@ const GameWorldRenderer = {
  // Add label as child of location element (tied together)
         const label = document.createElement('div');
         label.className = 'map-location-label' + (isDiscovered ? ' discovered' : '');
-
-        const isGate = this.isGatehouse(location.id);
-        // use getLocationName for proper doom world name support
-        const locationName = this.getLocationName(location.id);
-        label.textContent = (isDiscovered && !isGate) ? '???' : locationName;
+        label.textContent = look.label;
 
  // position label ABOVE icon so YOU ARE HERE marker doesn't cover it 
         label.style.cssText = `
@@ -1684,6 +2086,12 @@ const GameWorldRenderer = {
             }
         }
 
+ // canvas mode: the pin is an overlay item - moving it only repaints its old and new footprint
+        if (this.isCanvasMode()) {
+            this.canvasLayer.setPlayer(x, y, this.getPlayerMarkerState());
+            return;
+        }
+
  // create marker if it doesn't exist OR if it was removed from DOM (render() clears innerHTML)
  // Check if marker exists AND is still in the DOM - if not, recreate it
  // Guard against null mapElement to prevent crash 
@@ -1975,6 +2383,10 @@ const GameWorldRenderer = {
                 <div class="marker-pulse" style="position: absolute; bottom: 0px; width: 16px; height: 16px; background: rgba(255, 136, 68, 0.5); border-radius: 50%; animation: marker-pulse 2s ease-out infinite; z-index: 100;"></div>
                 <div class="marker-label" style="background: ${labelBg}; color: white; font-size: 9px; font-weight: bold; padding: 4px 10px; border-radius: 12px; white-space: nowrap; margin-bottom: 4px; box-shadow: 0 3px 10px rgba(0,0,0,0.5); border: 2px solid rgba(255,255,255,0.8); z-index: 151; letter-spacing: 0.5px; text-transform: uppercase;">${labelText}</div>
             `;
+        } else if (this.isCanvasMode() && typeof TravelSystem !== 'undefined' && TravelSystem.playerPosition?._isReturning) {
+ // canvas pin reads the returning state off currentTravel
+            this.currentTravel.returning = true;
+            delete TravelSystem.playerPosition._isReturning;
         }
 
         console.log('🗺️ animateTravel: Starting travel animation', {
@@ -2104,6 +2516,12 @@ const GameWorldRenderer = {
             currentY = travel.startY + (travel.endY - travel.startY) * easeProgress;
         }
 
+ // canvas pin picks its facing from travel.movingRight - keep it current before drawing
+        if (this.isCanvasMode()) {
+            const segmentMovingRight = this.getTravelSegmentDirection(travel, progress);
+            if (segmentMovingRight !== null) travel.movingRight = segmentMovingRight;
+        }
+
  // Update marker position (pass alreadyScaled=true since travel coords are pre-scaled)
         this.updatePlayerMarker(currentX, currentY, true);
 
@@ -2129,49 +2547,17 @@ const GameWorldRenderer = {
 
             // Update direction based on SEGMENT destination, not frame-by-frame movement
             // Frame-by-frame causes flickering when position barely changes between frames
-            if (travel.waypoints && travel.waypoints.length > 1) {
-                // Find current segment's target waypoint and determine direction from that
-                const waypoints = travel.waypoints;
-                const numSegments = waypoints.length - 1;
-
-                // Calculate which segment we're on (same logic as position calculation above)
-                let totalDist = 0;
-                const segmentDists = [];
-                for (let i = 0; i < numSegments; i++) {
-                    const dx = waypoints[i + 1].x - waypoints[i].x;
-                    const dy = waypoints[i + 1].y - waypoints[i].y;
-                    segmentDists.push(Math.sqrt(dx * dx + dy * dy));
-                    totalDist += segmentDists[i];
-                }
-
-                let targetDist = progress * totalDist;
-                let accumDist = 0;
-                let segmentIndex = 0;
-                for (let i = 0; i < numSegments; i++) {
-                    if (accumDist + segmentDists[i] >= targetDist) {
-                        segmentIndex = i;
-                        break;
-                    }
-                    accumDist += segmentDists[i];
-                    segmentIndex = i;
-                }
-                if (segmentIndex >= numSegments) segmentIndex = numSegments - 1;
-
-                // Get segment direction: is the target waypoint to the right of start waypoint?
-                const segmentStart = waypoints[segmentIndex];
-                const segmentEnd = waypoints[segmentIndex + 1] || waypoints[waypoints.length - 1];
-                const segmentMovingRight = segmentEnd.x > segmentStart.x;
-
-                // Only update emoji if segment direction changed
-                if (segmentMovingRight !== travel.movingRight) {
-                    travel.movingRight = segmentMovingRight;
-                    const span = this.playerMarker.querySelector('.walk-emoji');
-                    if (span) {
-                        // Get updated travel emoji for new direction
-                        const travelData = this.getTravelEmoji(travel.movingRight);
-                        span.textContent = travelData.emoji;
-                        span.style.transform = travelData.needsFlip ? 'scaleX(-1)' : '';
-                    }
+            const segmentMovingRight = this.getTravelSegmentDirection(travel, progress);
+
+            // Only update emoji if segment direction changed
+            if (segmentMovingRight !== null && segmentMovingRight !== travel.movingRight) {
+                travel.movingRight = segmentMovingRight;
+                const span = this.playerMarker.querySelector('.walk-emoji');
+                if (span) {
+                    // Get updated travel emoji for new direction
+                    const travelData = this.getTravelEmoji(travel.movingRight);
+                    span.textContent = travelData.emoji;
+                    span.style.transform = travelData.needsFlip ? 'scaleX(-1)' : '';
                 }
             }
             travel.lastX = currentX;
@@ -2204,6 +2590,43 @@ const GameWorldRenderer = {
         }
     },
 
+ // which way the current waypoint segment heads - null on a beeline
+    getTravelSegmentDirection(travel, progress) {
+        if (!travel.waypoints || travel.waypoints.length < 2) return null;
+
+        // Find current segment's target waypoint and determine direction from that
+        const waypoints = travel.waypoints;
+        const numSegments = waypoints.length - 1;
+
+        // Calculate which segment we're on (same logic as position calculation)
+        let totalDist = 0;
+        const segmentDists = [];
+        for (let i = 0; i < numSegments; i++) {
+            const dx = waypoints[i + 1].x - waypoints[i].x;
+            const dy = waypoints[i + 1].y - waypoints[i].y;
+            segmentDists.push(Math.sqrt(dx * dx + dy * dy));
+            totalDist += segmentDists[i];
+        }
+
+        let targetDist = progress * totalDist;
+        let accumDist = 0;
+        let segmentIndex = 0;
+        for (let i = 0; i < numSegments; i++) {
+            if (accumDist + segmentDists[i] >= targetDist) {
+                segmentIndex = i;
+                break;
+            }
+            accumDist += segmentDists[i];
+            segmentIndex = i;
+        }
+        if (segmentIndex >= numSegments) segmentIndex = numSegments - 1;
+
+        // Get segment direction: is the target waypoint to the right of start waypoint?
+        const segmentStart = waypoints[segmentIndex];
+        const segmentEnd = waypoints[segmentIndex + 1] || waypoints[waypoints.length - 1];
+        return segmentEnd.x > segmentStart.x;
+    },
+
  // the journey is over... for now 
     completeTravelAnimation() {
         console.log('🗺️ Travel animation complete!');
@@ -2252,6 +2675,14 @@ const GameWorldRenderer = {
             }, 2000);
         }
 
+ // canvas pin shows ARRIVED! for the same 2 seconds, then goes back to YOU ARE HERE
+        if (this.isCanvasMode()) {
+            this._arrivedUntil = performance.now() + 2000;
+            setTimeout(() => {
+                if (this.isCanvasMode() && !this.currentTravel) this.updatePlayerMarker();
+            }, 2000);
+        }
+
  // Add arrival animation styles if not already present
         this.addArrivalStyles();
 
@@ -2329,6 +2760,12 @@ const GameWorldRenderer = {
         const transform = `translate(${this.mapState.offsetX}px, ${this.mapState.offsetY}px) scale(${this.mapState.zoom})`;
         this.mapElement.style.transform = transform;
 
+ // canvas layers sit outside the transformed element - repaint them for the new view
+        if (this.isCanvasMode()) {
+            this.canvasLayer.invalidate();
+            return;
+        }
+
  // counter-scale location markers and labels so they stay readable when zoomed out
  // When zoomed out to 0.3, we want markers to be ~2x bigger than they'd naturally be
  // This keeps them visible and clickable even at max zoom out
@@ -2435,6 +2872,12 @@ const GameWorldRenderer = {
  // mouse events - translating human frustration into map movement
     onMouseDown(e) {
         if (e.target.classList.contains('map-location')) return; // Don't drag when clicking locations
+        this._canvasPointerDown = { x: e.clientX, y: e.clientY };
+        if (this.isCanvasMode()) {
+            const hit = this.canvasLayer.hitTest(e.clientX, e.clientY);
+            if (hit && hit.type !== 'route') return; // same rule for painted markers
+            this.onCanvasPointerLeave();
+        }
 
         e.preventDefault();
         this.mapState.isDragging = true;
@@ -2480,6 +2923,7 @@ const GameWorldRenderer = {
  // NO marker scaling - that causes the stutter! 
  // Just raw, pure CSS transform - exactly what the mouse dictates
         this.mapElement.style.transform = `translate(${this.mapState.offsetX}px, ${this.mapState.offsetY}px) scale(${this.mapState.zoom})`;
+        if (this.isCanvasMode()) this.canvasLayer.invalidate();
     },
 
  // zoom handlers - for when you need to see your problems closer or further away
@@ -3471,6 +3915,8 @@ const GameWorldRenderer = {
 
  // cleanup before re-initialization - prevents stale DOM elements 
     cleanup() {
+        this.detachCanvasLayer();
+
  // Remove tooltip element
         if (this.tooltipElement && this.tooltipElement.parentNode) {
             this.tooltipElement.remove();
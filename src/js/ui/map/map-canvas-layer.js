@@ -0,0 +1,648 @@
+// ═══════════════════════════════════════════════════════════════
+// MAP CANVAS LAYER - the world map painted instead of built
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+// GameWorldRenderer's canvas render mode. three viewport-sized canvases
+// stacked over the map container:
+//   routes  - path lines, redrawn on pan/zoom/render
+//   markers - locations, labels and property badges, same cadence
+//   overlay - player pin, hover glow - redrawn by dirty rectangle only
+// only what's inside the viewport gets drawn, and hit-testing for
+// tooltips/clicks goes through SpatialGrid instead of per-element listeners.
+// the backdrop, weather and quest markers stay DOM inside the map element.
+
+const MapCanvasLayer = {
+    renderer: null,
+    container: null,
+    canvases: {},
+    contexts: {},
+    _width: 0,
+    _height: 0,
+    _dpr: 1,
+
+    // scene - built by GameWorldRenderer.render(), all positions in map pixels
+    markers: [],
+    routes: [],
+    _markerGrid: null,
+    _routeGrid: null,
+    _maxMarkerSize: 0,
+
+    // pending redraws - coalesced to one per animation frame
+    _staticFrame: null,
+    _overlayFrame: null,
+    _overlayItems: new Map(),
+    _dirtyRects: [],
+    _overlayFull: true,
+
+    // route hover tolerance in map pixels - matches the old 20px SVG hitbox
+    ROUTE_HIT_TOLERANCE: 10,
+
+    stats: {
+        staticDraws: 0,
+        overlayDraws: 0,
+        lastStaticMs: 0,
+        markersDrawn: 0,
+        routesDrawn: 0,
+        dirtyPixels: 0,
+        fullPixels: 0
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // lifecycle
+    // ═══════════════════════════════════════════════════════════════
+
+    attach(renderer) {
+        if (this.isAttached()) return true;
+        if (!renderer?.container || typeof SpatialGrid === 'undefined') return false;
+
+        this.renderer = renderer;
+        this.container = renderer.container;
+
+        // z-order mirrors the DOM mode: connections 10, locations 15, player 20
+        const layerZ = { routes: 10, markers: 15, overlay: 20 };
+        for (const [name, z] of Object.entries(layerZ)) {
+            const canvas = document.createElement('canvas');
+            canvas.id = `world-map-canvas-${name}`;
+            canvas.className = 'world-map-canvas-layer';
+            canvas.style.cssText = `
+                position: absolute;
+                top: 0;
+                left: 0;
+                pointer-events: none;
+                z-index: ${z};
+            `;
+            this.container.appendChild(canvas);
+            this.canvases[name] = canvas;
+            this.contexts[name] = canvas.getContext('2d');
+        }
+
+        this._markerGrid = new SpatialGrid(128);
+        this._routeGrid = new SpatialGrid(128);
+        this._resize();
+        return true;
+    },
+
+    detach() {
+        if (this._staticFrame) cancelAnimationFrame(this._staticFrame);
+        if (this._overlayFrame) cancelAnimationFrame(this._overlayFrame);
+        this._staticFrame = null;
+        this._overlayFrame = null;
+        Object.values(this.canvases).forEach(canvas => canvas.remove());
+        this.canvases = {};
+        this.contexts = {};
+        this._overlayItems.clear();
+        this._dirtyRects = [];
+        this.markers = [];
+        this.routes = [];
+        this._markerGrid = null;
+        this._routeGrid = null;
+        this.renderer = null;
+        this.container = null;
+    },
+
+    isAttached() {
+        return !!this.canvases.overlay && this.canvases.overlay.isConnected;
+    },
+
+    // match the backing store to the container - returns true when it changed
+    _resize() {
+        const rect = this.container.getBoundingClientRect();
+        const dpr = window.devicePixelRatio || 1;
+        const width = Math.max(1, Math.round(rect.width));
+        const height = Math.max(1, Math.round(rect.height));
+        if (width === this._width && height === this._height && dpr === this._dpr) return false;
+
+        this._width = width;
+        this._height = height;
+        this._dpr = dpr;
+        for (const [name, canvas] of Object.entries(this.canvases)) {
+            canvas.width = Math.round(width * dpr);
+            canvas.height = Math.round(height * dpr);
+            canvas.style.width = width + 'px';
+            canvas.style.height = height + 'px';
+            this.contexts[name].setTransform(dpr, 0, 0, dpr, 0, 0);
+        }
+        this._overlayFull = true;
+        return true;
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // scene + spatial index
+    // ═══════════════════════════════════════════════════════════════
+
+    setScene(markers, routes) {
+        this.markers = markers;
+        this.routes = routes;
+        this._markerGrid.clear();
+        this._routeGrid.clear();
+        this._maxMarkerSize = 0;
+
+        for (const marker of markers) {
+            this._markerGrid.insert(marker, marker.x, marker.y);
+            if (marker.size > this._maxMarkerSize) this._maxMarkerSize = marker.size;
+        }
+        for (const route of routes) {
+            this._routeGrid.insert(route,
+                Math.min(route.x1, route.x2), Math.min(route.y1, route.y2),
+                Math.max(route.x1, route.x2), Math.max(route.y1, route.y2));
+        }
+        this.invalidate();
+    },
+
+    getMarker(locationId) {
+        return this.markers.find(marker => marker.id === locationId) || null;
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // view math - same transform the DOM map gets from CSS
+    // ═══════════════════════════════════════════════════════════════
+
+    toScreen(x, y) {
+        const { zoom, offsetX, offsetY } = this.renderer.mapState;
+        return { x: x * zoom + offsetX, y: y * zoom + offsetY };
+    },
+
+    clientToMap(clientX, clientY) {
+        const rect = this.container.getBoundingClientRect();
+        const { zoom, offsetX, offsetY } = this.renderer.mapState;
+        return {
+            x: (clientX - rect.left - offsetX) / zoom,
+            y: (clientY - rect.top - offsetY) / zoom
+        };
+    },
+
+    // visible map rectangle, padded by `margin` screen pixels
+    getViewRect(margin = 0) {
+        const { zoom, offsetX, offsetY } = this.renderer.mapState;
+        return {
+            minX: (-offsetX - margin) / zoom,
+            minY: (-offsetY - margin) / zoom,
+            maxX: (this._width - offsetX + margin) / zoom,
+            maxY: (this._height - offsetY + margin) / zoom
+        };
+    },
+
+    // same curve as GameWorldRenderer.updateMarkerScaling()
+    getScales() {
+        const zoom = this.renderer.mapState.zoom;
+        const rawInverseScale = 1 / Math.sqrt(zoom);
+        return {
+            zoom,
+            marker: Math.max(0.6, Math.min(1.5, rawInverseScale)),
+            label: Math.max(0.7, Math.min(1.3, rawInverseScale)),
+            labelOpacity: zoom < 0.4 ? Math.max(0, (zoom - 0.25) / 0.15) : 1
+        };
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // static layers - routes + markers, culled to the viewport
+    // ═══════════════════════════════════════════════════════════════
+
+    // pan/zoom/scene change - everything moves, so everything redraws next frame
+    invalidate() {
+        this._overlayFull = true;
+        if (this._staticFrame) return;
+        this._staticFrame = requestAnimationFrame(() => {
+            this._staticFrame = null;
+            this.redrawNow();
+        });
+    },
+
+    redrawNow() {
+        if (!this.isAttached()) return;
+        const start = performance.now();
+        this._resize();
+
+        const scales = this.getScales();
+        this.stats.routesDrawn = this._drawRoutes(scales);
+        this.stats.markersDrawn = this._drawMarkers(scales);
+        this.stats.staticDraws++;
+        this._overlayFull = true;
+        this._flushOverlay();
+        this.stats.lastStaticMs = performance.now() - start;
+    },
+
+    _drawRoutes(scales) {
+        const ctx = this.contexts.routes;
+        ctx.clearRect(0, 0, this._width, this._height);
+
+        const view = this.getViewRect(0);
+        const visible = this._routeGrid.query(view.minX, view.minY, view.maxX, view.maxY);
+        const zoom = scales.zoom;
+
+        ctx.lineCap = 'butt';
+        for (const route of visible) {
+            const a = this.toScreen(route.x1, route.y1);
+            const b = this.toScreen(route.x2, route.y2);
+            ctx.strokeStyle = route.stroke;
+            ctx.lineWidth = route.width * zoom;
+            ctx.setLineDash(route.dash ? route.dash.map(d => d * zoom) : []);
+            ctx.beginPath();
+            ctx.moveTo(a.x, a.y);
+            ctx.lineTo(b.x, b.y);
+            ctx.stroke();
+        }
+        ctx.setLineDash([]);
+        return visible.length;
+    },
+
+    _drawMarkers(scales) {
+        const ctx = this.contexts.markers;
+        ctx.clearRect(0, 0, this._width, this._height);
+
+        // labels hang off the side of a marker - pad the cull so they don't pop
+        const view = this.getViewRect(120);
+        const visible = this._markerGrid.query(view.minX, view.minY, view.maxX, view.maxY);
+        const k = scales.marker * scales.zoom;
+
+        for (const marker of visible) {
+            const p = this.toScreen(marker.x, marker.y);
+            const r = marker.size / 2 * k;
+
+            ctx.save();
+            ctx.globalAlpha = marker.opacity;
+            if (marker.isCurrent) {
+                ctx.shadowColor = 'rgba(79, 195, 247, 0.8)';
+                ctx.shadowBlur = 20 * k;
+            } else if (marker.bonanza) {
+                ctx.shadowColor = 'rgba(168, 85, 247, 0.7)';
+                ctx.shadowBlur = 24 * k;
+            } else {
+                ctx.shadowColor = 'rgba(0, 0, 0, 0.5)';
+                ctx.shadowBlur = 10 * k;
+                ctx.shadowOffsetY = 2 * k;
+            }
+
+            const gradient = ctx.createRadialGradient(p.x, p.y, 0, p.x, p.y, r);
+            gradient.addColorStop(0, marker.bgColor);
+            gradient.addColorStop(1, marker.darkColor);
+            ctx.fillStyle = gradient;
+            ctx.beginPath();
+            ctx.arc(p.x, p.y, r, 0, Math.PI * 2);
+            ctx.fill();
+
+            ctx.shadowColor = 'transparent';
+            ctx.lineWidth = 3 * k;
+            ctx.strokeStyle = marker.isCurrent ? '#4fc3f7' : marker.borderColor;
+            ctx.stroke();
+
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+            ctx.font = `${marker.size * 0.5 * k}px sans-serif`;
+            ctx.fillText(marker.icon, p.x, p.y);
+            ctx.restore();
+
+            // label is a child of the marker in DOM mode, so it picks up both scales
+            if (scales.labelOpacity > 0) {
+                this._drawLabel(ctx, marker, p.x, p.y - r - 4 * k, k * scales.label, scales.labelOpacity);
+            }
+            if (marker.badge) {
+                this._drawBadge(ctx, marker, scales);
+            }
+        }
+        return visible.length;
+    },
+
+    _drawLabel(ctx, marker, x, bottom, k, opacity) {
+        ctx.save();
+        ctx.globalAlpha = opacity;
+        ctx.font = `${marker.labelItalic ? 'italic ' : ''}${12 * k}px sans-serif`;
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'bottom';
+        ctx.shadowColor = '#000';
+        ctx.shadowBlur = 4;
+        ctx.fillStyle = marker.labelColor;
+        ctx.fillText(marker.label, x, bottom);
+        ctx.restore();
+    },
+
+    // property badge sits up and to the right of the marker, like the DOM one
+    getBadgeRect(marker, scales = this.getScales()) {
+        const k = scales.marker * scales.zoom;
+        const center = this.toScreen(marker.x + marker.size / 2 + 5, marker.y - marker.size / 2 - 5);
+        const width = (marker.badge.count > 9 ? 46 : 38) * k;
+        const height = 24 * k;
+        return { left: center.x - width / 2, top: center.y - height / 2, right: center.x + width / 2, bottom: center.y + height / 2 };
+    },
+
+    _drawBadge(ctx, marker, scales) {
+        const rect = this.getBadgeRect(marker, scales);
+        const k = scales.marker * scales.zoom;
+        const radius = 12 * k;
+
+        ctx.save();
+        ctx.shadowColor = 'rgba(0, 0, 0, 0.4)';
+        ctx.shadowBlur = 8 * k;
+        ctx.fillStyle = marker.badge.color;
+        ctx.beginPath();
+        ctx.moveTo(rect.left + radius, rect.top);
+        ctx.arcTo(rect.right, rect.top, rect.right, rect.bottom, radius);
+        ctx.arcTo(rect.right, rect.bottom, rect.left, rect.bottom, radius);
+        ctx.arcTo(rect.left, rect.bottom, rect.left, rect.top, radius);
+        ctx.arcTo(rect.left, rect.top, rect.right, rect.top, radius);
+        ctx.closePath();
+        ctx.fill();
+        ctx.shadowColor = 'transparent';
+        ctx.lineWidth = 2 * k;
+        ctx.strokeStyle = marker.badge.borderColor;
+        ctx.stroke();
+
+        ctx.fillStyle = '#fff';
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'middle';
+        ctx.font = `bold ${12 * k}px sans-serif`;
+        ctx.fillText(`${marker.badge.icon} ${marker.badge.count}`, (rect.left + rect.right) / 2, (rect.top + rect.bottom) / 2);
+        ctx.restore();
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // overlay - dirty-rectangle redraws for things that move
+    // ═══════════════════════════════════════════════════════════════
+
+    /**
+     * Add, move or remove an overlay item
+     * @param {string} id
+     * @param {Object|null} item - { rect() -> screen rect, draw(ctx) } or null to remove
+     */
+    setOverlayItem(id, item) {
+        const previous = this._overlayItems.get(id);
+        if (previous?._rect) this._dirtyRects.push(previous._rect);
+
+        if (item) {
+            this._overlayItems.set(id, item);
+            this._dirtyRects.push(item.rect());
+        } else {
+            this._overlayItems.delete(id);
+        }
+        this._scheduleOverlay();
+    },
+
+    _scheduleOverlay() {
+        if (this._overlayFrame || this._staticFrame) return; // static redraw flushes the overlay too
+        this._overlayFrame = requestAnimationFrame(() => {
+            this._overlayFrame = null;
+            this._flushOverlay();
+        });
+    },
+
+    _flushOverlay() {
+        if (!this.isAttached()) return;
+        const ctx = this.contexts.overlay;
+        const fullArea = this._width * this._height;
+
+        let regions;
+        if (this._overlayFull) {
+            regions = [{ left: 0, top: 0, right: this._width, bottom: this._height }];
+        } else {
+            regions = this._mergeRects(this._dirtyRects.map(rect => this._padRect(rect)));
+        }
+        this._dirtyRects = [];
+        this._overlayFull = false;
+        if (regions.length === 0) return;
+
+        // every item's footprint this frame - cached so the next move knows what to clear
+        for (const item of this._overlayItems.values()) {
+            item._rect = item.rect();
+        }
+
+        for (const region of regions) {
+            const width = region.right - region.left;
+            const height = region.bottom - region.top;
+            if (width <= 0 || height <= 0) continue;
+
+            ctx.save();
+            ctx.beginPath();
+            ctx.rect(region.left, region.top, width, height);
+            ctx.clip();
+            ctx.clearRect(region.left, region.top, width, height);
+            for (const item of this._overlayItems.values()) {
+                if (this._intersects(item._rect, region)) item.draw(ctx);
+            }
+            ctx.restore();
+            this.stats.dirtyPixels += width * height;
+        }
+        this.stats.fullPixels += fullArea;
+        this.stats.overlayDraws++;
+    },
+
+    _padRect(rect) {
+        return {
+            left: Math.max(0, Math.floor(rect.left) - 2),
+            top: Math.max(0, Math.floor(rect.top) - 2),
+            right: Math.min(this._width, Math.ceil(rect.right) + 2),
+            bottom: Math.min(this._height, Math.ceil(rect.bottom) + 2)
+        };
+    },
+
+    _intersects(a, b) {
+        return !!a && a.left < b.right && a.right > b.left && a.top < b.bottom && a.bottom > b.top;
+    },
+
+    // overlapping dirty rects become one - stops double-drawing the old+new footprint of a small move
+    _mergeRects(rects) {
+        const merged = [];
+        for (let rect of rects) {
+            for (let i = merged.length - 1; i >= 0; i--) {
+                if (this._intersects(rect, merged[i])) {
+                    const other = merged.splice(i, 1)[0];
+                    rect = {
+                        left: Math.min(rect.left, other.left),
+                        top: Math.min(rect.top, other.top),
+                        right: Math.max(rect.right, other.right),
+                        bottom: Math.max(rect.bottom, other.bottom)
+                    };
+                }
+            }
+            merged.push(rect);
+        }
+        return merged;
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // hit-testing - one grid lookup instead of a listener per element
+    // ═══════════════════════════════════════════════════════════════
+
+    /**
+     * What's under the pointer
+     * @returns {{type: 'location'|'property'|'route', marker?: Object, route?: Object}|null}
+     */
+    hitTest(clientX, clientY) {
+        if (!this.isAttached()) return null;
+        const point = this.clientToMap(clientX, clientY);
+        const scales = this.getScales();
+
+        // badges sit on top of markers, check them first
+        const rect = this.container.getBoundingClientRect();
+        const sx = clientX - rect.left;
+        const sy = clientY - rect.top;
+        const reach = this._maxMarkerSize * 1.5;
+        const nearby = this._markerGrid.queryRadius(point.x, point.y, reach);
+        for (const marker of nearby) {
+            if (!marker.badge) continue;
+            const badge = this.getBadgeRect(marker, scales);
+            if (sx >= badge.left && sx <= badge.right && sy >= badge.top && sy <= badge.bottom) {
+                return { type: 'property', marker };
+            }
+        }
+
+        let best = null;
+        let bestDist = Infinity;
+        for (const marker of nearby) {
+            const radius = marker.size / 2 * scales.marker;
+            const dist = Math.hypot(marker.x - point.x, marker.y - point.y);
+            if (dist <= radius && dist < bestDist) {
+                best = marker;
+                bestDist = dist;
+            }
+        }
+        if (best) return { type: 'location', marker: best };
+
+        const tolerance = this.ROUTE_HIT_TOLERANCE;
+        const routes = this._routeGrid.queryRadius(point.x, point.y, tolerance);
+        let bestRoute = null;
+        let bestRouteDist = tolerance;
+        for (const route of routes) {
+            const dist = this._distanceToSegment(point.x, point.y, route);
+            if (dist <= bestRouteDist) {
+                bestRoute = route;
+                bestRouteDist = dist;
+            }
+        }
+        return bestRoute ? { type: 'route', route: bestRoute } : null;
+    },
+
+    _distanceToSegment(px, py, route) {
+        const dx = route.x2 - route.x1;
+        const dy = route.y2 - route.y1;
+        const lengthSq = dx * dx + dy * dy;
+        let t = lengthSq > 0 ? ((px - route.x1) * dx + (py - route.y1) * dy) / lengthSq : 0;
+        t = Math.max(0, Math.min(1, t));
+        return Math.hypot(px - (route.x1 + t * dx), py - (route.y1 + t * dy));
+    },
+
+    // ═══════════════════════════════════════════════════════════════
+    // overlay items the renderer uses
+    // ═══════════════════════════════════════════════════════════════
+
+    // glow over a hovered route - the SVG version thickened the line and added a drop-shadow
+    setRouteHighlight(route) {
+        if (!route) {
+            this.setOverlayItem('route-hover', null);
+            return;
+        }
+        this.setOverlayItem('route-hover', {
+            rect: () => {
+                const a = this.toScreen(route.x1, route.y1);
+                const b = this.toScreen(route.x2, route.y2);
+                return { left: Math.min(a.x, b.x) - 8, top: Math.min(a.y, b.y) - 8, right: Math.max(a.x, b.x) + 8, bottom: Math.max(a.y, b.y) + 8 };
+            },
+            draw: (ctx) => {
+                const zoom = this.renderer.mapState.zoom;
+                const a = this.toScreen(route.x1, route.y1);
+                const b = this.toScreen(route.x2, route.y2);
+                ctx.save();
+                ctx.shadowColor = 'rgba(255, 215, 0, 0.8)';
+                ctx.shadowBlur = 4;
+                ctx.strokeStyle = route.stroke;
+                ctx.lineWidth = (route.bothExplored ? 5 : 4) * zoom;
+                ctx.setLineDash(route.dash ? route.dash.map(d => d * zoom) : []);
+                ctx.beginPath();
+                ctx.moveTo(a.x, a.y);
+                ctx.lineTo(b.x, b.y);
+                ctx.stroke();
+                ctx.restore();
+            }
+        });
+    },
+
+    /**
+     * Player pin / traveller - the piece that moves every frame during travel
+     * @param {number} x - Map x (scaled)
+     * @param {number} y - Map y (scaled)
+     * @param {Object} state - { emoji, flip, label, labelColor, labelAbove }
+     */
+    setPlayer(x, y, state) {
+        const metrics = () => {
+            const scales = this.getScales();
+            const k = scales.marker * scales.zoom;
+            const p = this.toScreen(x, y);
+            const labelWidth = (state.label.length * 6.5 + 24) * k;
+            return { p, k, labelWidth };
+        };
+        this.setOverlayItem('player', {
+            rect: () => {
+                const { p, k, labelWidth } = metrics();
+                const half = Math.max(labelWidth / 2, 30 * k);
+                return { left: p.x - half, top: p.y - 80 * k, right: p.x + half, bottom: p.y + 40 * k };
+            },
+            draw: (ctx) => {
+                const { p, k, labelWidth } = metrics();
+
+                ctx.save();
+                ctx.fillStyle = 'rgba(0, 0, 0, 0.3)';
+                ctx.beginPath();
+                ctx.ellipse(p.x, p.y + 2 * k, 12 * k, 4 * k, 0, 0, Math.PI * 2);
+                ctx.fill();
+
+                ctx.font = `${42 * k}px sans-serif`;
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'bottom';
+                ctx.shadowColor = 'rgba(0, 0, 0, 0.6)';
+                ctx.shadowBlur = 8 * k;
+                ctx.shadowOffsetY = 4 * k;
+                if (state.flip) {
+                    ctx.save();
+                    ctx.translate(p.x, 0);
+                    ctx.scale(-1, 1);
+                    ctx.fillText(state.emoji, 0, p.y);
+                    ctx.restore();
+                } else {
+                    ctx.fillText(state.emoji, p.x, p.y);
+                }
+
+                const labelHeight = 18 * k;
+                const labelY = state.labelAbove ? p.y - 52 * k - labelHeight : p.y + 6 * k;
+                ctx.shadowColor = 'rgba(0, 0, 0, 0.5)';
+                ctx.shadowBlur = 10 * k;
+                ctx.shadowOffsetY = 3 * k;
+                ctx.fillStyle = state.labelColor;
+                ctx.strokeStyle = 'rgba(255, 255, 255, 0.8)';
+                ctx.lineWidth = 2 * k;
+                ctx.beginPath();
+                ctx.roundRect
+                    ? ctx.roundRect(p.x - labelWidth / 2, labelY, labelWidth, labelHeight, 12 * k)
+                    : ctx.rect(p.x - labelWidth / 2, labelY, labelWidth, labelHeight);
+                ctx.fill();
+                ctx.shadowColor = 'transparent';
+                ctx.stroke();
+
+                ctx.fillStyle = '#fff';
+                ctx.font = `bold ${9 * k}px sans-serif`;
+                ctx.textBaseline = 'middle';
+                ctx.fillText(state.label, p.x, labelY + labelHeight / 2);
+                ctx.restore();
+            }
+        });
+    },
+
+    getStats() {
+        const s = this.stats;
+        return {
+            markers: this.markers.length,
+            routes: this.routes.length,
+            markersDrawn: s.markersDrawn,
+            routesDrawn: s.routesDrawn,
+            staticDraws: s.staticDraws,
+            overlayDraws: s.overlayDraws,
+            lastStaticMs: +s.lastStaticMs.toFixed(3),
+            // fraction of the overlay actually repainted - the dirty-rect payoff
+            overlayRepaintRatio: s.fullPixels > 0 ? +(s.dirtyPixels / s.fullPixels).toFixed(4) : 0
+        };
+    }
+};
+
+window.MapCanvasLayer = MapCanvasLayer;
@@ -985,6 +985,8 @@ const InventorySystem = {
     showInventorySettings() {
         if (typeof SettingsPanel !== 'undefined' && SettingsPanel.show) {
             SettingsPanel.show();
+        } else if (typeof ModuleLoader !== 'undefined') {
+            ModuleLoader.use('settings', () => SettingsPanel.show());
         } else {
             addMessage('settings panel loading... try again in a moment');
         }
@@ -1267,7 +1267,12 @@ const PeoplePanel = {
                     availableQuests: this.getAvailableQuestsForNPC(),
                     activeQuests: this.getActiveQuestsForNPC(),
                     rumors: this.getRumors(),
-                    nearbyLocations: this.getNearbyLocations()
+                    nearbyLocations: this.getNearbyLocations(),
+                    // stream into the typing bubble - swapped for the cleaned reply below
+                    onToken: (displayText) => {
+                        const typing = document.getElementById('people-chat-messages')?.querySelector('.typing-indicator');
+                        if (typing && displayText) typing.textContent = displayText;
+                    }
                 };
 
                 const response = await NPCVoiceChatSystem.generateNPCResponse(
@@ -3974,7 +3974,7 @@ const SettingsPanel = {
     },
 
     // export all saves to json file
-    exportAllSaves() {
+    async exportAllSaves() {
         const exportData = {
             exportVersion: '1.0',
             exportDate: new Date().toISOString(),
@@ -3990,7 +3990,10 @@ const SettingsPanel = {
         for (let i = 0; i < 10; i++) {
             const data = localStorage.getItem(`tradingGameAutoSave_${i}`);
             if (data) {
-                exportData.saves.autoSaves[i] = data;
+                // chunked autosaves only hold a manifest - inflate so the export stands alone
+                exportData.saves.autoSaves[i] = typeof SaveManager !== 'undefined' && SaveManager.toPortableSaveString
+                    ? await SaveManager.toPortableSaveString(data)
+                    : data;
             }
         }
 
@@ -4628,6 +4631,13 @@ const SettingsPanel = {
             // Clear auto-save slots metadata
             localStorage.removeItem('tradingGameAutoSaveSlots');
 
+            // chunked autosaves leave their chunks behind - drop the ones nothing points at now
+            if (typeof ChunkedSaveStore !== 'undefined') {
+                ChunkedSaveStore.collectGarbage()
+                    .then(() => this.updateStorageInfo())
+                    .catch((e) => console.warn('💾 Chunk cleanup failed:', e));
+            }
+
             this.updateStorageInfo();
             addMessage(`🗑️ Cleared ${clearedCount} auto-saves!`, 'success');
         };
@@ -4727,6 +4737,8 @@ SettingsPanel.show = function() {
     setTimeout(() => this.updateStorageInfo(), 100);
 };
 
+window.SettingsPanel = SettingsPanel;
+
 // register with Bootstrap - early priority for main menu access
 Bootstrap.register('SettingsPanel', () => SettingsPanel.init(), {
     dependencies: ['game'],
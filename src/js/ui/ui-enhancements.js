@@ -1003,6 +1003,9 @@ const KeyboardShortcuts = {
                 SettingsPanel.init();
             }
             SettingsPanel.show();
+        } else if (typeof ModuleLoader !== 'undefined') {
+            // settings loads on first use
+            ModuleLoader.use('settings', () => this.showSettings());
         } else {
             // settingsPanel not loaded yet - silent fail, user can try again
             console.warn('⚙️ SettingsPanel not ready yet');
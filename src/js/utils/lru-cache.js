@@ -0,0 +1,180 @@
+// ═══════════════════════════════════════════════════════════════
+// LRU CACHE - remembers what you used, forgets what you didn't
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+
+class LRUCache {
+    /**
+     * 🖤 Least-recently-used cache bounded by entry count and approximate byte size
+     * Map insertion order is the recency order - get() re-inserts to mark as fresh
+     * @param {Object} [options]
+     * @param {number} [options.maxEntries=200] - Evict oldest past this many entries
+     * @param {number} [options.maxBytes=262144] - Evict oldest past this many bytes (UTF-16, 2 per char)
+     * @param {number} [options.ttl=0] - Entry lifetime in ms, 0 = forever
+     * @param {string} [options.storageKey=null] - localStorage key to persist under, null = memory only
+     */
+    constructor({ maxEntries = 200, maxBytes = 256 * 1024, ttl = 0, storageKey = null } = {}) {
+        this.maxEntries = maxEntries;
+        this.maxBytes = maxBytes;
+        this.ttl = ttl;
+        this.storageKey = storageKey;
+        this._entries = new Map();
+        this._bytes = 0;
+        this._persistTimer = null;
+        this.hits = 0;
+        this.misses = 0;
+        this.evictions = 0;
+        this._load();
+    }
+
+    get size() {
+        return this._entries.size;
+    }
+
+    get bytes() {
+        return this._bytes;
+    }
+
+    _sizeOf(key, value) {
+        return (key.length + JSON.stringify(value).length) * 2;
+    }
+
+    _isExpired(entry, now = Date.now()) {
+        return this.ttl > 0 && now - entry.timestamp > this.ttl;
+    }
+
+    /**
+     * 💀 Look up a value - counts toward hit rate and refreshes recency
+     * @returns {*} The value, or undefined on miss/expired
+     */
+    get(key) {
+        const entry = this._entries.get(key);
+        if (!entry || this._isExpired(entry)) {
+            if (entry) this.delete(key);
+            this.misses++;
+            return undefined;
+        }
+        this._entries.delete(key);
+        this._entries.set(key, entry);
+        this.hits++;
+        return entry.value;
+    }
+
+    /** 🔮 Look without touching recency or hit counters */
+    peek(key) {
+        const entry = this._entries.get(key);
+        return entry && !this._isExpired(entry) ? entry.value : undefined;
+    }
+
+    has(key) {
+        return this.peek(key) !== undefined;
+    }
+
+    set(key, value) {
+        if (this._entries.has(key)) this.delete(key);
+        const size = this._sizeOf(key, value);
+        if (size > this.maxBytes) return; // would evict everything else for one entry
+        this._entries.set(key, { value, timestamp: Date.now(), size });
+        this._bytes += size;
+        this._evict();
+        this._schedulePersist();
+    }
+
+    delete(key) {
+        const entry = this._entries.get(key);
+        if (!entry) return false;
+        this._bytes -= entry.size;
+        this._entries.delete(key);
+        this._schedulePersist();
+        return true;
+    }
+
+    clear() {
+        this._entries.clear();
+        this._bytes = 0;
+        this._schedulePersist();
+    }
+
+    /** 🦇 Drop expired entries - returns how many went */
+    prune() {
+        const now = Date.now();
+        let removed = 0;
+        for (const [key, entry] of this._entries) {
+            if (this._isExpired(entry, now)) {
+                this.delete(key);
+                removed++;
+            }
+        }
+        return removed;
+    }
+
+    _evict() {
+        while (this._entries.size > this.maxEntries || this._bytes > this.maxBytes) {
+            const oldest = this._entries.keys().next().value;
+            this.delete(oldest);
+            this.evictions++;
+        }
+    }
+
+    getStats() {
+        const lookups = this.hits + this.misses;
+        return {
+            entries: this._entries.size,
+            bytes: this._bytes,
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            hitRate: lookups > 0 ? +(this.hits / lookups).toFixed(3) : 0
+        };
+    }
+
+    // ═══════════════════════════════════════════════════════════
+    // persistence - batched so a burst of sets is one write
+    // ═══════════════════════════════════════════════════════════
+
+    _schedulePersist() {
+        if (!this.storageKey || this._persistTimer) return;
+        this._persistTimer = setTimeout(() => {
+            this._persistTimer = null;
+            this.persist();
+        }, 1000);
+    }
+
+    persist() {
+        if (!this.storageKey || typeof localStorage === 'undefined') return;
+        try {
+            const rows = [];
+            for (const [key, entry] of this._entries) {
+                rows.push([key, entry.value, entry.timestamp]);
+            }
+            localStorage.setItem(this.storageKey, JSON.stringify(rows));
+        } catch (e) {
+            // quota - cache is a nicety, not worth a crash
+            console.warn(`🗃️ LRUCache: could not persist ${this.storageKey}:`, e.message);
+        }
+    }
+
+    _load() {
+        if (!this.storageKey || typeof localStorage === 'undefined') return;
+        try {
+            const rows = JSON.parse(localStorage.getItem(this.storageKey) || '[]');
+            const now = Date.now();
+            for (const [key, value, timestamp] of rows) {
+                const size = this._sizeOf(key, value);
+                const entry = { value, timestamp, size };
+                if (this._isExpired(entry, now)) continue;
+                this._entries.set(key, entry);
+                this._bytes += size;
+            }
+            this._evict();
+        } catch (e) {
+            console.warn(`🗃️ LRUCache: ignoring unreadable ${this.storageKey}`);
+        }
+    }
+}
+
+window.LRUCache = LRUCache;
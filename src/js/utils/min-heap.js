@@ -0,0 +1,96 @@
+// ═══════════════════════════════════════════════════════════════
+// MIN HEAP - the cheapest suffering always rises to the top
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+
+class MinHeap {
+    /**
+     * 🖤 Binary min-heap keyed on a numeric priority
+     * Duplicate values are allowed - callers that need decrease-key just push
+     * again and skip stale entries on pop (lazy deletion)
+     */
+    constructor() {
+        this._values = [];
+        this._priorities = [];
+    }
+
+    get size() {
+        return this._values.length;
+    }
+
+    /**
+     * 💀 Add a value with a priority - O(log n)
+     * @param {*} value - Anything
+     * @param {number} priority - Lower pops first
+     */
+    push(value, priority) {
+        const values = this._values;
+        const priorities = this._priorities;
+        let i = values.length;
+        values.push(value);
+        priorities.push(priority);
+
+        // sift up
+        while (i > 0) {
+            const parent = (i - 1) >> 1;
+            if (priorities[parent] <= priority) break;
+            values[i] = values[parent];
+            priorities[i] = priorities[parent];
+            i = parent;
+        }
+        values[i] = value;
+        priorities[i] = priority;
+    }
+
+    /**
+     * 🦇 Remove and return the lowest-priority value - O(log n)
+     * @returns {*} The value, or undefined when empty
+     */
+    pop() {
+        const values = this._values;
+        const priorities = this._priorities;
+        if (values.length === 0) return undefined;
+
+        const top = values[0];
+        const lastValue = values.pop();
+        const lastPriority = priorities.pop();
+        const n = values.length;
+        if (n === 0) return top;
+
+        // sift down
+        let i = 0;
+        while (true) {
+            let child = 2 * i + 1;
+            if (child >= n) break;
+            if (child + 1 < n && priorities[child + 1] < priorities[child]) child++;
+            if (priorities[child] >= lastPriority) break;
+            values[i] = values[child];
+            priorities[i] = priorities[child];
+            i = child;
+        }
+        values[i] = lastValue;
+        priorities[i] = lastPriority;
+        return top;
+    }
+
+    /** 🔮 Lowest value without removing it */
+    peek() {
+        return this._values[0];
+    }
+
+    /** 🔮 Priority of the lowest value (Infinity when empty) */
+    peekPriority() {
+        return this._values.length > 0 ? this._priorities[0] : Infinity;
+    }
+
+    clear() {
+        this._values.length = 0;
+        this._priorities.length = 0;
+    }
+}
+
+window.MinHeap = MinHeap;
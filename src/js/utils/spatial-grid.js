@@ -0,0 +1,111 @@
+// ═══════════════════════════════════════════════════════════════
+// SPATIAL GRID - bucket things by where they are, ask only nearby
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+
+class SpatialGrid {
+    /**
+     * 🖤 Uniform-grid spatial hash for boxes (points are zero-size boxes)
+     * An item lands in every cell its box touches; queries dedupe on the way out
+     * @param {number} [cellSize=128] - Cell edge in world units, roughly the size of a typical query
+     */
+    constructor(cellSize = 128) {
+        this.cellSize = cellSize;
+        this._cells = new Map();
+        this._boxes = new Map();
+    }
+
+    get size() {
+        return this._boxes.size;
+    }
+
+    _key(cx, cy) {
+        // offset so negative cells still pack into one integer
+        return (cx + 32768) * 65536 + (cy + 32768);
+    }
+
+    insert(item, minX, minY, maxX = minX, maxY = minY) {
+        if (this._boxes.has(item)) this.remove(item);
+        const box = { minX, minY, maxX, maxY };
+        this._boxes.set(item, box);
+
+        const size = this.cellSize;
+        const x0 = Math.floor(minX / size), x1 = Math.floor(maxX / size);
+        const y0 = Math.floor(minY / size), y1 = Math.floor(maxY / size);
+        for (let cx = x0; cx <= x1; cx++) {
+            for (let cy = y0; cy <= y1; cy++) {
+                const key = this._key(cx, cy);
+                let bucket = this._cells.get(key);
+                if (!bucket) {
+                    bucket = [];
+                    this._cells.set(key, bucket);
+                }
+                bucket.push(item);
+            }
+        }
+    }
+
+    remove(item) {
+        const box = this._boxes.get(item);
+        if (!box) return false;
+        this._boxes.delete(item);
+
+        const size = this.cellSize;
+        for (let cx = Math.floor(box.minX / size); cx <= Math.floor(box.maxX / size); cx++) {
+            for (let cy = Math.floor(box.minY / size); cy <= Math.floor(box.maxY / size); cy++) {
+                const key = this._key(cx, cy);
+                const bucket = this._cells.get(key);
+                if (!bucket) continue;
+                const index = bucket.indexOf(item);
+                if (index !== -1) bucket.splice(index, 1);
+                if (bucket.length === 0) this._cells.delete(key);
+            }
+        }
+        return true;
+    }
+
+    clear() {
+        this._cells.clear();
+        this._boxes.clear();
+    }
+
+    getBox(item) {
+        return this._boxes.get(item);
+    }
+
+    /**
+     * 💀 Everything whose box overlaps the query rectangle
+     * @returns {Array} Items in insertion order within each cell, no duplicates
+     */
+    query(minX, minY, maxX, maxY) {
+        const size = this.cellSize;
+        const found = new Set();
+        const x0 = Math.floor(minX / size), x1 = Math.floor(maxX / size);
+        const y0 = Math.floor(minY / size), y1 = Math.floor(maxY / size);
+
+        for (let cx = x0; cx <= x1; cx++) {
+            for (let cy = y0; cy <= y1; cy++) {
+                const bucket = this._cells.get(this._key(cx, cy));
+                if (!bucket) continue;
+                for (const item of bucket) {
+                    if (found.has(item)) continue;
+                    const box = this._boxes.get(item);
+                    if (box.maxX < minX || box.minX > maxX || box.maxY < minY || box.minY > maxY) continue;
+                    found.add(item);
+                }
+            }
+        }
+        return [...found];
+    }
+
+    /** 🦇 Items whose box comes within radius of a point */
+    queryRadius(x, y, radius) {
+        return this.query(x - radius, y - radius, x + radius, y + radius);
+    }
+}
+
+window.SpatialGrid = SpatialGrid;
@@ -0,0 +1,32 @@
+// ═══════════════════════════════════════════════════════════════
+// STRING HASH - fingerprints for things too big to compare whole
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+
+const StringHash = {
+    /**
+     * 🖤 cyrb53 - fast 53-bit string hash, not cryptographic
+     * Used for save chunk ids and ollama dedupe keys
+     * @param {string} str - Text to hash
+     * @param {number} [seed=0] - Seed for a different hash family
+     * @returns {string} Hash in base 36
+     */
+    cyrb53(str, seed = 0) {
+        let h1 = 0xdeadbeef ^ seed;
+        let h2 = 0x41c6ce57 ^ seed;
+        for (let i = 0; i < str.length; i++) {
+            const ch = str.charCodeAt(i);
+            h1 = Math.imul(h1 ^ ch, 2654435761);
+            h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+    }
+};
+
+window.StringHash = StringHash;
@@ -0,0 +1,727 @@
+#!/usr/bin/env node
+// ═══════════════════════════════════════════════════════════════
+// HEADLESS SIM - the economy and world loop without a browser
+// ═══════════════════════════════════════════════════════════════
+// Version: 0.92.00 | Unity AI Lab
+// Creators: Hackall360, Sponge, GFourteen
+// www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+// unityailabcontact@gmail.com
+// ═══════════════════════════════════════════════════════════════
+//
+// Loads the real game scripts (GameWorld, ItemDatabase, DynamicMarketSystem,
+// TravelSystem, the property modules, EmployeeSystem, SimulationScheduler and
+// TimeMachine) into node behind a bare-bones DOM, seeds a merchant with
+// properties and staff across the realm, then drives the TimeMachine tick for
+// N game-years as fast as the CPU allows - trips between towns included.
+//
+// Math.random is a seeded PRNG and Date.now is a virtual clock, so the same
+// seed gives the same world every run. stateHash in the report proves it.
+//
+//   node tools/headless_sim.js --years 2 --seed 1111 --out sim-report.json
+//   node tools/headless_sim.js --years 1 --properties 60 --employees 120 --step 8
+//
+// Report (JSON): per scheduler task and per probed function - calls, total /
+// avg / p95 / max ms and approximate allocation. Also a memory + economy
+// snapshot per game-year and GC pauses. Allocation is the heap growth seen
+// across each call, so a GC mid-call undercounts it - compare runs, not absolutes.
+// A game-year at the default --step 60 takes 10-15 s (about 1.3 ms a frame);
+// the incremental market tick is still most of that.
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const v8 = require('v8');
+const crypto = require('crypto');
+const { performance } = require('perf_hooks');
+
+const ROOT = path.resolve(__dirname, '..');
+const hostConsole = console;
+const MINUTES_PER_YEAR = 365 * 24 * 60;
+
+// same order as the ModuleLoader manifest - only what the sim loop touches
+const SCRIPTS = [
+    'config.js',
+    'src/js/init/bootstrap.js',
+    'src/js/core/event-manager.js',
+    'src/js/core/timer-manager.js',
+    'src/js/core/system-registry.js',
+    'src/js/core/event-bus.js',
+    'src/js/utils/min-heap.js',
+    'src/js/utils/lru-cache.js',
+    'src/js/utils/spatial-grid.js',
+    'src/js/core/simulation-scheduler.js',
+    'src/js/core/time-machine.js',
+    'src/js/data/items/item-database.js',
+    'src/js/data/items/unified-item-system.js',
+    'src/js/data/game-world.js',
+    'src/js/systems/trading/market-price-history.js',
+    'src/js/systems/trading/dynamic-market-system.js',
+    'src/js/systems/world/city-reputation-system.js',
+    'src/js/systems/world/city-event-system.js',
+    'src/js/property/property-types.js',
+    'src/js/property/property-storage.js',
+    'src/js/property/property-purchase.js',
+    'src/js/property/property-income.js',
+    'src/js/property/property-upgrades.js',
+    'src/js/property/property-system-facade.js',
+    'src/js/systems/employee/employee-system.js',
+    'src/js/systems/employee/property-employee-bridge.js',
+    'src/js/systems/travel/travel-system.js'
+];
+
+// functions timed on top of the scheduler tasks - "Global.method"
+const PROBES = [
+    'PropertyIncome.processDailyIncome',
+    'EmployeeSystem.processWeeklyWages',
+    'DynamicMarketSystem.updateMarketPrices',
+    'DynamicMarketSystem.checkDailyRefresh',
+    'TravelSystem.startTravel',
+    'TravelSystem.updateTravelProgress',
+    'TravelSystem.completeTravel'
+];
+
+// ═══════════════════════════════════════════════════════════════
+// args
+// ═══════════════════════════════════════════════════════════════
+
+function parseArgs(argv) {
+    const opts = {
+        years: 1,
+        seed: 1111,
+        step: 60,           // game minutes per frame - --step 8 is one real second of VERY_FAST
+        properties: 12,
+        employees: 24,
+        travelEvery: 3,     // game days between trips
+        out: null,
+        quiet: true
+    };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        const next = () => argv[++i];
+        switch (arg) {
+            case '--years': opts.years = parseFloat(next()); break;
+            case '--seed': opts.seed = parseInt(next(), 10); break;
+            case '--step': opts.step = Math.max(1, parseInt(next(), 10)); break;
+            case '--properties': opts.properties = parseInt(next(), 10); break;
+            case '--employees': opts.employees = parseInt(next(), 10); break;
+            case '--travel-every': opts.travelEvery = Math.max(1, parseInt(next(), 10)); break;
+            case '--out': opts.out = next(); break;
+            case '--verbose': opts.quiet = false; break;
+            case '--help':
+            case '-h':
+                hostConsole.log('usage: node tools/headless_sim.js [--years N] [--seed N] [--step MIN] [--properties N]');
+                hostConsole.log('                                  [--employees N] [--travel-every DAYS] [--out FILE] [--verbose]');
+                process.exit(0);
+                break;
+            default:
+                hostConsole.error(`unknown option ${arg}`);
+                process.exit(2);
+        }
+    }
+    return opts;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// determinism - seeded random, virtual wall clock
+// ═══════════════════════════════════════════════════════════════
+
+function mulberry32(seed) {
+    let a = seed >>> 0;
+    return function () {
+        a = (a + 0x6D2B79F5) >>> 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+// ═══════════════════════════════════════════════════════════════
+// a DOM that says yes to everything and renders nothing
+// ═══════════════════════════════════════════════════════════════
+
+function inertNode() {
+    const store = new Map();
+    const self = new Proxy(function () {}, {
+        get(target, key) {
+            if (store.has(key)) return store.get(key);
+            switch (key) {
+                case Symbol.toPrimitive: return () => '';
+                case Symbol.iterator: return function* () {};
+                case 'then': return undefined;  // don't look like a promise
+                case 'style': case 'dataset': {
+                    const value = {};
+                    store.set(key, value);
+                    return value;
+                }
+                case 'classList': return { add() {}, remove() {}, toggle() {}, contains: () => false };
+                case 'children': case 'childNodes': return [];
+                case 'querySelector': case 'getElementById': case 'closest': return () => null;
+                case 'querySelectorAll': case 'getElementsByClassName': case 'getElementsByTagName': return () => [];
+                case 'getBoundingClientRect': return () => ({ x: 0, y: 0, top: 0, left: 0, right: 0, bottom: 0, width: 0, height: 0 });
+                case 'measureText': return () => ({ width: 0 });
+                case 'getContext': return () => inertNode();
+                case 'width': case 'height': case 'offsetWidth': case 'offsetHeight':
+                case 'clientWidth': case 'clientHeight': case 'scrollTop': case 'scrollLeft': return 0;
+                case 'textContent': case 'innerHTML': case 'value': case 'id': case 'className': return '';
+                case 'parentNode': case 'parentElement': case 'firstChild': case 'nextSibling': return null;
+                default: return () => self;
+            }
+        },
+        set(target, key, value) {
+            store.set(key, value);
+            return true;
+        },
+        apply() {
+            return self;
+        }
+    });
+    return self;
+}
+
+function createStorage() {
+    const data = new Map();
+    return {
+        getItem: key => (data.has(key) ? data.get(key) : null),
+        setItem: (key, value) => data.set(key, String(value)),
+        removeItem: key => data.delete(key),
+        clear: () => data.clear(),
+        key: i => [...data.keys()][i] ?? null,
+        get length() { return data.size; }
+    };
+}
+
+// the game scripts run in this process's own realm, the way a page runs them -
+// a vm.createContext sandbox routes every global lookup through an interceptor
+// and makes the hot pricing path several times slower than in a browser
+function installBrowserGlobals(opts, clock) {
+    const noop = () => {};
+    const quietConsole = {
+        log: noop, info: noop, debug: noop, table: noop, group: noop, groupEnd: noop, groupCollapsed: noop,
+        warn: opts.quiet ? noop : hostConsole.warn,
+        error: hostConsole.error
+    };
+
+    // timers run on the virtual clock - the sim loop flushes them each frame
+    const timers = new Map();
+    let timerId = 0;
+    const addTimer = (fn, ms, repeat) => {
+        const id = ++timerId;
+        timers.set(id, { fn, due: clock.now + (ms || 0), every: repeat ? Math.max(1, ms || 0) : 0 });
+        return id;
+    };
+
+    // stays 'loading' with an inert addEventListener - DOMContentLoaded never
+    // fires, so Bootstrap never auto-starts and the harness owns init order
+    const document = {
+        readyState: 'loading',
+        body: inertNode(),
+        head: inertNode(),
+        documentElement: inertNode(),
+        getElementById: () => null,
+        querySelector: () => null,
+        querySelectorAll: () => [],
+        getElementsByClassName: () => [],
+        getElementsByTagName: () => [],
+        createElement: () => inertNode(),
+        createElementNS: () => inertNode(),
+        createTextNode: () => inertNode(),
+        createDocumentFragment: () => inertNode(),
+        addEventListener: noop,
+        removeEventListener: noop,
+        dispatchEvent: () => true,
+        hidden: false
+    };
+
+    const browser = {
+        window: globalThis,
+        self: globalThis,
+        console: opts.quiet ? quietConsole : hostConsole,
+        document,
+        navigator: { userAgent: 'headless-sim', language: 'en', onLine: false, hardwareConcurrency: 1 },
+        location: { href: 'file:///headless', protocol: 'file:', hostname: '', search: '', hash: '', reload: noop },
+        localStorage: createStorage(),
+        sessionStorage: createStorage(),
+        performance: { now: () => performance.now(), mark: noop, measure: noop },
+        setTimeout: (fn, ms) => addTimer(fn, ms, false),
+        setInterval: (fn, ms) => addTimer(fn, ms, true),
+        clearTimeout: id => timers.delete(id),
+        clearInterval: id => timers.delete(id),
+        // no animation frames - the harness owns the loop
+        requestAnimationFrame: () => 0,
+        cancelAnimationFrame: noop,
+        requestIdleCallback: (fn) => addTimer(() => fn({ timeRemaining: () => 50, didTimeout: false }), 0, false),
+        cancelIdleCallback: id => timers.delete(id),
+        CustomEvent: class CustomEvent { constructor(type, init = {}) { this.type = type; this.detail = init.detail; } },
+        Event: class Event { constructor(type) { this.type = type; } },
+        Image: class Image {},
+        Audio: class Audio { play() { return Promise.resolve(); } pause() {} },
+        matchMedia: () => ({ matches: false, addEventListener: noop, removeEventListener: noop, addListener: noop }),
+        getComputedStyle: () => ({ getPropertyValue: () => '' }),
+        addEventListener: noop,
+        removeEventListener: noop,
+        dispatchEvent: () => true,
+        alert: noop,
+        confirm: () => true,
+        fetch: () => Promise.reject(new Error('no network in headless sim')),
+        innerWidth: 1920,
+        innerHeight: 1080,
+        devicePixelRatio: 1,
+        // UI hooks the sim systems call bare
+        addMessage: noop,
+        showNotification: noop,
+        updatePlayerInfo: noop,
+        updatePlayerStats: noop,
+        updateInventoryDisplay: noop
+    };
+    // some of these are accessors on node's global - define, don't assign
+    for (const [key, value] of Object.entries(browser)) {
+        Object.defineProperty(globalThis, key, { value, writable: true, configurable: true, enumerable: true });
+    }
+
+    // the scripts reach for Math.random and Date.now - the harness itself only uses performance.now
+    Math.random = mulberry32(opts.seed);
+    Date.now = () => clock.epoch + Math.floor(clock.now);
+
+    return function flushTimers() {
+        // a callback may schedule more - only run what was due on entry
+        const due = [];
+        for (const [id, timer] of timers) {
+            if (timer.due <= clock.now) due.push([id, timer]);
+        }
+        due.sort((a, b) => a[1].due - b[1].due || a[0] - b[0]);
+        for (const [id, timer] of due) {
+            if (!timers.has(id)) continue;
+            if (timer.every) timer.due = clock.now + timer.every;
+            else timers.delete(id);
+            try {
+                timer.fn();
+            } catch (err) {
+                if (!opts.quiet) hostConsole.warn('⏱️ timer threw:', err.message);
+            }
+        }
+    };
+}
+
+// ═══════════════════════════════════════════════════════════════
+// measurement
+// ═══════════════════════════════════════════════════════════════
+
+// v8 heap counter - process.memoryUsage() also reads rss from the OS, far too slow per call
+function heapUsed() {
+    return v8.getHeapStatistics().used_heap_size;
+}
+
+function createStats() {
+    return { calls: 0, totalMs: 0, maxMs: 0, allocBytes: 0, samples: [] };
+}
+
+function recordSample(stats, ms, bytes) {
+    stats.calls++;
+    stats.totalMs += ms;
+    if (ms > stats.maxMs) stats.maxMs = ms;
+    if (bytes > 0) stats.allocBytes += bytes;
+    // reservoir of 2048 keeps p95 honest without holding every call
+    if (stats.samples.length < 2048) {
+        stats.samples.push(ms);
+    } else {
+        const slot = Math.floor(stats.calls * 0.6180339887) % 2048;
+        stats.samples[slot] = ms;
+    }
+}
+
+function summarize(name, stats, extra = {}) {
+    const sorted = [...stats.samples].sort((a, b) => a - b);
+    const pick = q => (sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] : 0);
+    return {
+        system: name,
+        ...extra,
+        calls: stats.calls,
+        totalMs: +stats.totalMs.toFixed(2),
+        avgMs: stats.calls ? +(stats.totalMs / stats.calls).toFixed(4) : 0,
+        p50Ms: +pick(0.5).toFixed(4),
+        p95Ms: +pick(0.95).toFixed(4),
+        maxMs: +stats.maxMs.toFixed(3),
+        allocKB: +(stats.allocBytes / 1024).toFixed(1),
+        allocPerCallBytes: stats.calls ? Math.round(stats.allocBytes / stats.calls) : 0
+    };
+}
+
+function summarizeGC(profile) {
+    const byType = {};
+    let totalMs = 0;
+    let maxMs = 0;
+    let freedBytes = 0;
+    for (const entry of (profile && profile.statistics) || []) {
+        const ms = entry.cost / 1000;  // cost is in microseconds
+        byType[entry.gcType] = (byType[entry.gcType] || 0) + 1;
+        totalMs += ms;
+        if (ms > maxMs) maxMs = ms;
+        const freed = entry.beforeGC.heapStatistics.usedHeapSize - entry.afterGC.heapStatistics.usedHeapSize;
+        if (freed > 0) freedBytes += freed;
+    }
+    const count = Object.values(byType).reduce((a, b) => a + b, 0);
+    return {
+        count,
+        totalMs: +totalMs.toFixed(1),
+        maxPauseMs: +maxMs.toFixed(2),
+        // everything collected plus what's still live is a floor on total allocation
+        freedMB: +(freedBytes / 1048576).toFixed(1),
+        byType
+    };
+}
+
+function wrapProbe(spec, probes) {
+    const [globalName, method] = spec.split('.');
+    const target = vm.runInThisContext(`typeof ${globalName} !== 'undefined' ? ${globalName} : null`);
+    if (!target || typeof target[method] !== 'function') return false;
+
+    const original = target[method];
+    const stats = createStats();
+    probes.set(spec, stats);
+    target[method] = function (...args) {
+        const heapBefore = heapUsed();
+        const start = performance.now();
+        try {
+            return original.apply(this, args);
+        } finally {
+            const ms = performance.now() - start;
+            recordSample(stats, ms, heapUsed() - heapBefore);
+        }
+    };
+    return true;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// world setup - a merchant with a spread-out empire
+// ═══════════════════════════════════════════════════════════════
+
+function seedEmpire(opts) {
+    vm.runInThisContext(`
+        var GameState = { MENU: 'menu', PLAYING: 'playing', PAUSED: 'paused' };
+        var game = {
+            // no state - TravelSystem skips random encounters (modal UI) outside PLAYING
+            state: null,
+            isRunning: true,
+            inDoomWorld: false,
+            currentLocation: null,
+            player: {
+                name: 'Headless Merchant',
+                gold: 1000000,
+                inventory: {},
+                ownedProperties: [],
+                ownedEmployees: [],
+                stats: { health: 100, maxHealth: 100, hunger: 100, thirst: 100, stamina: 100, maxStamina: 100, happiness: 100 },
+                skills: {},
+                perks: [],
+                currentLoad: 0,
+                maxCarryWeight: 1000
+            }
+        };
+    `);
+
+    return vm.runInThisContext(`(function (propertyCount, employeeCount) {
+        ItemDatabase.init && ItemDatabase.init();
+        GameWorld.init();
+        TimeMachine.init();
+        TravelSystem.init();
+        PropertySystem.init();
+        EmployeeSystem.init();
+
+        const locations = Object.values(GameWorld.locations).filter(l => l && l.id && l.type);
+        locations.sort((a, b) => (a.id < b.id ? -1 : 1));
+        const start = GameWorld.locations.greendale || locations[0];
+        game.currentLocation = { id: start.id, name: start.name };
+        // a well-travelled merchant - startTravel refuses routes through unvisited towns
+        GameWorld.visitedLocations = locations.map(l => l.id);
+        TravelSystem.playerPosition.currentLocation = start.id;
+
+        // properties round-robin across every town that sells one
+        const now = TimeMachine.getTotalMinutes();
+        let placed = 0;
+        for (let i = 0; placed < propertyCount && i < propertyCount * 8; i++) {
+            const location = locations[i % locations.length];
+            const types = PropertyTypes.getLocationProperties(location.type) || [];
+            if (types.length === 0) continue;
+            const type = types[Math.floor(i / locations.length) % types.length];
+            const property = {
+                id: 'sim_property_' + placed,
+                type,
+                location: location.id,
+                locationName: location.name,
+                level: 1 + (placed % 3),
+                condition: 100,
+                upgrades: [],
+                employees: [],
+                lastIncomeTime: now,
+                totalIncome: 0,
+                purchasePrice: 0,
+                acquisitionType: 'buy',
+                storageUsed: 0,
+                storage: {},
+                storageCapacity: 0,     // processDailyIncome sets storage up on first pass
+                workQueue: [],
+                productionLimits: PropertyTypes.getProductionLimits ? PropertyTypes.getProductionLimits(type) : {},
+                lastProductionTime: now,
+                totalProduction: {},
+                underConstruction: false,
+                constructionStartTime: null,
+                constructionEndTime: null,
+                isRented: false,
+                rentDueTime: null,
+                monthlyRent: 0
+            };
+            game.player.ownedProperties.push(property);
+            placed++;
+        }
+
+        // staff them - generateEmployee rolls names/skills through Math.random
+        const roles = Object.keys(EmployeeSystem.employeeTypes);
+        for (let i = 0; i < employeeCount; i++) {
+            const employee = EmployeeSystem.generateEmployee(roles[i % roles.length]);
+            if (!employee) continue;
+            employee.id = 'sim_employee_' + i;
+            game.player.ownedEmployees.push(employee);
+            const property = game.player.ownedProperties[i % Math.max(1, game.player.ownedProperties.length)];
+            if (property) {
+                employee.assignedProperty = property.id;
+                property.employees.push(employee.id);
+            }
+        }
+
+        // let the clock run at full speed from here on
+        TimeMachine.isPaused = false;
+        TimeMachine.currentSpeed = 'VERY_FAST';
+        TimeMachine.isRunning = true;
+
+        return {
+            locations: locations.map(l => l.id),
+            properties: game.player.ownedProperties.length,
+            employees: game.player.ownedEmployees.length,
+            start: start.id
+        };
+    })(${opts.properties}, ${opts.employees})`);
+}
+
+function economySnapshot() {
+    return vm.runInThisContext(`(function () {
+        let priceSum = 0, priceCount = 0, stockSum = 0;
+        for (const location of Object.values(GameWorld.locations)) {
+            const market = location && location.marketPrices;
+            if (!market) continue;
+            for (const entry of Object.values(market)) {
+                if (!entry || typeof entry.price !== 'number') continue;
+                priceSum += entry.price;
+                stockSum += entry.stock || 0;
+                priceCount++;
+            }
+        }
+        const history = typeof MarketPriceHistory !== 'undefined' && MarketPriceHistory.getHistoryStats
+            ? MarketPriceHistory.getHistoryStats() : null;
+        return {
+            date: TimeMachine.getFormattedDate ? TimeMachine.getFormattedDate() : null,
+            gold: Math.round(game.player.gold),
+            properties: game.player.ownedProperties.length,
+            employees: game.player.ownedEmployees.length,
+            marketEntries: priceCount,
+            avgPrice: priceCount ? +(priceSum / priceCount).toFixed(2) : 0,
+            totalStock: stockSum,
+            priceSeries: history ? history.series : null,
+            location: game.currentLocation && game.currentLocation.id
+        };
+    })()`);
+}
+
+// digest of everything the sim should reproduce exactly for a given seed
+function stateHash() {
+    const state = vm.runInThisContext(`JSON.stringify({
+        time: TimeMachine.currentTime,
+        gold: game.player.gold,
+        properties: game.player.ownedProperties.map(p => [p.id, p.condition, p.totalIncome]),
+        employees: game.player.ownedEmployees.map(e => [e.id, e.morale, e.level, e.wage]),
+        markets: Object.keys(GameWorld.locations).sort().map(id => {
+            const m = GameWorld.locations[id].marketPrices || {};
+            return [id, Object.keys(m).sort().map(k => [k, m[k] && m[k].price, m[k] && m[k].stock])];
+        }),
+        at: TravelSystem.playerPosition.currentLocation
+    })`);
+    return crypto.createHash('sha1').update(state).digest('hex');
+}
+
+// ═══════════════════════════════════════════════════════════════
+// the run
+// ═══════════════════════════════════════════════════════════════
+
+function run(opts) {
+    const clock = { epoch: Date.UTC(2025, 0, 1), now: 0 };
+    const flushTimers = installBrowserGlobals(opts, clock);
+
+    const loadTimings = [];
+    for (const rel of SCRIPTS) {
+        const file = path.join(ROOT, rel);
+        const source = fs.readFileSync(file, 'utf8');
+        const start = performance.now();
+        vm.runInThisContext(source, { filename: rel });
+        loadTimings.push({ file: rel, kb: +(source.length / 1024).toFixed(1), ms: +(performance.now() - start).toFixed(2) });
+    }
+
+    const setup = seedEmpire(opts);
+
+    // nothing defers at max speed - deferral depends on wall-clock budgets,
+    // which would make two runs of the same seed diverge
+    vm.runInThisContext(`
+        SimulationScheduler.frameBudgetMs = Infinity;
+        SimulationScheduler.resetTimings();
+    `);
+
+    // per-task allocation on top of the scheduler's own timings
+    const taskAlloc = new Map();
+    const scheduler = vm.runInThisContext('SimulationScheduler');
+    const runTask = scheduler._runTask;
+    scheduler._runTask = function (task, now, deferred) {
+        const heapBefore = heapUsed();
+        const result = runTask.call(this, task, now, deferred);
+        const bytes = heapUsed() - heapBefore;
+        if (bytes > 0) taskAlloc.set(task.id, (taskAlloc.get(task.id) || 0) + bytes);
+        return result;
+    };
+
+    const probes = new Map();
+    for (const spec of PROBES) wrapProbe(spec, probes);
+
+    // GCProfiler reports synchronously on stop() - a PerformanceObserver
+    // never gets its callback while the loop holds the event loop
+    const gcProfiler = new v8.GCProfiler();
+    gcProfiler.start();
+
+    const tick = vm.runInThisContext(`(function (step) {
+        TimeMachine.addMinutes(step);
+        TimeMachine.onTimeAdvance();
+    })`);
+    const travelTick = vm.runInThisContext(`(function (locations, pick) {
+        if (TravelSystem.playerPosition.isTraveling) return false;
+        const here = TravelSystem.playerPosition.currentLocation;
+        const options = locations.filter(id => id !== here);
+        TravelSystem.startTravel(options[Math.floor(pick * options.length)]);
+        return TravelSystem.playerPosition.isTraveling === true;
+    })`);
+    const pickRandom = vm.runInThisContext('(() => Math.random())');
+
+    const totalMinutes = Math.round(opts.years * MINUTES_PER_YEAR);
+    const frames = Math.ceil(totalMinutes / opts.step);
+    const frameStats = createStats();
+    const yearly = [];
+    const travelEveryMinutes = opts.travelEvery * 1440;
+    let nextTravel = travelEveryMinutes;
+    let nextYear = MINUTES_PER_YEAR;
+    let elapsed = 0;
+    let trips = 0;
+
+    const memStart = process.memoryUsage();
+    const wallStart = performance.now();
+
+    for (let frame = 0; frame < frames; frame++) {
+        const step = Math.min(opts.step, totalMinutes - elapsed);
+        elapsed += step;
+        // a VERY_FAST frame is ~1/60s of real time on the virtual clock
+        clock.now += 1000 / 60;
+
+        const heapBefore = heapUsed();
+        const start = performance.now();
+        tick(step);
+        flushTimers();
+        recordSample(frameStats, performance.now() - start, heapUsed() - heapBefore);
+
+        if (elapsed >= nextTravel) {
+            nextTravel += travelEveryMinutes;
+            if (travelTick(setup.locations, pickRandom())) trips++;
+        }
+
+        if (elapsed >= nextYear || frame === frames - 1) {
+            nextYear += MINUTES_PER_YEAR;
+            const mem = process.memoryUsage();
+            yearly.push({
+                gameYear: +(elapsed / MINUTES_PER_YEAR).toFixed(2),
+                wallMs: Math.round(performance.now() - wallStart),
+                heapUsedMB: +(mem.heapUsed / 1048576).toFixed(1),
+                rssMB: +(mem.rss / 1048576).toFixed(1),
+                ...economySnapshot()
+            });
+        }
+    }
+
+    const wallMs = performance.now() - wallStart;
+    const gc = summarizeGC(gcProfiler.stop());
+    const memEnd = process.memoryUsage();
+
+    const schedulerTimings = vm.runInThisContext('SimulationScheduler.getTimings()');
+    const systems = schedulerTimings.map(t => ({
+        system: t.system,
+        cadence: t.cadence,
+        calls: t.calls,
+        totalMs: t.totalMs,
+        avgMs: t.avgMs,
+        maxMs: t.maxMs,
+        overBudget: t.overBudget,
+        allocKB: +((taskAlloc.get(t.system) || 0) / 1024).toFixed(1),
+        gameMinutes: t.gameMinutes
+    }));
+
+    return {
+        meta: {
+            tool: 'headless_sim',
+            version: vm.runInThisContext(`typeof GameConfig !== 'undefined' ? GameConfig.version.game : null`),
+            node: process.version,
+            seed: opts.seed,
+            years: opts.years,
+            stepMinutes: opts.step,
+            properties: setup.properties,
+            employees: setup.employees,
+            travelEveryDays: opts.travelEvery,
+            locations: setup.locations.length
+        },
+        totals: {
+            frames,
+            gameMinutes: totalMinutes,
+            trips,
+            wallMs: Math.round(wallMs),
+            gameDaysPerSecond: +((totalMinutes / 1440) / (wallMs / 1000)).toFixed(1),
+            frame: summarize('frame', frameStats)
+        },
+        systems,
+        probes: [...probes.entries()].map(([name, stats]) => summarize(name, stats)),
+        memory: {
+            heapStartMB: +(memStart.heapUsed / 1048576).toFixed(1),
+            heapEndMB: +(memEnd.heapUsed / 1048576).toFixed(1),
+            rssEndMB: +(memEnd.rss / 1048576).toFixed(1),
+            gc
+        },
+        yearly,
+        scriptLoad: loadTimings,
+        stateHash: stateHash()
+    };
+}
+
+function main() {
+    const opts = parseArgs(process.argv.slice(2));
+    const report = run(opts);
+    const json = JSON.stringify(report, null, 2);
+
+    if (opts.out) {
+        fs.writeFileSync(opts.out, json + '\n');
+        const t = report.totals;
+        hostConsole.log(`🏰 ${opts.years} game-year(s), seed ${opts.seed}: ${t.frames} frames in ${t.wallMs}ms (${t.gameDaysPerSecond} game days/s)`);
+        hostConsole.log(`🏰 frame avg ${t.frame.avgMs}ms p95 ${t.frame.p95Ms}ms max ${t.frame.maxMs}ms - state ${report.stateHash.slice(0, 12)}`);
+        hostConsole.log(`🏰 report written to ${opts.out}`);
+    } else {
+        process.stdout.write(json + '\n');
+    }
+}
+
+if (require.main === module) {
+    main();
+}
+
+module.exports = { run, parseArgs };
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════
+# MOCK OLLAMA SERVER - a fake llama for testing the real pipeline
+# ═══════════════════════════════════════════════════════════════
+# Version: 0.92.00 | Unity AI Lab
+# Creators: Hackall360, Sponge, GFourteen
+# www.unityailab.com | github.com/Unity-Lab-AI/Medieval-Trading-Game
+# unityailabcontact@gmail.com
+# ═══════════════════════════════════════════════════════════════
+#
+# Mimics the two endpoints the game uses: GET /api/tags and
+# POST /api/generate (streamed NDJSON or a single JSON reply).
+# Latency is configurable so time-to-first-token is measurable.
+#
+#   python3 tools/mock_ollama_server.py --port 11435 --ttft-ms 400 --token-ms 40
+#
+# then in the debooger console:  benchmarkllm http://localhost:11435
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MODEL_NAME = 'mock-llama:latest'
+
+REPLIES = [
+    "Welcome, traveler! Fine wares today, and fair prices for those with coin.",
+    "Ah, another face on the road. Buying or just warming your hands?",
+    "Mind the bandits on the eastern road. Now, what can I do for you?",
+    "Business is slow since the frost came. Perhaps you'll change that?",
+    "You have the look of a trader. Let's see if your purse agrees.",
+]
+
+stats = {'tags': 0, 'generate': 0, 'active': 0, 'peak_active': 0}
+stats_lock = threading.Lock()
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def reply_for(prompt):
+    # same prompt -> same reply, so caching and dedupe are easy to eyeball
+    digest = int(hashlib.sha1(prompt.encode('utf-8')).hexdigest(), 16)
+    return REPLIES[digest % len(REPLIES)]
+
+
+class MockOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    ttft = 0.4
+    token_delay = 0.04
+
+    def log_message(self, fmt, *args):
+        print(f'🦙 {self.address_string()} {fmt % args}')
+
+    def _cors(self):
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self._cors()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors()
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/api/tags':
+            with stats_lock:
+                stats['tags'] += 1
+            self._send_json({'models': [{
+                'name': MODEL_NAME,
+                'model': MODEL_NAME,
+                'modified_at': now_iso(),
+                'size': 0,
+                'details': {'family': 'mock', 'parameter_size': '0B'}
+            }]})
+        elif self.path.rstrip('/') == '/stats':
+            with stats_lock:
+                self._send_json(dict(stats))
+        else:
+            self._send_json({'error': 'not found'}, 404)
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/api/generate':
+            self._send_json({'error': 'not found'}, 404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self._send_json({'error': 'invalid json'}, 400)
+            return
+
+        with stats_lock:
+            stats['generate'] += 1
+            stats['active'] += 1
+            stats['peak_active'] = max(stats['peak_active'], stats['active'])
+
+        try:
+            model = request.get('model', MODEL_NAME)
+            text = reply_for(request.get('prompt', ''))
+            started = time.time()
+            time.sleep(self.ttft)
+
+            # ollama streams unless told otherwise
+            if request.get('stream', True) is False:
+                time.sleep(self.token_delay * len(text.split()))
+                self._send_json({
+                    'model': model,
+                    'created_at': now_iso(),
+                    'response': text,
+                    'done': True,
+                    'total_duration': int((time.time() - started) * 1e9)
+                })
+                return
+
+            self.send_response(200)
+            self._cors()
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+
+            def write_line(payload):
+                data = (json.dumps(payload) + '\n').encode('utf-8')
+                self.wfile.write(f'{len(data):X}\r\n'.encode('ascii') + data + b'\r\n')
+                self.wfile.flush()
+
+            words = text.split(' ')
+            for i, word in enumerate(words):
+                write_line({
+                    'model': model,
+                    'created_at': now_iso(),
+                    'response': word if i == 0 else ' ' + word,
+                    'done': False
+                })
+                time.sleep(self.token_delay)
+            write_line({
+                'model': model,
+                'created_at': now_iso(),
+                'response': '',
+                'done': True,
+                'total_duration': int((time.time() - started) * 1e9)
+            })
+            self.wfile.write(b'0\r\n\r\n')
+        finally:
+            with stats_lock:
+                stats['active'] -= 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stand-in for Ollama /api/tags and /api/generate')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--ttft-ms', type=int, default=400, help='delay before the first token')
+    parser.add_argument('--token-ms', type=int, default=40, help='delay between tokens')
+    args = parser.parse_args()
+
+    MockOllamaHandler.ttft = args.ttft_ms / 1000
+    MockOllamaHandler.token_delay = args.token_ms / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), MockOllamaHandler)
+    print(f'🦙 Mock Ollama listening on http://localhost:{args.port} (ttft {args.ttft_ms}ms, {args.token_ms}ms/token)')
+    print('🦙 GET /stats shows request counts and peak concurrency')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()